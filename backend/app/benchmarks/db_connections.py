@@ -0,0 +1,93 @@
+"""
+Request latency of ``GET /api/jobs/<id>/`` with a fresh connection per
+request, a persistent connection (``CONN_MAX_AGE``) and a psycopg pool.
+
+Requests go through Django's ``WSGIHandler`` directly, so connections are
+opened and released by the ``request_started`` / ``request_finished``
+handlers as they are under gunicorn. Needs a reachable ``DATABASE_URL``; a
+temporary job is created and deleted. Run from ``backend/app``::
+
+    python -m benchmarks.db_connections --requests 500
+"""
+
+import argparse
+import json
+import os
+import statistics
+import time
+from wsgiref.util import setup_testing_defaults
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.core.handlers.wsgi import WSGIHandler  # noqa: E402
+from django.db import connection  # noqa: E402
+
+from jobs.services import create_job, delete_job  # noqa: E402
+
+MODES = {
+    "new_connection": {"CONN_MAX_AGE": 0, "pool": None},
+    "persistent": {"CONN_MAX_AGE": 60, "pool": None},
+    "pool": {"CONN_MAX_AGE": 0, "pool": {"min_size": 1, "max_size": 4}},
+}
+
+
+def configure(conn_max_age: int, pool: dict | None) -> None:
+    connection.close()
+    connection.close_pool()
+    connection.settings_dict["CONN_MAX_AGE"] = conn_max_age
+    connection.settings_dict["OPTIONS"].pop("pool", None)
+    if pool is not None:
+        connection.settings_dict["OPTIONS"]["pool"] = pool
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    return round(statistics.quantiles(samples, n=100)[pct - 1], 3)
+
+
+def run(app: WSGIHandler, path: str, requests: int) -> dict[str, float]:
+    def start_response(status, headers):
+        if not status.startswith("200"):
+            raise SystemExit(f"{path} returned {status}")
+
+    samples = []
+    for _ in range(requests):
+        environ = {"PATH_INFO": path, "HTTP_ACCEPT": "application/json"}
+        setup_testing_defaults(environ)
+        started = time.perf_counter()
+        response = app(environ, start_response)
+        b"".join(response)
+        response.close()  # fires request_finished, as the WSGI server would
+        samples.append((time.perf_counter() - started) * 1000)
+    return {
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "p99_ms": percentile(samples, 99),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    job = create_job(name=f"bench-connections-{time.time_ns()}")
+    app = WSGIHandler()
+    path = f"/api/jobs/{job.pk}/"
+    results = {}
+    try:
+        for name, mode in MODES.items():
+            configure(mode["CONN_MAX_AGE"], mode["pool"])
+            run(app, path, 20)  # warm up; also opens the pool
+            results[name] = run(app, path, args.requests)
+    finally:
+        configure(0, None)
+        delete_job(job=job)
+
+    print(json.dumps({"requests": args.requests, "path": "/api/jobs/<id>/", "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Status report throughput of per-report ``PATCH /api/jobs/<id>/`` against
+buffered ``POST /api/jobs/statuses/ingest/``, one report per request.
+
+Requests go through Django's ``WSGIHandler`` directly. For the buffered
+path the reported latency is the time to acknowledge; ``total_seconds``
+also covers draining the buffer, so both figures measure reports persisted.
+Needs a reachable ``DATABASE_URL``; temporary jobs are created and deleted.
+Run from ``backend/app``::
+
+    python -m benchmarks.ingest --reports 2000 --jobs 50
+"""
+
+import argparse
+import io
+import json
+import os
+import statistics
+import time
+from itertools import cycle
+from wsgiref.util import setup_testing_defaults
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.handlers.wsgi import WSGIHandler  # noqa: E402
+
+from jobs import ingest  # noqa: E402
+from jobs.models import Job  # noqa: E402
+from jobs.services import bulk_create_jobs, rebuild_job_status_counts  # noqa: E402
+
+STATUSES = ["RUNNING", "COMPLETED", "FAILED", "PENDING"]
+
+
+def percentile(samples: list[float], pct: int) -> float:
+    return round(statistics.quantiles(samples, n=100)[pct - 1], 3)
+
+
+def send(app: WSGIHandler, method: str, path: str, payload) -> None:
+    body = json.dumps(payload).encode()
+
+    def start_response(status, headers):
+        if not status.startswith(("200", "202")):
+            raise SystemExit(f"{method} {path} returned {status}")
+
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "HTTP_ACCEPT": "application/json",
+        "wsgi.input": io.BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+    response = app(environ, start_response)
+    b"".join(response)
+    response.close()
+
+
+def run(app: WSGIHandler, mode: str, job_ids: list[int], reports: int) -> dict[str, float]:
+    samples = []
+    statuses = cycle(STATUSES)
+    started = time.perf_counter()
+    for _, job_id in zip(range(reports), cycle(job_ids)):
+        status_type = next(statuses)
+        request_started = time.perf_counter()
+        if mode == "patch":
+            send(app, "PATCH", f"/api/jobs/{job_id}/", {"status_type": status_type})
+        else:
+            send(app, "POST", "/api/jobs/statuses/ingest/", [{"id": job_id, "status_type": status_type}])
+        samples.append((time.perf_counter() - request_started) * 1000)
+    if mode == "ingest":
+        ingest.get_buffer().close(timeout=60)
+    total = time.perf_counter() - started
+    return {
+        "p50_ms": percentile(samples, 50),
+        "p95_ms": percentile(samples, 95),
+        "p99_ms": percentile(samples, 99),
+        "total_seconds": round(total, 3),
+        "reports_per_second": round(reports / total, 1),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reports", type=int, default=2000)
+    parser.add_argument("--jobs", type=int, default=50)
+    args = parser.parse_args()
+
+    settings.JOBS_INGEST_ENABLED = True
+    prefix = f"bench-ingest-{time.time_ns()}"
+    jobs, _ = bulk_create_jobs(names=[f"{prefix}-{i}" for i in range(args.jobs)])
+    job_ids = [job.pk for job in jobs]
+    app = WSGIHandler()
+    results = {}
+    try:
+        for mode in ("patch", "ingest"):
+            results[mode] = run(app, mode, job_ids, args.reports)
+    finally:
+        Job.objects.filter(pk__in=job_ids).delete()
+        rebuild_job_status_counts()
+
+    print(
+        json.dumps(
+            {
+                "reports": args.reports,
+                "jobs": args.jobs,
+                "batch_size": settings.JOBS_INGEST_BATCH_SIZE,
+                "flush_seconds": settings.JOBS_INGEST_FLUSH_SECONDS,
+                "results": results,
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+CPU cost of DRF's stdlib ``JSONRenderer`` / ``JSONParser`` versus the
+orjson-backed pair in ``jobs.fastjson``.
+
+Renders a ``GET /api/jobs/`` page (already-serialized rows, as the view hands
+them to the renderer) and a page of raw ``datetime`` values, and parses a
+maximal ``POST /api/jobs/bulk/`` body. Run from ``backend/app``::
+
+    python -m benchmarks.json_codec --rows 100 --repeat 500
+"""
+
+import argparse
+import io
+import json
+import os
+import timeit
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from rest_framework.parsers import JSONParser  # noqa: E402
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from benchmarks.list_serialization import make_rows  # noqa: E402
+from jobs.fastjson import ORJSONParser, ORJSONRenderer  # noqa: E402
+from jobs.serializers import (  # noqa: E402
+    JOB_LIST_FIELDS,
+    JobBulkStatusUpdateItemSerializer,
+    serialize_job_list_rows,
+)
+
+
+def time_per_call(func, repeat: int) -> float:
+    best = min(timeit.repeat(func, number=repeat, repeat=5))
+    return round(best / repeat * 1e6, 1)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=500)
+    args = parser.parse_args()
+
+    rows = [dict(zip(JOB_LIST_FIELDS, row)) for row in make_rows(args.rows)]
+    payloads = {
+        "render_list_page": {
+            "count": args.rows,
+            "next": None,
+            "previous": None,
+            "results": serialize_job_list_rows(rows),
+        },
+        "render_raw_datetimes": rows,
+    }
+    bulk_body = json.dumps(
+        [
+            {"id": i, "status_type": "RUNNING"}
+            for i in range(1, JobBulkStatusUpdateItemSerializer.MAX_JOBS + 1)
+        ]
+    ).encode()
+
+    results = {}
+    for name, data in payloads.items():
+        expected = JSONRenderer().render(data)
+        if ORJSONRenderer().render(data) != expected:
+            raise SystemExit(f"{name}: ORJSONRenderer output differs from JSONRenderer")
+        results[name] = {
+            "stdlib_us": time_per_call(lambda: JSONRenderer().render(data), args.repeat),
+            "orjson_us": time_per_call(lambda: ORJSONRenderer().render(data), args.repeat),
+        }
+
+    if ORJSONParser().parse(io.BytesIO(bulk_body)) != JSONParser().parse(io.BytesIO(bulk_body)):
+        raise SystemExit("ORJSONParser result differs from JSONParser")
+    parse_repeat = max(args.repeat // 10, 1)
+    results["parse_bulk_body"] = {
+        "stdlib_us": time_per_call(lambda: JSONParser().parse(io.BytesIO(bulk_body)), parse_repeat),
+        "orjson_us": time_per_call(lambda: ORJSONParser().parse(io.BytesIO(bulk_body)), parse_repeat),
+    }
+
+    for result in results.values():
+        result["speedup"] = round(result["stdlib_us"] / result["orjson_us"], 2)
+    print(json.dumps({"rows_per_page": args.rows, "results": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
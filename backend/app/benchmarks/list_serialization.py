@@ -0,0 +1,95 @@
+"""
+CPU cost of rendering one ``GET /api/jobs/`` page: ``JobListSerializer`` over
+hydrated ``Job`` instances versus ``serialize_job_list_rows`` over
+``.values()`` dicts.
+
+No database is needed; rows are synthesized and hydrated the way the ORM
+would do it. Run from ``backend/app``::
+
+    python -m benchmarks.list_serialization --rows 100 --repeat 200
+"""
+
+import argparse
+import json
+import os
+import timeit
+from datetime import datetime, timedelta, timezone
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from rest_framework.renderers import JSONRenderer  # noqa: E402
+
+from jobs.models import Job  # noqa: E402
+from jobs.serializers import (  # noqa: E402
+    JOB_LIST_FIELDS,
+    JobListSerializer,
+    serialize_job_list_rows,
+)
+
+
+def make_rows(count: int) -> list[tuple]:
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    statuses = ["PENDING", "RUNNING", "COMPLETED", "FAILED"]
+    return [
+        (
+            i,
+            f"job-{i:07d}",
+            statuses[i % 4],
+            start + timedelta(seconds=i, microseconds=i),
+            start + timedelta(seconds=i),
+            start + timedelta(seconds=i, microseconds=2 * i),
+        )
+        for i in range(1, count + 1)
+    ]
+
+
+# The list fields are all of Job's columns, so from_db() expects them in
+# model definition order.
+MODEL_FIELDS = [field.attname for field in Job._meta.concrete_fields]
+MODEL_ORDER = [JOB_LIST_FIELDS.index(name) for name in MODEL_FIELDS]
+
+
+def model_path(rows: list[tuple]) -> bytes:
+    jobs = [
+        Job.from_db("default", MODEL_FIELDS, [row[i] for i in MODEL_ORDER]) for row in rows
+    ]
+    return JSONRenderer().render(JobListSerializer(jobs, many=True).data)
+
+
+def fast_path(rows: list[tuple]) -> bytes:
+    dicts = [dict(zip(JOB_LIST_FIELDS, row)) for row in rows]
+    return JSONRenderer().render(serialize_job_list_rows(dicts))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rows = make_rows(args.rows)
+    if model_path(rows) != fast_path(rows):
+        raise SystemExit("Fast path output differs from JobListSerializer")
+
+    results = {}
+    for name, func in (("model_serializer", model_path), ("values_fast_path", fast_path)):
+        best = min(timeit.repeat(lambda: func(rows), number=args.repeat, repeat=5))
+        results[name] = round(best / args.repeat * 1e6, 1)
+
+    print(
+        json.dumps(
+            {
+                "rows_per_page": args.rows,
+                "us_per_page": results,
+                "speedup": round(results["model_serializer"] / results["values_fast_path"], 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
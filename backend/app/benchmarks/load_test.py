@@ -0,0 +1,96 @@
+"""
+Concurrency load test for a running API server, to compare the WSGI
+(gunicorn sync workers) and ASGI (``config.asgi``) deployments.
+
+Each virtual user loops on ``GET <path>`` over a fresh connection; the
+concurrency is stepped up and throughput, latency percentiles and errors are
+reported per step. Start one server at a time, e.g.::
+
+    gunicorn config.wsgi:application --workers 2 --bind 127.0.0.1:8000
+    DB_POOL_ENABLED=1 DB_POOL_MAX_SIZE=16 \\
+        gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker \\
+        --workers 2 --bind 127.0.0.1:8000
+
+and run from ``backend/app``::
+
+    python -m benchmarks.load_test --url http://127.0.0.1:8000/api/jobs/?limit=20
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from urllib.parse import urlsplit
+
+
+async def fetch(host: str, port: int, target: str, timeout: float) -> int:
+    reader, writer = await asyncio.wait_for(asyncio.open_connection(host, port), timeout)
+    try:
+        writer.write(
+            f"GET {target} HTTP/1.1\r\nHost: {host}:{port}\r\n"
+            "Accept: application/json\r\nConnection: close\r\n\r\n".encode()
+        )
+        await writer.drain()
+        response = await asyncio.wait_for(reader.read(), timeout)
+        return int(response.split(b" ", 2)[1])
+    finally:
+        writer.close()
+
+
+async def run_step(url: str, concurrency: int, duration: float, timeout: float) -> dict:
+    parts = urlsplit(url)
+    target = parts.path + (f"?{parts.query}" if parts.query else "")
+    deadline = time.perf_counter() + duration
+    latencies: list[float] = []
+    errors = 0
+
+    async def user() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                status = await fetch(parts.hostname, parts.port or 80, target, timeout)
+            except (OSError, asyncio.TimeoutError, IndexError, ValueError):
+                errors += 1
+                continue
+            if status != 200:
+                errors += 1
+                continue
+            latencies.append((time.perf_counter() - started) * 1000)
+
+    await asyncio.gather(*(user() for _ in range(concurrency)))
+    result = {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / duration, 1),
+    }
+    if len(latencies) >= 2:
+        cuts = statistics.quantiles(latencies, n=100)
+        result.update(
+            p50_ms=round(cuts[49], 1),
+            p95_ms=round(cuts[94], 1),
+            p99_ms=round(cuts[98], 1),
+        )
+    return result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--url", default="http://127.0.0.1:8000/api/jobs/")
+    parser.add_argument("--concurrency", default="1,8,32,128")
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds per step")
+    parser.add_argument("--timeout", type=float, default=10.0)
+    args = parser.parse_args()
+
+    steps = [int(value) for value in args.concurrency.split(",")]
+    results = [
+        asyncio.run(run_step(args.url, concurrency, args.duration, args.timeout))
+        for concurrency in steps
+    ]
+    print(json.dumps({"url": args.url, "steps": results}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
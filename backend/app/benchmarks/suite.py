@@ -0,0 +1,312 @@
+"""
+End-to-end benchmark of the jobs API against a disposable, seeded database.
+
+A throwaway database (Django's test database, ``test_<NAME>``) is created
+from ``DATABASE_URL``'s server, migrated and seeded by ``jobs.seeding`` (as
+``manage.py seed_jobs``) with ``--jobs`` jobs averaging ``--history``
+statuses each. Each scenario (every list sort and filter, ``retrieve``,
+``statuses``, both with ``include=statuses``, ``create`` and
+``partial_update``) is then driven through Django's ``WSGIHandler`` by
+``--concurrency`` threads, each with its own database connection, and
+reported as JSON: p50/p95/p99 latency, throughput, errors and queries per
+request.
+
+Threads share the GIL, so absolute throughput is below that of gunicorn with
+several workers (``benchmarks.load_test`` measures a running server);
+compare runs made on the same machine. Run without read replicas, from
+``backend/app``::
+
+    python -m benchmarks.suite --jobs 100000 --history 5 --concurrency 1,8 \\
+        --output after.json --compare before.json
+
+``--keepdb`` keeps the database, and its data, for the next run, which only
+seeds an empty database; large seeds are worth keeping.
+"""
+
+import argparse
+import io
+import json
+import os
+import random
+import statistics
+import threading
+import time
+from datetime import timedelta
+from typing import Callable, Optional
+from urllib.parse import urlencode
+from wsgiref.util import setup_testing_defaults
+
+import django
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.core.handlers.wsgi import WSGIHandler  # noqa: E402
+from django.db import connection, connections  # noqa: E402
+from django.db.models import Max, Min  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from jobs.enums import JobStatusType  # noqa: E402
+from jobs.models import Job, JobStatus  # noqa: E402
+from jobs.selectors import ALLOWED_SORTS  # noqa: E402
+from jobs.seeding import seed_jobs  # noqa: E402
+
+SEED_DAYS = 30
+STATUSES = [choice.value for choice in JobStatusType]
+
+Request = tuple[str, str, Optional[dict]]
+
+
+def build_scenarios(run_id: str) -> dict[str, Callable[[random.Random], Request]]:
+    bounds = Job.objects.aggregate(low=Min("pk"), high=Max("pk"), newest=Max("created_at"))
+    low, high = bounds["low"], bounds["high"]
+    newest = bounds["newest"]
+    counter = iter(range(1, 1 << 62))
+    counter_lock = threading.Lock()
+
+    def job_id(rng: random.Random) -> int:
+        return rng.randint(low, high)
+
+    def unique_name() -> str:
+        with counter_lock:
+            return f"bench-create-{run_id}-{next(counter)}"
+
+    def window(rng: random.Random) -> str:
+        start = newest - timedelta(days=SEED_DAYS) * rng.random()
+        end = start + timedelta(days=1)
+        return urlencode({"created_after": start.isoformat(), "created_before": end.isoformat()})
+
+    scenarios: dict[str, Callable[[random.Random], Request]] = {
+        "list": lambda rng: ("GET", "/api/jobs/", None),
+    }
+    for sort in ALLOWED_SORTS:
+        scenarios[f"list_sort_{sort}"] = lambda rng, sort=sort: ("GET", f"/api/jobs/?sort={sort}", None)
+    scenarios.update(
+        {
+            "list_status": lambda rng: ("GET", f"/api/jobs/?status={rng.choice(STATUSES)}", None),
+            "list_status_active": lambda rng: ("GET", "/api/jobs/?status=PENDING,RUNNING", None),
+            "list_search_contains": lambda rng: ("GET", f"/api/jobs/?q={rng.randint(100, 999)}", None),
+            "list_search_prefix": lambda rng: (
+                "GET",
+                f"/api/jobs/?q=bench-job-{rng.randint(10, 99)}&match=prefix",
+                None,
+            ),
+            "list_created_window": lambda rng: ("GET", f"/api/jobs/?{window(rng)}", None),
+            "list_updated_since": lambda rng: (
+                "GET",
+                "/api/jobs/?" + urlencode({"updated_since": (newest - timedelta(days=1)).isoformat()}),
+                None,
+            ),
+            "list_deep_offset": lambda rng: ("GET", "/api/jobs/?offset=5000", None),
+            "list_include_statuses": lambda rng: ("GET", "/api/jobs/?limit=100&include=statuses", None),
+            "retrieve": lambda rng: ("GET", f"/api/jobs/{job_id(rng)}/", None),
+            "retrieve_include_statuses": lambda rng: (
+                "GET",
+                f"/api/jobs/{job_id(rng)}/?include=statuses&statuses_limit=20",
+                None,
+            ),
+            "statuses": lambda rng: ("GET", f"/api/jobs/{job_id(rng)}/statuses/", None),
+            # Writes last, so they do not change the data the reads see.
+            "create": lambda rng: ("POST", "/api/jobs/", {"name": unique_name()}),
+            "partial_update": lambda rng: (
+                "PATCH",
+                f"/api/jobs/{job_id(rng)}/",
+                {"status_type": rng.choice(STATUSES)},
+            ),
+        }
+    )
+    return scenarios
+
+
+def call(app: WSGIHandler, method: str, path: str, payload: Optional[dict]) -> int:
+    body = json.dumps(payload).encode() if payload is not None else b""
+    path, _, query = path.partition("?")
+    environ = {
+        "REQUEST_METHOD": method,
+        "PATH_INFO": path,
+        "QUERY_STRING": query,
+        "CONTENT_TYPE": "application/json",
+        "CONTENT_LENGTH": str(len(body)),
+        "HTTP_ACCEPT": "application/json",
+        "wsgi.input": io.BytesIO(body),
+    }
+    setup_testing_defaults(environ)
+    result = {}
+
+    def start_response(status, headers):
+        result["status"] = int(status.split(" ", 1)[0])
+
+    response = app(environ, start_response)
+    b"".join(response)
+    response.close()  # fires request_finished, as the WSGI server would
+    return result["status"]
+
+
+def percentile(samples: list[float], pct: int) -> Optional[float]:
+    if len(samples) < 2:
+        return None
+    return round(statistics.quantiles(samples, n=100)[pct - 1], 3)
+
+
+def run_scenario(
+    app: WSGIHandler,
+    make_request: Callable[[random.Random], Request],
+    concurrency: int,
+    requests: int,
+    seed_value: int,
+) -> dict:
+    latencies: list[float] = []
+    query_counts: list[int] = []
+    errors = 0
+    lock = threading.Lock()
+
+    def worker(index: int, count: int) -> None:
+        nonlocal errors
+        rng = random.Random(seed_value * 1000 + index)
+        queries = 0
+
+        def count_queries(execute, sql, params, many, context):
+            nonlocal queries
+            queries += 1
+            return execute(sql, params, many, context)
+
+        try:
+            with connection.execute_wrapper(count_queries):
+                for _ in range(count):
+                    method, path, payload = make_request(rng)
+                    queries = 0
+                    started = time.perf_counter()
+                    status = call(app, method, path, payload)
+                    elapsed = (time.perf_counter() - started) * 1000
+                    with lock:
+                        if status >= 400:
+                            errors += 1
+                        else:
+                            latencies.append(elapsed)
+                            query_counts.append(queries)
+        finally:
+            connections.close_all()
+
+    shares = [requests // concurrency + (i < requests % concurrency) for i in range(concurrency)]
+    threads = [threading.Thread(target=worker, args=(i, share)) for i, share in enumerate(shares)]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    duration = time.perf_counter() - started
+
+    return {
+        "concurrency": concurrency,
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": round(len(latencies) / duration, 1),
+        "p50_ms": percentile(latencies, 50),
+        "p95_ms": percentile(latencies, 95),
+        "p99_ms": percentile(latencies, 99),
+        "queries_per_request": round(statistics.fmean(query_counts), 2) if query_counts else None,
+    }
+
+
+def compare(results: list[dict], baseline_path: str) -> list[dict]:
+    """p95 and throughput of this run relative to a previous ``--output``."""
+    with open(baseline_path) as baseline_file:
+        baseline = {
+            (row["scenario"], row["concurrency"]): row for row in json.load(baseline_file)["results"]
+        }
+    changes = []
+    for row in results:
+        before = baseline.get((row["scenario"], row["concurrency"]))
+        if not before or not before["p95_ms"] or not row["p95_ms"] or not before["rps"]:
+            continue
+        changes.append(
+            {
+                "scenario": row["scenario"],
+                "concurrency": row["concurrency"],
+                "p95_ratio": round(row["p95_ms"] / before["p95_ms"], 3),
+                "rps_ratio": round(row["rps"] / before["rps"], 3),
+                "queries_delta": round(row["queries_per_request"] - before["queries_per_request"], 2),
+            }
+        )
+    return changes
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--jobs", type=int, default=10_000)
+    parser.add_argument("--history", type=float, default=5, help="mean statuses per job")
+    parser.add_argument("--concurrency", default="1,8", help="comma-separated thread counts")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario and step")
+    parser.add_argument("--scenarios", help="comma-separated subset (default: all)")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for request parameters")
+    parser.add_argument("--keepdb", action="store_true", help="keep the seeded database for later runs")
+    parser.add_argument("--output", help="also write the results to this file")
+    parser.add_argument("--compare", help="a previous --output to report ratios against")
+    args = parser.parse_args()
+    if args.history < 1:
+        parser.error("--history must be at least 1")
+
+    creation = connection.creation
+    old_name = connection.settings_dict["NAME"]
+    creation.create_test_db(verbosity=0, autoclobber=True, keepdb=args.keepdb)
+    try:
+        if not Job.objects.exists():
+            started = time.perf_counter()
+            seed_jobs(
+                count=args.jobs,
+                history_mean=args.history,
+                days=SEED_DAYS,
+                prefix="bench-job",
+                random_seed=args.seed,
+                defer_indexes=True,
+            )
+            seed_seconds = round(time.perf_counter() - started, 1)
+        else:
+            seed_seconds = None
+
+        scenarios = build_scenarios(str(time.time_ns()))
+        if args.scenarios:
+            unknown = set(args.scenarios.split(",")) - set(scenarios)
+            if unknown:
+                parser.error(f"unknown scenarios: {', '.join(sorted(unknown))}")
+            scenarios = {name: scenarios[name] for name in args.scenarios.split(",")}
+        steps = [int(value) for value in args.concurrency.split(",")]
+
+        meta = {
+            "jobs": Job.objects.count(),
+            "statuses": JobStatus.objects.count(),
+            "seed_seconds": seed_seconds,
+            "requests": args.requests,
+            "started_at": timezone.now().isoformat(),
+            "postgres": connection.pg_version,
+            "settings": {
+                name: getattr(settings, name)
+                for name in ("DB_POOL_ENABLED", "JOBS_FAST_JSON", "JOBS_LIST_CACHE_ENABLED", "DEBUG")
+            },
+        }
+        connections.close_all()
+
+        app = WSGIHandler()
+        results = []
+        for index, (name, make_request) in enumerate(scenarios.items()):
+            run_scenario(app, make_request, 1, min(10, args.requests), args.seed)  # warm up
+            for concurrency in steps:
+                row = run_scenario(app, make_request, concurrency, args.requests, args.seed + index)
+                results.append({"scenario": name, **row})
+    finally:
+        connections.close_all()
+        creation.destroy_test_db(old_name, verbosity=0, keepdb=args.keepdb)
+
+    report = {"meta": meta, "results": results}
+    if args.compare:
+        report["compare"] = compare(results, args.compare)
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output_file:
+            output_file.write(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,11 @@
+import os
+
+from django.contrib.staticfiles.handlers import ASGIStaticFilesHandler
+from django.core.asgi import get_asgi_application
+
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+# Routes the read endpoints to jobs.async_views and drops the sync-only
+# WhiteNoise middleware (see config.settings).
+os.environ.setdefault("JOBS_ASGI", "1")
+
+application = ASGIStaticFilesHandler(get_asgi_application())
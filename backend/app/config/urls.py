@@ -1,3 +1,4 @@
+from django.conf import settings
 from django.contrib import admin
 from django.urls import include, path
 
@@ -8,3 +9,8 @@ urlpatterns = [
     path("api/", include("jobs.urls")),
     path("health/", health),
 ]
+
+if settings.JOBS_METRICS_ENABLED:
+    from jobs.metrics import metrics_view
+
+    urlpatterns.append(path("metrics", metrics_view, name="metrics"))
@@ -0,0 +1,28 @@
+"""
+gunicorn settings, read automatically when gunicorn starts in this directory.
+
+Command-line options (``--workers``, ``--bind``) still apply; this file only
+adds the server hooks that Prometheus' multiprocess mode needs when
+``PROMETHEUS_MULTIPROC_DIR`` is set (see ``jobs.metrics``).
+"""
+
+import os
+from pathlib import Path
+
+
+def on_starting(server):
+    # Values left by a previous server would be added to this one's.
+    directory = os.environ.get("PROMETHEUS_MULTIPROC_DIR")
+    if directory:
+        path = Path(directory)
+        path.mkdir(parents=True, exist_ok=True)
+        for stale in path.glob("*.db"):
+            stale.unlink()
+
+
+def child_exit(server, worker):
+    # Drops the exited worker's live gauges; its counters are kept.
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        from prometheus_client import multiprocess
+
+        multiprocess.mark_process_dead(worker.pid)
@@ -1,5 +1,27 @@
 from django.apps import AppConfig
+from django.conf import settings
+from django.db.backends.signals import connection_created
+
 
 class JobsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "jobs"
+
+    def ready(self) -> None:
+        if settings.JOBS_REQUEST_METRICS_ENABLED or settings.JOBS_METRICS_ENABLED:
+            from jobs.instrumentation import install_query_recorder
+
+            connection_created.connect(install_query_recorder, dispatch_uid="jobs_query_recorder")
+        if settings.JOBS_SLOW_QUERY_ENABLED:
+            from jobs.slow_queries import install_slow_query_recorder
+
+            connection_created.connect(install_slow_query_recorder, dispatch_uid="jobs_slow_query_recorder")
+        if settings.JOBS_METRICS_ENABLED:
+            from jobs import metrics
+            from jobs.models import Job
+            from jobs.signals import job_events_committed
+
+            connection_created.connect(metrics.count_connection, dispatch_uid="jobs_connection_counter")
+            job_events_committed.connect(
+                metrics.count_job_events, sender=Job, dispatch_uid="jobs_event_counter"
+            )
@@ -0,0 +1,263 @@
+"""
+Async read views for ASGI deployments (``config.asgi`` sets ``JOBS_ASGI``).
+
+DRF views are synchronous, so under ASGI each request would be handed to a
+thread for its whole duration. These views serve the dashboard's read paths
+(list, retrieve and status history) on Django's async ORM, with the same
+caching, validators, pagination and payloads as ``JobViewSet``; the thread
+is then held only while a query runs. Requests still go through DRF's
+authentication, permission, throttling and content negotiation steps. Other
+methods on the same URLs fall through to the ``JobViewSet`` view.
+
+The export is streamed from an async iterator. Django would read a sync
+iterator to the end before sending anything under ASGI. The event stream
+(``jobs.events``) is only served here: it has no ``JobViewSet`` route.
+"""
+
+from typing import Any, AsyncIterator, Callable, Iterator, Optional, Union
+
+from asgiref.sync import sync_to_async
+from django.http import HttpRequest, HttpResponse, StreamingHttpResponse
+from django.views.decorators.csrf import csrf_exempt
+from rest_framework import exceptions, status
+from rest_framework.decorators import action
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from jobs import caching
+from jobs.events import stream_job_events
+from jobs.models import Job
+from jobs.renderers import ServerSentEventRenderer
+from jobs.selectors import (
+    aget_job_by_id,
+    get_job_status_history,
+    get_jobs_list,
+    get_latest_statuses_by_job,
+    validate_status_filter,
+)
+from jobs.serializers import (
+    JOB_LIST_FIELDS,
+    JobDetailSerializer,
+    JobStatusSerializer,
+    serialize_job_list_rows,
+)
+from jobs.views import JobViewSet
+
+READ_METHODS = ("GET", "HEAD")
+
+_DONE = object()
+
+
+async def _aiterate(iterator: Iterator[Any]) -> AsyncIterator[Any]:
+    """Step ``iterator`` on the request's thread, one chunk at a time."""
+    step = sync_to_async(next)
+    try:
+        while (chunk := await step(iterator, _DONE)) is not _DONE:
+            yield chunk
+    finally:
+        close = getattr(iterator, "close", None)
+        if close is not None:
+            await sync_to_async(close)()
+
+
+class AsyncJobReadViews(JobViewSet):
+    @classmethod
+    def as_async_view(cls, action: str, fallback: Optional[Callable[..., HttpResponse]] = None) -> Callable:
+        """
+        Serve GET/HEAD with the ``a<action>`` coroutine and anything else
+        with ``fallback``, or a 405 without one. Options given to
+        ``@action`` (renderers, permissions) apply as they do on the
+        router's view.
+        """
+        initkwargs = getattr(getattr(cls, action), "kwargs", {})
+
+        async def view(request: HttpRequest, **kwargs: Any) -> HttpResponse:
+            if request.method not in READ_METHODS and fallback is not None:
+                return await sync_to_async(fallback)(request, **kwargs)
+            self = cls(**initkwargs)
+            self.action_map = {"get": action, "head": action}
+            return await self.adispatch(request, **kwargs)
+
+        view.actions = {"get": action, "head": action}
+        return csrf_exempt(view)
+
+    async def adispatch(self, request: HttpRequest, **kwargs: Any) -> HttpResponse:
+        """``APIView.dispatch``, awaiting the action's coroutine."""
+        self.args = ()
+        self.kwargs = kwargs
+        self.request = self.initialize_request(request, **kwargs)
+        self.headers = self.default_response_headers
+        try:
+            # Authentication can read the session and user, so it runs on a
+            # thread along with the permission and throttle checks.
+            await sync_to_async(self.initial)(self.request, **kwargs)
+            if self.action is None:
+                raise exceptions.MethodNotAllowed(request.method)
+            response = await getattr(self, f"a{self.action}")(self.request, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+        return await self._render(self.finalize_response(self.request, response, **kwargs))
+
+    @staticmethod
+    async def _render(response: HttpResponse) -> HttpResponse:
+        # Rendered here into a plain HttpResponse rather than by the handler,
+        # which would hop to a thread to call Response.render().
+        if not isinstance(response, Response):
+            return response
+        if isinstance(response.accepted_renderer, BrowsableAPIRenderer):
+            # Builds forms from the view, which may query.
+            content = await sync_to_async(lambda: response.rendered_content)()
+        else:
+            content = response.rendered_content
+        rendered = HttpResponse(content, status=response.status_code)
+        for header, value in response.items():
+            rendered[header] = value
+        return rendered
+
+    def _streaming_response(self, content: Iterator[str], **kwargs: Any) -> StreamingHttpResponse:
+        return StreamingHttpResponse(_aiterate(content), **kwargs)
+
+    async def _aget_job_or_error_response(self, pk: str) -> tuple[Job | None, Response | None]:
+        try:
+            job_id = self._parse_job_id(pk)
+        except ValueError as exc:
+            return None, Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            return await aget_job_by_id(job_id=job_id), None
+        except Job.DoesNotExist:
+            return (
+                None,
+                Response({"detail": "Job not found."}, status=status.HTTP_404_NOT_FOUND),
+            )
+
+    async def alist(self, request: Request) -> Union[Response, HttpResponse]:
+        cache_key = None
+        if caching.is_enabled():
+            cache_key = caching.page_key(request, await sync_to_async(caching.get_generation)())
+            cached = await sync_to_async(caching.get_page)(cache_key)
+            if cached is not None:
+                etag, data = cached
+                return self._not_modified(request, etag) or self._with_validators(
+                    Response(data), etag
+                )
+
+        try:
+            queryset = get_jobs_list(**self._list_filters(request))
+            statuses_limit = self._embedded_statuses(request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = queryset.values(*JOB_LIST_FIELDS, "status_version")
+        try:
+            paginator = self._get_paginator(request)
+            page = await paginator.apaginate_queryset(queryset, request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        rows = page if page is not None else [row async for row in queryset]
+        etag = self._list_etag(request, paginator, page, rows)
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        data = serialize_job_list_rows(rows)
+        if statuses_limit:
+            statuses = await sync_to_async(get_latest_statuses_by_job)(
+                job_ids=[row["id"] for row in rows], limit=statuses_limit
+            )
+            self._embed_statuses(data, statuses)
+        if page is not None:
+            response = paginator.get_paginated_response(data)
+        else:
+            response = Response(data)
+
+        if cache_key is not None:
+            await sync_to_async(caching.set_page)(cache_key, (etag, response.data))
+        return self._with_validators(response, etag)
+
+    async def aretrieve(self, request: Request, pk: str = None) -> Union[Response, HttpResponse]:
+        try:
+            statuses_limit = self._embedded_statuses(request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        job, error_response = await self._aget_job_or_error_response(pk)
+        if error_response:
+            return error_response
+
+        if statuses_limit:
+            # Raw SQL has no async API; the thread is held for this query only.
+            statuses = await sync_to_async(get_latest_statuses_by_job)(job_ids=[job.pk], limit=statuses_limit)
+            return self._detail_with_statuses(request, job, statuses.get(job.pk, []))
+
+        etag = self._make_etag(job.pk, job.updated_at.isoformat())
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        serializer = JobDetailSerializer(job)
+        return self._with_validators(Response(serializer.data), etag)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="events",
+        renderer_classes=[ServerSentEventRenderer, JSONRenderer],
+    )
+    def events(self, request: Request) -> HttpResponse:
+        params = request.query_params
+        # EventSource sends Last-Event-ID on reconnect; the query parameter
+        # lets a fresh page resume from a position it already knows.
+        last_event_id = request.headers.get("Last-Event-ID") or params.get("last_event_id")
+        try:
+            job_id = self._parse_job_id(params["job_id"]) if "job_id" in params else None
+            status_filter = validate_status_filter(params["status"]) if "status" in params else None
+            if last_event_id is not None:
+                try:
+                    last_event_id = int(last_event_id)
+                except ValueError:
+                    raise ValueError("Invalid Last-Event-ID. It must be an integer.")
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = StreamingHttpResponse(
+            stream_job_events(last_event_id=last_event_id, job_id=job_id, status=status_filter),
+            content_type="text/event-stream",
+        )
+        response["Cache-Control"] = "no-cache"
+        # Stop nginx from buffering the stream.
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    async def aevents(self, request: Request) -> HttpResponse:
+        # Only validates; the stream runs as the response is sent.
+        return self.events(request)
+
+    async def aexport(self, request: Request) -> HttpResponse:
+        return self.export(request)
+
+    async def astatuses(self, request: Request, pk: str = None) -> Union[Response, HttpResponse]:
+        job, error_response = await self._aget_job_or_error_response(pk)
+        if error_response:
+            return error_response
+
+        etag = self._make_etag(job.id, job.status_version, self._query_signature(request))
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
+        queryset = get_job_status_history(job_id=job.id)
+        paginator = self._get_paginator(request)
+        try:
+            page = await paginator.apaginate_queryset(queryset, request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        if page is not None:
+            serializer = JobStatusSerializer(page, many=True)
+            response = paginator.get_paginated_response(serializer.data)
+        else:
+            serializer = JobStatusSerializer([row async for row in queryset], many=True)
+            response = Response(serializer.data)
+        return self._with_validators(response, etag)
@@ -0,0 +1,111 @@
+"""
+Versioned cache for ``GET /api/jobs/`` pages.
+
+Every cached page is stored under the current list *generation*. The write
+services call :func:`invalidate_job_lists`, which bumps the generation so
+older pages stop being addressable and expire through the backend's TTL and
+size-bounded eviction instead of being deleted one by one.
+
+The backend is the ``JOBS_LIST_CACHE_ALIAS`` entry in ``CACHES``: local
+memory by default (per process) or Redis when ``JOBS_CACHE_URL`` is set,
+which also shares generations and hit/miss counters across workers.
+"""
+
+import hashlib
+import time
+from typing import Any, Optional
+
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.base import BaseCache
+from django.db import transaction
+from rest_framework.request import Request
+
+GENERATION_KEY = "jobs:list:generation"
+HITS_KEY = "jobs:list:hits"
+MISSES_KEY = "jobs:list:misses"
+
+
+def is_enabled() -> bool:
+    return settings.JOBS_LIST_CACHE_ENABLED
+
+
+def _cache() -> BaseCache:
+    return caches[settings.JOBS_LIST_CACHE_ALIAS]
+
+
+def _incr(key: str) -> None:
+    cache = _cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        # Missing or evicted; the counter restarts.
+        cache.add(key, 1, timeout=None)
+
+
+def get_generation() -> int:
+    cache = _cache()
+    generation = cache.get(GENERATION_KEY)
+    if generation is None:
+        # Seed from the clock so a generation evicted under memory pressure
+        # can never come back as a value that older pages were stored under.
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+        generation = cache.get(GENERATION_KEY, 0)
+    return generation
+
+
+def _bump_generation() -> None:
+    cache = _cache()
+    try:
+        cache.incr(GENERATION_KEY)
+    except ValueError:
+        cache.add(GENERATION_KEY, time.time_ns(), timeout=None)
+
+
+def invalidate_job_lists() -> None:
+    """
+    Invalidate every cached list page.
+
+    The generation is bumped immediately and again once the surrounding
+    transaction commits, so a reader that repopulated the cache from
+    pre-commit data in between is invalidated too.
+    """
+    if not is_enabled():
+        return
+    _bump_generation()
+    transaction.on_commit(_bump_generation)
+
+
+def page_key(request: Request, generation: int) -> str:
+    # Host and scheme are part of the key because the cached next/previous
+    # links are absolute URLs.
+    params = sorted(request.query_params.lists())
+    raw = f"{request.build_absolute_uri(request.path)}?{params}"
+    digest = hashlib.sha1(raw.encode("utf-8")).hexdigest()
+    return f"jobs:list:{generation}:{digest}"
+
+
+def get_page(key: str) -> Optional[Any]:
+    data = _cache().get(key)
+    _incr(MISSES_KEY if data is None else HITS_KEY)
+    return data
+
+
+def set_page(key: str, data: Any) -> None:
+    _cache().set(key, data, timeout=settings.JOBS_LIST_CACHE_TTL)
+
+
+def get_stats() -> dict[str, Any]:
+    cache = _cache()
+    hits = cache.get(HITS_KEY, 0)
+    misses = cache.get(MISSES_KEY, 0)
+    lookups = hits + misses
+    return {
+        "enabled": is_enabled(),
+        "backend": settings.CACHES[settings.JOBS_LIST_CACHE_ALIAS]["BACKEND"],
+        "ttl": settings.JOBS_LIST_CACHE_TTL,
+        "generation": cache.get(GENERATION_KEY),
+        "hits": hits,
+        "misses": misses,
+        "hit_ratio": round(hits / lookups, 4) if lookups else None,
+    }
@@ -0,0 +1,138 @@
+"""
+Primary/replica routing, enabled when ``DATABASE_REPLICA_URLS`` is set.
+
+Writes go to ``default`` and reads to a random available replica, except
+where a read must see a write: inside a transaction on the primary (the
+write services), for the rest of a request that has written, and for
+``JOBS_READ_YOUR_WRITES_SECONDS`` after a client's last write request.
+That last pin is a signed, expiring cookie set on the write's response, so
+it follows the client to whichever worker serves its next read and is never
+shared between clients behind one proxy address. Clients that drop cookies
+are not pinned.
+
+A replica that cannot be connected to is skipped for
+``JOBS_REPLICA_RETRY_SECONDS`` and reads fall back to the primary. The
+failed state is kept per process, so only the request that found the
+replica down pays for the attempt: ``connect_timeout``, or with a pool the
+replica's short pool timeout (``DB_REPLICA_POOL_TIMEOUT``).
+"""
+
+import contextvars
+import random
+import time
+from typing import Any, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.http import HttpRequest, HttpResponse
+
+PIN_COOKIE = "jobs_primary_pin"
+PIN_SALT = "jobs.db_routers.read_your_writes"
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+_pinned = contextvars.ContextVar("jobs_pinned_to_primary", default=False)
+_replica_down_until: dict[str, float] = {}
+
+
+def pin_to_primary() -> None:
+    """Send this context's remaining reads to the primary."""
+    _pinned.set(True)
+
+
+def _is_available(alias: str) -> bool:
+    connection = connections[alias]
+    if connection.connection is not None:
+        return True
+    try:
+        connection.ensure_connection()
+    except OperationalError:
+        return False
+    return True
+
+
+class PrimaryReplicaRouter:
+    def __init__(self) -> None:
+        self.replicas = list(settings.JOBS_DATABASE_REPLICAS)
+
+    def db_for_read(self, model: Any, **hints: Any) -> str:
+        if _pinned.get() or connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return DEFAULT_DB_ALIAS
+        instance = hints.get("instance")
+        if instance is not None and instance._state.db:
+            return instance._state.db
+        return self._pick_replica()
+
+    def db_for_write(self, model: Any, **hints: Any) -> str:
+        pin_to_primary()
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1: Any, obj2: Any, **hints: Any) -> bool:
+        # Every alias holds the same data.
+        return True
+
+    def allow_migrate(self, db: str, app_label: str, model_name: Optional[str] = None, **hints: Any) -> bool:
+        return db == DEFAULT_DB_ALIAS
+
+    def _pick_replica(self) -> str:
+        now = time.monotonic()
+        candidates = [alias for alias in self.replicas if _replica_down_until.get(alias, 0) <= now]
+        random.shuffle(candidates)
+        for alias in candidates:
+            if _is_available(alias):
+                return alias
+            _replica_down_until[alias] = time.monotonic() + settings.JOBS_REPLICA_RETRY_SECONDS
+        return DEFAULT_DB_ALIAS
+
+
+def _is_pinned(request: HttpRequest) -> bool:
+    # The signature's timestamp bounds the pin, whatever the cookie's expiry.
+    pin = request.get_signed_cookie(
+        PIN_COOKIE, default=None, salt=PIN_SALT, max_age=settings.JOBS_READ_YOUR_WRITES_SECONDS
+    )
+    return pin is not None
+
+
+def _pin_after_write(request: HttpRequest, response: HttpResponse) -> None:
+    if request.method in SAFE_METHODS or response.status_code >= 400:
+        return
+    response.set_signed_cookie(
+        PIN_COOKIE,
+        "1",
+        salt=PIN_SALT,
+        max_age=settings.JOBS_READ_YOUR_WRITES_SECONDS,
+        httponly=True,
+        samesite="Lax",
+    )
+
+
+class ReadYourWritesMiddleware:
+    """Pins a client's reads to the primary for a while after it writes."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Any) -> None:
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        token = _pinned.set(_is_pinned(request))
+        try:
+            response = self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        _pin_after_write(request, response)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        token = _pinned.set(_is_pinned(request))
+        try:
+            response = await self.get_response(request)
+        finally:
+            _pinned.reset(token)
+        _pin_after_write(request, response)
+        return response
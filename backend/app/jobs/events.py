@@ -0,0 +1,213 @@
+"""
+Server-Sent Events feed of job changes.
+
+The write services append a ``JobEvent`` row for every create, status change
+and delete in the same transaction as the change, and a statement-level
+trigger NOTIFYs ``jobs_events`` when that transaction commits. A stream
+replays events after the client's ``Last-Event-ID`` and then waits for a
+notification, so an idle stream costs no queries.
+
+Each process holds one LISTEN connection, opened for the first stream and
+closed after the last, and wakes every open stream on each notification.
+Streams are async generators: between reads they hold neither a thread nor
+a database connection, so the event stream is only served under ASGI.
+
+Streams end after ``JOBS_EVENTS_STREAM_SECONDS`` and ``EventSource`` clients
+reconnect with ``Last-Event-ID``.
+"""
+
+import asyncio
+import json
+import logging
+import time
+from typing import AsyncIterator, Optional
+
+import psycopg
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from jobs.db_routers import pin_to_primary
+from jobs.models import JobEvent
+from jobs.selectors import get_job_event_ids, get_job_events, get_latest_job_event_id
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "jobs_events"
+BATCH_SIZE = 500
+# Ids come from a sequence at INSERT time but become visible at COMMIT, so a
+# lower id can show up after a higher one. Missing ids are re-checked for
+# this long before they are assumed to belong to a rolled-back transaction.
+GAP_TIMEOUT_SECONDS = 5.0
+GAP_RECHECK_SECONDS = 0.5
+LISTEN_RETRY_MAX_SECONDS = 10.0
+
+
+def format_event(event: JobEvent, resume_id: int) -> str:
+    # The SSE id is the stream's high-water mark rather than the event's own
+    # id, so a late gap fill never rewinds the client's resume position.
+    data = json.dumps(
+        {
+            "id": event.pk,
+            "type": event.event_type,
+            "job_id": event.job_id,
+            "job_name": event.job_name,
+            "status_type": event.status_type,
+            "timestamp": event.timestamp.isoformat(),
+        }
+    )
+    return f"id: {resume_id}\nevent: {event.event_type}\ndata: {data}\n\n"
+
+
+class _Listener:
+    """The process's LISTEN connection, shared by every open stream."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.subscribers: set[asyncio.Event] = set()
+        self.task: Optional[asyncio.Task] = None
+
+    def subscribe(self) -> asyncio.Event:
+        wake = asyncio.Event()
+        self.subscribers.add(wake)
+        if self.task is None:
+            self.task = self.loop.create_task(self._listen())
+        return wake
+
+    def unsubscribe(self, wake: asyncio.Event) -> None:
+        self.subscribers.discard(wake)
+        if not self.subscribers and self.task is not None:
+            self.task.cancel()
+            self.task = None
+
+    def _wake_all(self) -> None:
+        for wake in self.subscribers:
+            wake.set()
+
+    async def _listen(self) -> None:
+        params = connections[DEFAULT_DB_ALIAS].get_connection_params()
+        # Django's cursor class is sync-only.
+        params.pop("cursor_factory", None)
+        delay = GAP_RECHECK_SECONDS
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(**params, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {CHANNEL}")
+                    delay = GAP_RECHECK_SECONDS
+                    # Streams re-read after LISTEN, so nothing committed
+                    # before it, or while reconnecting, is missed.
+                    self._wake_all()
+                    async for _ in conn.notifies():
+                        self._wake_all()
+            except psycopg.Error:
+                logger.warning(
+                    "LISTEN %s connection failed; retrying in %.1fs", CHANNEL, delay, exc_info=True
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, LISTEN_RETRY_MAX_SECONDS)
+
+
+_listener: Optional[_Listener] = None
+
+
+def _get_listener() -> _Listener:
+    global _listener
+    if _listener is None or _listener.loop is not asyncio.get_running_loop():
+        _listener = _Listener()
+    return _listener
+
+
+def _release_connection() -> None:
+    # Reads run on whichever executor thread is free; closing (or returning
+    # to the pool) keeps an idle stream from pinning a connection per thread.
+    connections[DEFAULT_DB_ALIAS].close()
+
+
+@sync_to_async(thread_sensitive=False)
+def _read_latest_id() -> int:
+    # NOTIFY comes from the primary; a replica may not have the rows yet.
+    pin_to_primary()
+    try:
+        return get_latest_job_event_id()
+    finally:
+        _release_connection()
+
+
+@sync_to_async(thread_sensitive=False)
+def _read_batch(
+    *, after_id: int, include_ids: list[int], job_id: Optional[int], status: Optional[str]
+) -> tuple[list[int], list[JobEvent]]:
+    pin_to_primary()
+    try:
+        ids = get_job_event_ids(after_id=after_id, include_ids=include_ids, limit=BATCH_SIZE)
+        events = list(get_job_events(ids=ids, job_id=job_id, status=status)) if ids else []
+        return ids, events
+    finally:
+        _release_connection()
+
+
+async def _wait(wake: asyncio.Event, timeout: float) -> bool:
+    try:
+        await asyncio.wait_for(wake.wait(), timeout)
+    except asyncio.TimeoutError:
+        return False
+    return True
+
+
+async def stream_job_events(
+    *,
+    last_event_id: Optional[int] = None,
+    job_id: Optional[int] = None,
+    status: Optional[str] = None,
+) -> AsyncIterator[str]:
+    deadline = time.monotonic() + settings.JOBS_EVENTS_STREAM_SECONDS
+    heartbeat = settings.JOBS_EVENTS_HEARTBEAT_SECONDS
+    high_water = await _read_latest_id() if last_event_id is None else last_event_id
+    gaps: dict[int, float] = {}
+    listener: Optional[_Listener] = None
+    wake: Optional[asyncio.Event] = None
+
+    yield "retry: 1000\n\n"
+    try:
+        while True:
+            now = time.monotonic()
+            gaps = {pk: expiry for pk, expiry in gaps.items() if expiry > now}
+            if wake is not None:
+                # Anything that woke the stream up to here is read below.
+                wake.clear()
+            ids, events = await _read_batch(
+                after_id=high_water, include_ids=list(gaps), job_id=job_id, status=status
+            )
+
+            expected = high_water + 1
+            for pk in ids:
+                if pk in gaps:
+                    del gaps[pk]
+                    continue
+                if pk - expected <= BATCH_SIZE:
+                    # Larger jumps are pruned history, not in-flight writes.
+                    gaps.update(dict.fromkeys(range(expected, pk), now + GAP_TIMEOUT_SECONDS))
+                expected = pk + 1
+            high_water = max(high_water, expected - 1)
+
+            for event in events:
+                yield format_event(event, high_water)
+            if len(ids) == BATCH_SIZE:
+                continue
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return
+            if wake is None:
+                # Subscribe, then read once more so nothing committed between
+                # the last read and the subscription is missed.
+                listener = _get_listener()
+                wake = listener.subscribe()
+                continue
+
+            timeout = min(remaining, GAP_RECHECK_SECONDS if gaps else heartbeat)
+            if not await _wait(wake, timeout) and not gaps:
+                yield ": keep-alive\n\n"
+    finally:
+        if wake is not None:
+            listener.unsubscribe(wake)
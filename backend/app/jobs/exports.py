@@ -0,0 +1,154 @@
+"""
+Streaming exports of jobs, optionally joined with their full status history.
+
+Rows are read through server-side cursors (``.iterator(chunk_size=...)``)
+and emitted in chunks, so memory stays flat however many rows there are.
+With history, jobs (by id) and statuses (by job id) are read as two ordered
+streams and merged, rather than issuing one history query per job.
+
+Both cursors are opened in one read-only REPEATABLE READ transaction.
+Outside a transaction Django declares them WITH HOLD, and Postgres
+materializes each whole result when its statement commits; the two reads
+would also see different snapshots.
+"""
+
+import csv
+import io
+import json
+from datetime import tzinfo
+from typing import Any, Iterable, Iterator, Optional
+
+from django.db import connections, transaction
+from django.utils import timezone
+
+from jobs.selectors import get_jobs_list, get_status_history_for_jobs
+from jobs.serializers import JOB_LIST_FIELDS, format_api_datetime, serialize_job_list_row
+
+EXPORT_FORMATS = ["ndjson", "csv"]
+DEFAULT_CHUNK_SIZE = 2000
+
+STATUS_FIELDS = ["id", "status_type", "timestamp"]
+CSV_STATUS_COLUMNS = ["status_id", "status_type", "status_timestamp"]
+
+
+def _status_row(values: dict[str, Any], tz: tzinfo) -> dict[str, Any]:
+    return {
+        "id": values["id"],
+        "status_type": values["status_type"],
+        "timestamp": format_api_datetime(values["timestamp"], tz),
+    }
+
+
+def iter_export_rows(
+    *,
+    status: Optional[str] = None,
+    include_statuses: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[tuple[dict[str, Any], Optional[list[dict[str, Any]]]]]:
+    """Yield ``(job, statuses)`` pairs in job id order; ``statuses`` is
+    ``None`` unless ``include_statuses`` is set."""
+    tz = timezone.get_current_timezone()
+    jobs = get_jobs_list(status=status).order_by("id")
+    alias = jobs.db
+    # Inside a caller's transaction the isolation level is already set.
+    set_isolation = not connections[alias].in_atomic_block
+    with transaction.atomic(using=alias):
+        if set_isolation:
+            with connections[alias].cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ, READ ONLY")
+        job_rows = jobs.values(*JOB_LIST_FIELDS).iterator(chunk_size=chunk_size)
+
+        if not include_statuses:
+            for values in job_rows:
+                yield serialize_job_list_row(values, tz), None
+            return
+
+        status_rows = (
+            get_status_history_for_jobs(jobs)
+            .using(alias)
+            .values("job_id", *STATUS_FIELDS)
+            .iterator(chunk_size=chunk_size)
+        )
+        pending = next(status_rows, None)
+        for values in job_rows:
+            history = []
+            # Both cursors share one snapshot, so every status has its job
+            # row; the check only guards the merge.
+            while pending is not None and pending["job_id"] <= values["id"]:
+                if pending["job_id"] == values["id"]:
+                    history.append(_status_row(pending, tz))
+                pending = next(status_rows, None)
+            yield serialize_job_list_row(values, tz), history
+
+
+def _chunked(lines: Iterable[str], lines_per_chunk: int) -> Iterator[str]:
+    buffer: list[str] = []
+    for line in lines:
+        buffer.append(line)
+        if len(buffer) >= lines_per_chunk:
+            yield "".join(buffer)
+            buffer.clear()
+    if buffer:
+        yield "".join(buffer)
+
+
+def iter_ndjson(
+    rows: Iterable[tuple[dict[str, Any], Optional[list[dict[str, Any]]]]],
+    *,
+    lines_per_chunk: int = 500,
+) -> Iterator[str]:
+    def lines() -> Iterator[str]:
+        for job, statuses in rows:
+            if statuses is not None:
+                job["statuses"] = statuses
+            yield json.dumps(job, separators=(",", ":")) + "\n"
+
+    return _chunked(lines(), lines_per_chunk)
+
+
+def iter_csv(
+    rows: Iterable[tuple[dict[str, Any], Optional[list[dict[str, Any]]]]],
+    *,
+    include_statuses: bool = False,
+    lines_per_chunk: int = 500,
+) -> Iterator[str]:
+    """One line per job, or per status (job columns repeated) with history."""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def lines() -> Iterator[str]:
+        header = JOB_LIST_FIELDS + (CSV_STATUS_COLUMNS if include_statuses else [])
+        writer.writerow(header)
+        for job, statuses in rows:
+            job_values = [job[field] for field in JOB_LIST_FIELDS]
+            if statuses is None:
+                writer.writerow(job_values)
+            elif not statuses:
+                writer.writerow(job_values + [None] * len(CSV_STATUS_COLUMNS))
+            else:
+                for entry in statuses:
+                    writer.writerow(job_values + [entry[field] for field in STATUS_FIELDS])
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+
+    yield from _chunked(lines(), lines_per_chunk)
+
+
+def iter_export(
+    *,
+    export_format: str,
+    status: Optional[str] = None,
+    include_statuses: bool = False,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[str]:
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Invalid export format. Allowed: {EXPORT_FORMATS}")
+    rows = iter_export_rows(
+        status=status,
+        include_statuses=include_statuses,
+        chunk_size=chunk_size,
+    )
+    if export_format == "csv":
+        return iter_csv(rows, include_statuses=include_statuses)
+    return iter_ndjson(rows)
@@ -0,0 +1,63 @@
+"""
+orjson-backed drop-in replacements for DRF's ``JSONRenderer`` and
+``JSONParser``, enabled with ``JOBS_FAST_JSON=1`` (needs the ``orjson``
+package).
+
+The renderer's output is byte-identical to DRF's default compact,
+non-ASCII-escaping JSON: datetimes are encoded natively with ``Z`` for UTC,
+as DRF's encoder does; types orjson does not know (``Decimal``, lazy
+translations, ``timedelta``, ...) fall back to DRF's encoder; and U+2028 /
+U+2029 are escaped the same way. Requests for indented output, or settings
+that change DRF's JSON style, go through the stdlib path.
+"""
+
+import codecs
+
+import orjson
+from django.conf import settings
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+# DRF escapes these for embedding in <script>; orjson emits them raw.
+_LINE_SEPARATOR = b"\xe2\x80\xa8"
+_PARAGRAPH_SEPARATOR = b"\xe2\x80\xa9"
+
+_fallback_encoder = JSONEncoder()
+
+
+class ORJSONRenderer(JSONRenderer):
+    options = orjson.OPT_UTC_Z | orjson.OPT_NON_STR_KEYS
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        renderer_context = renderer_context or {}
+        if (
+            self.get_indent(accepted_media_type, renderer_context) is not None
+            or self.ensure_ascii
+            or not self.compact
+            or self.encoder_class is not JSONEncoder
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        ret = orjson.dumps(data, default=_fallback_encoder.default, option=self.options)
+        if _LINE_SEPARATOR in ret or _PARAGRAPH_SEPARATOR in ret:
+            ret = ret.replace(_LINE_SEPARATOR, b"\\u2028").replace(_PARAGRAPH_SEPARATOR, b"\\u2029")
+        return ret
+
+
+class ORJSONParser(JSONParser):
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        try:
+            body = stream.read()
+            if codecs.lookup(encoding).name != "utf-8":
+                body = body.decode(encoding)
+            return orjson.loads(body)
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
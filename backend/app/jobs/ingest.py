@@ -0,0 +1,268 @@
+"""
+Write-behind ingestion of status reports for ``POST /api/jobs/statuses/ingest/``,
+enabled with ``JOBS_INGEST_ENABLED=1``.
+
+Accepted reports are stamped with the time they happened (the worker's
+``timestamp``, or the time of acceptance) and queued in a bounded
+per-process buffer. A background thread writes them with
+``bulk_update_job_status``, in one transaction per batch of up to
+``JOBS_INGEST_BATCH_SIZE`` reports, or after ``JOBS_INGEST_FLUSH_SECONDS``
+when fewer are waiting. The newest report by timestamp becomes current, so
+batching does not change the outcome compared with writing each report on
+its own.
+
+When the buffer is full, submitters wait up to
+``JOBS_INGEST_ENQUEUE_TIMEOUT_SECONDS`` for room and are then refused, so a
+slow database pushes back on workers instead of growing memory. A batch
+that fails is retried, as the same batch, up to ``JOBS_INGEST_MAX_ATTEMPTS``
+times in all and then logged and dropped, so one batch the database keeps
+rejecting cannot block every later report. Pending reports are written when
+the process exits. Reports are acknowledged before
+they are written, so a crash loses whatever is still buffered.
+"""
+
+import atexit
+import logging
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Callable, NamedTuple, Optional, Sequence
+
+from django.conf import settings
+from django.db import close_old_connections, connections
+
+from jobs.services import bulk_update_job_status
+
+logger = logging.getLogger(__name__)
+
+
+class StatusReport(NamedTuple):
+    job_id: int
+    status_type: str
+    timestamp: datetime
+
+
+class IngestBufferFull(Exception):
+    pass
+
+
+class IngestBufferClosed(Exception):
+    pass
+
+
+def is_enabled() -> bool:
+    return settings.JOBS_INGEST_ENABLED
+
+
+def write_status_reports(reports: list[StatusReport]) -> int:
+    """Write one batch; return how many reports named a missing job."""
+    _, missing = bulk_update_job_status(updates=reports)
+    if not missing:
+        return 0
+    logger.warning("Dropped status reports for %d missing job(s): %s", len(missing), missing[:20])
+    missing_ids = set(missing)
+    return sum(1 for report in reports if report.job_id in missing_ids)
+
+
+class StatusIngestBuffer:
+    def __init__(
+        self,
+        *,
+        capacity: int,
+        batch_size: int,
+        flush_interval: float,
+        max_attempts: int = 3,
+        write_batch: Callable[[list[StatusReport]], int] = write_status_reports,
+    ) -> None:
+        self.capacity = capacity
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_attempts = max_attempts
+        self.write_batch = write_batch
+        self._items: deque[StatusReport] = deque()
+        # Guards _items and the counters; both the flusher and submitters
+        # waiting for room wait on it.
+        self._cond = threading.Condition()
+        self._oldest = 0.0
+        # Size of a failed batch waiting at the front to be retried, and
+        # how many times it has failed.
+        self._retry_size = 0
+        self._failed_attempts = 0
+        self._closed = False
+        self._thread: Optional[threading.Thread] = None
+        self._counts = {
+            "accepted": 0,
+            "rejected": 0,
+            "written": 0,
+            "dropped_missing": 0,
+            "batches": 0,
+            "failed_batches": 0,
+            "dropped_failed": 0,
+        }
+
+    def submit(self, reports: Sequence[StatusReport], timeout: float) -> None:
+        """
+        Queue ``reports`` as a unit, waiting up to ``timeout`` seconds for
+        room. Raises ``IngestBufferFull`` if there is none by then.
+        """
+        if len(reports) > self.capacity:
+            raise ValueError(f"At most {self.capacity} reports can be submitted at once.")
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            while True:
+                if self._closed:
+                    raise IngestBufferClosed("The ingest buffer is shutting down.")
+                if len(self._items) + len(reports) <= self.capacity:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self._counts["rejected"] += len(reports)
+                    raise IngestBufferFull("The ingest buffer is full.")
+                self._cond.wait(remaining)
+
+            was_empty = not self._items
+            if was_empty:
+                self._oldest = time.monotonic()
+            self._items.extend(reports)
+            self._counts["accepted"] += len(reports)
+            # Wake the flusher to start its flush timer, or to write a full batch.
+            if was_empty or len(self._items) >= self.batch_size:
+                self._cond.notify_all()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="jobs-ingest-flusher", daemon=True)
+        self._thread.start()
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Stop accepting reports and write everything still buffered."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            if self._thread.is_alive():
+                logger.error("Ingest buffer did not drain within %ss; %d reports lost", timeout, self.pending)
+        else:
+            self.drain()
+
+    def drain(self) -> None:
+        """Write every buffered report from the calling thread."""
+        while True:
+            with self._cond:
+                if not self._items:
+                    return
+                batch = self._take_batch()
+            self._write(batch)
+
+    @property
+    def pending(self) -> int:
+        with self._cond:
+            return len(self._items)
+
+    def get_stats(self) -> dict[str, Any]:
+        with self._cond:
+            return {
+                "pending": len(self._items),
+                "capacity": self.capacity,
+                "batch_size": self.batch_size,
+                "flush_interval_seconds": self.flush_interval,
+                "running": self._thread is not None and self._thread.is_alive(),
+                **self._counts,
+            }
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._is_due():
+                    if self._closed and not self._items:
+                        connections.close_all()
+                        return
+                    self._cond.wait(self._wait_seconds())
+                batch = self._take_batch()
+            # The flusher holds its own connection, so recycle it the way
+            # Django does around each request (this also returns a pooled
+            # connection between batches).
+            close_old_connections()
+            try:
+                self._write(batch)
+            finally:
+                close_old_connections()
+
+    def _is_due(self) -> bool:
+        if not self._items:
+            return False
+        return (
+            self._closed
+            or len(self._items) >= self.batch_size
+            or time.monotonic() >= self._oldest + self.flush_interval
+        )
+
+    def _wait_seconds(self) -> Optional[float]:
+        if not self._items:
+            return None
+        return max(self._oldest + self.flush_interval - time.monotonic(), 0)
+
+    def _take_batch(self) -> list[StatusReport]:
+        count = min(len(self._items), self._retry_size or self.batch_size)
+        batch = [self._items.popleft() for _ in range(count)]
+        if self._items:
+            self._oldest = time.monotonic()
+        self._cond.notify_all()
+        return batch
+
+    def _write(self, batch: list[StatusReport]) -> None:
+        try:
+            dropped = self.write_batch(batch)
+        except Exception:
+            with self._cond:
+                self._counts["failed_batches"] += 1
+                self._failed_attempts += 1
+                closed = self._closed
+                retry = not closed and self._failed_attempts < self.max_attempts
+                if retry:
+                    # Put the batch back in front, to be taken again as it is.
+                    self._items.extendleft(reversed(batch))
+                    self._retry_size = len(batch)
+                    self._oldest = time.monotonic()
+                else:
+                    self._counts["dropped_failed"] += len(batch)
+                    self._retry_size = 0
+                    self._failed_attempts = 0
+            if retry:
+                logger.exception("Failed to write %d status reports; retrying", len(batch))
+                time.sleep(self.flush_interval)
+            else:
+                logger.exception(
+                    "Dropped %d status reports after a failed write%s: %s",
+                    len(batch),
+                    " during shutdown" if closed else f" (attempt {self.max_attempts})",
+                    [tuple(report) for report in batch[:20]],
+                )
+            return
+        with self._cond:
+            self._retry_size = 0
+            self._failed_attempts = 0
+            self._counts["batches"] += 1
+            self._counts["written"] += len(batch) - dropped
+            self._counts["dropped_missing"] += dropped
+
+
+_buffer: Optional[StatusIngestBuffer] = None
+_buffer_lock = threading.Lock()
+
+
+def get_buffer() -> StatusIngestBuffer:
+    """This process's buffer, started on first use (after any fork)."""
+    global _buffer
+    with _buffer_lock:
+        if _buffer is None:
+            _buffer = StatusIngestBuffer(
+                capacity=settings.JOBS_INGEST_BUFFER_SIZE,
+                batch_size=settings.JOBS_INGEST_BATCH_SIZE,
+                flush_interval=settings.JOBS_INGEST_FLUSH_SECONDS,
+                max_attempts=settings.JOBS_INGEST_MAX_ATTEMPTS,
+            )
+            _buffer.start()
+            atexit.register(_buffer.close, settings.JOBS_INGEST_SHUTDOWN_TIMEOUT_SECONDS)
+        return _buffer
@@ -0,0 +1,250 @@
+"""
+Per-request timing, enabled with ``JOBS_REQUEST_METRICS_ENABLED=1``.
+
+For a sampled request (``JOBS_REQUEST_METRICS_SAMPLE_RATE``),
+``RequestMetricsMiddleware`` measures:
+
+- ``total``: wall time through the middleware stack below it;
+- ``db``: time in, and number of, database queries on any alias, recorded
+  by an ``execute_wrapper`` installed on every new connection;
+- ``view``: from the view being called until it returns;
+- ``serializer``: validation and representation in the API serializers
+  (and the list fast path), which also counts queries a serializer
+  triggers;
+- ``render``: turning the view's ``Response`` into bytes.
+
+``db`` overlaps ``view`` and ``serializer``. The timings are sent as a
+``Server-Timing`` header (``JOBS_REQUEST_METRICS_SERVER_TIMING``) and logged
+as one JSON object per request to the ``jobs.requests`` logger. Unsampled
+requests only pay for the sampling decision; the query wrapper checks a
+context variable and returns. Streamed bodies (exports, the event stream)
+are generated after the response leaves the middleware, so only the time
+to the first byte is measured for them.
+
+With ``JOBS_METRICS_ENABLED=1`` every request is measured and passed to
+``jobs.metrics``; sampling then only decides what is logged.
+"""
+
+import json
+import logging
+import random
+from contextvars import ContextVar
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.http import HttpRequest, HttpResponse
+from rest_framework.fields import empty
+
+logger = logging.getLogger("jobs.requests")
+
+
+class RequestMetrics:
+    __slots__ = (
+        "started",
+        "db_ms",
+        "queries",
+        "view_started",
+        "view_ms",
+        "serializer_ms",
+        "render_started",
+        "render_ms",
+        "in_serializer",
+        "action",
+    )
+
+    def __init__(self) -> None:
+        self.started = perf_counter()
+        self.db_ms = 0.0
+        self.queries = 0
+        self.view_started: Optional[float] = None
+        self.view_ms: Optional[float] = None
+        self.serializer_ms = 0.0
+        self.render_started: Optional[float] = None
+        self.render_ms: Optional[float] = None
+        self.in_serializer = False
+        self.action: Optional[str] = None
+
+    def finish(self) -> dict[str, Optional[float]]:
+        ended = perf_counter()
+        if self.render_started is not None:
+            self.render_ms = (ended - self.render_started) * 1000
+        elif self.view_started is not None and self.view_ms is None:
+            # Not a template response, so there was nothing left to render.
+            self.view_ms = (ended - self.view_started) * 1000
+        return {
+            "total": (ended - self.started) * 1000,
+            "db": self.db_ms,
+            "view": self.view_ms,
+            "serializer": self.serializer_ms if self.view_started is not None else None,
+            "render": self.render_ms,
+        }
+
+
+_current: ContextVar[Optional[RequestMetrics]] = ContextVar("jobs_request_metrics", default=None)
+
+
+def current_metrics() -> Optional[RequestMetrics]:
+    """The metrics being collected for this request, if it was sampled."""
+    return _current.get()
+
+
+def record_query(execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    started = perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        metrics.db_ms += (perf_counter() - started) * 1000
+        metrics.queries += 1
+
+
+def install_query_recorder(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """``connection_created`` receiver that adds ``record_query`` once."""
+    if record_query not in connection.execute_wrappers:
+        # First, so execute_wrapper() blocks around it still pop their own.
+        connection.execute_wrappers.insert(0, record_query)
+
+
+def timed_serialization(func: Callable, *args: Any) -> Any:
+    """Call ``func`` and add its duration to the serializer phase."""
+    metrics = _current.get()
+    if metrics is None or metrics.in_serializer:
+        return func(*args)
+    metrics.in_serializer = True
+    started = perf_counter()
+    try:
+        return func(*args)
+    finally:
+        metrics.serializer_ms += (perf_counter() - started) * 1000
+        metrics.in_serializer = False
+
+
+class InstrumentedSerializerMixin:
+    """Counts a serializer's validation and representation as serializer time."""
+
+    def run_validation(self, data: Any = empty) -> Any:
+        return timed_serialization(super().run_validation, data)
+
+    def to_representation(self, instance: Any) -> Any:
+        return timed_serialization(super().to_representation, instance)
+
+
+def _server_timing(timings: dict[str, Optional[float]], queries: int) -> str:
+    entries = []
+    for name, duration in timings.items():
+        if duration is None:
+            continue
+        entry = f"{name};dur={duration:.1f}"
+        if name == "db":
+            entry += f';desc="{queries} queries"'
+        entries.append(entry)
+    return ", ".join(entries)
+
+
+class RequestMetricsMiddleware:
+    """Times requests; see the module docstring."""
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response: Any) -> None:
+        self.get_response = get_response
+        # Without request logging nothing is sampled; metrics may still be on.
+        self.sample_rate = (
+            settings.JOBS_REQUEST_METRICS_SAMPLE_RATE if settings.JOBS_REQUEST_METRICS_ENABLED else 0.0
+        )
+        self.server_timing = settings.JOBS_REQUEST_METRICS_SERVER_TIMING
+        self.observe_request: Optional[Callable[..., None]] = None
+        if settings.JOBS_METRICS_ENABLED:
+            from jobs.metrics import observe_request
+
+            self.observe_request = observe_request
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def _sampled(self) -> bool:
+        return self.sample_rate >= 1 or random.random() < self.sample_rate
+
+    def __call__(self, request: HttpRequest) -> Any:
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        sampled = self._sampled()
+        if not sampled and self.observe_request is None:
+            return self.get_response(request)
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._report(request, response, metrics, sampled)
+        return response
+
+    async def __acall__(self, request: HttpRequest) -> HttpResponse:
+        sampled = self._sampled()
+        if not sampled and self.observe_request is None:
+            return await self.get_response(request)
+        metrics = RequestMetrics()
+        # Queries run in sync_to_async threads, which copy this context.
+        token = _current.set(metrics)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        self._report(request, response, metrics, sampled)
+        return response
+
+    def process_view(self, request: HttpRequest, view_func: Callable, view_args: Any, view_kwargs: Any) -> None:
+        metrics = _current.get()
+        if metrics is None:
+            return None
+        # ViewSet views map HTTP methods to actions (list, retrieve, ...).
+        actions = getattr(view_func, "actions", None) or {}
+        metrics.action = actions.get(request.method.lower(), view_func.__name__)
+        metrics.view_started = perf_counter()
+        return None
+
+    def process_template_response(self, request: HttpRequest, response: HttpResponse) -> HttpResponse:
+        # Called after the view returns and before the response is rendered.
+        metrics = _current.get()
+        if metrics is not None and metrics.view_started is not None:
+            metrics.render_started = perf_counter()
+            metrics.view_ms = (metrics.render_started - metrics.view_started) * 1000
+        return response
+
+    def _report(
+        self, request: HttpRequest, response: HttpResponse, metrics: RequestMetrics, sampled: bool
+    ) -> None:
+        timings = metrics.finish()
+        match = request.resolver_match
+        view = match.view_name if match else None
+        if self.observe_request is not None:
+            self.observe_request(
+                view=view,
+                action=metrics.action,
+                method=request.method,
+                status=response.status_code,
+                timings=timings,
+                queries=metrics.queries,
+            )
+        if not sampled:
+            return
+        if self.server_timing:
+            response["Server-Timing"] = _server_timing(timings, metrics.queries)
+        logger.info(
+            json.dumps(
+                {
+                    "method": request.method,
+                    "path": request.path,
+                    "view": view,
+                    "action": metrics.action,
+                    "status": response.status_code,
+                    "queries": metrics.queries,
+                    **{f"{name}_ms": round(value, 3) for name, value in timings.items() if value is not None},
+                }
+            )
+        )
@@ -0,0 +1,50 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.exports import DEFAULT_CHUNK_SIZE, EXPORT_FORMATS, iter_export
+from jobs.selectors import parse_status_filter
+
+
+class Command(BaseCommand):
+    help = "Stream all jobs, optionally with status history, as NDJSON or CSV."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--format", choices=EXPORT_FORMATS, default="ndjson")
+        parser.add_argument(
+            "--include-statuses",
+            action="store_true",
+            help="Embed (NDJSON) or join (CSV) each job's full status history.",
+        )
+        parser.add_argument("--status", help="Only export jobs currently in this status (comma-separated for several).")
+        parser.add_argument(
+            "--output",
+            "-o",
+            help="File to write to (default: stdout).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Rows fetched per server-side cursor round trip.",
+        )
+
+    def handle(self, *args, **options):
+        status = options["status"]
+        if status is not None:
+            try:
+                parse_status_filter(status)
+            except ValueError as exc:
+                raise CommandError(str(exc))
+
+        chunks = iter_export(
+            export_format=options["format"],
+            status=status,
+            include_statuses=options["include_statuses"],
+            chunk_size=options["chunk_size"],
+        )
+        if options["output"]:
+            with open(options["output"], "w", encoding="utf-8", newline="") as out:
+                for chunk in chunks:
+                    out.write(chunk)
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending="")
@@ -0,0 +1,23 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from jobs.services import prune_job_events
+
+
+class Command(BaseCommand):
+    help = "Delete job change-feed events older than the retention window."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--older-than-hours",
+            type=int,
+            default=24,
+            help="Retention window in hours (default: 24).",
+        )
+
+    def handle(self, *args, **options):
+        before = timezone.now() - timedelta(hours=options["older_than_hours"])
+        deleted = prune_job_events(before=before)
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} job events."))
@@ -0,0 +1,32 @@
+from django.core.management.base import BaseCommand
+
+from jobs.services import rebuild_job_status_counts
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-status job counters from the Job table."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Report drift between stored and actual counts without writing.",
+        )
+
+    def handle(self, *args, **options):
+        report = rebuild_job_status_counts(dry_run=options["check"])
+
+        drifted = False
+        for status_type, (stored, actual) in report.items():
+            line = f"{status_type}: stored={stored} actual={actual}"
+            if stored != actual:
+                drifted = True
+                self.stdout.write(self.style.WARNING(f"{line} (drift {actual - stored:+d})"))
+            else:
+                self.stdout.write(line)
+
+        if options["check"]:
+            summary = "Counters have drifted." if drifted else "Counters are in sync."
+        else:
+            summary = "Counters rebuilt."
+        self.stdout.write(self.style.SUCCESS(summary))
@@ -0,0 +1,88 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.seeding import DEFAULT_CHUNK_SIZE, parse_status_mix, seed_jobs
+
+
+class Command(BaseCommand):
+    help = "Load synthetic jobs with status histories through COPY, for load testing."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--jobs", type=int, required=True, help="Number of jobs to create.")
+        parser.add_argument(
+            "--status-mix",
+            default="COMPLETED=60,FAILED=10,RUNNING=20,PENDING=10",
+            help="Relative weights of the jobs' current statuses.",
+        )
+        parser.add_argument(
+            "--history-mean",
+            type=float,
+            default=4.0,
+            help="Mean statuses per job; depths are geometrically distributed (default: 4).",
+        )
+        parser.add_argument("--history-max", type=int, default=50, help="Cap on statuses per job.")
+        parser.add_argument(
+            "--days",
+            type=float,
+            default=30.0,
+            help="Spread job creation times over this many past days (default: 30).",
+        )
+        parser.add_argument(
+            "--step-seconds",
+            type=float,
+            default=300.0,
+            help="Mean gap between a job's consecutive statuses (default: 300).",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help="Jobs copied per transaction.",
+        )
+        parser.add_argument("--prefix", default="seed", help="Job names are <prefix>-<id>.")
+        parser.add_argument(
+            "--defer-indexes",
+            action="store_true",
+            help="Drop secondary indexes during the load and rebuild them after "
+            "(much faster for large loads; only on a database nothing else is using).",
+        )
+        parser.add_argument("--seed", type=int, help="Random seed, for reproducible data.")
+
+    def handle(self, *args, **options):
+        if options["jobs"] < 1 or options["chunk_size"] < 1:
+            raise CommandError("--jobs and --chunk-size must be positive.")
+        try:
+            status_mix = parse_status_mix(options["status_mix"])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        started = time.monotonic()
+
+        def progress(jobs_done: int, statuses_done: int) -> None:
+            if options["verbosity"] > 1:
+                elapsed = time.monotonic() - started
+                self.stdout.write(f"{jobs_done} jobs, {statuses_done} statuses ({elapsed:.1f}s)")
+
+        try:
+            jobs, statuses = seed_jobs(
+                count=options["jobs"],
+                status_mix=status_mix,
+                history_mean=options["history_mean"],
+                history_max=options["history_max"],
+                days=options["days"],
+                step_seconds=options["step_seconds"],
+                chunk_size=options["chunk_size"],
+                prefix=options["prefix"],
+                defer_indexes=options["defer_indexes"],
+                random_seed=options["seed"],
+                progress=progress,
+            )
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {jobs} jobs and {statuses} statuses in {time.monotonic() - started:.1f}s."
+            )
+        )
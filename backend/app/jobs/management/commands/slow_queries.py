@@ -0,0 +1,93 @@
+import json
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.test import Client
+
+from jobs.slow_queries import SlowQueryLog, SlowQueryRecorder
+
+
+def _host() -> str:
+    # The test client's default "testserver" is rarely in ALLOWED_HOSTS.
+    hosts = [host for host in settings.ALLOWED_HOSTS if host != "*"]
+    return hosts[0].lstrip(".") if hosts else "testserver"
+
+
+class Command(BaseCommand):
+    help = (
+        "Run API GET requests in this process and print the slow queries they run, "
+        "with EXPLAIN (ANALYZE, BUFFERS) output. The server's own capture is at "
+        "GET /api/jobs/slow-queries/."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            metavar="PATH",
+            help="API path and query string, e.g. '/api/jobs/?status=FAILED&sort=-updated_at'.",
+        )
+        parser.add_argument(
+            "--threshold-ms",
+            type=float,
+            help="Record statements at least this slow (default: JOBS_SLOW_QUERY_THRESHOLD_MS).",
+        )
+        parser.add_argument(
+            "--explain-rate",
+            type=float,
+            default=1.0,
+            help="Share of slow reads to run EXPLAIN (ANALYZE, BUFFERS) for.",
+        )
+        parser.add_argument("--repeat", type=int, default=1, help="Requests per path.")
+        parser.add_argument("--limit", type=int, default=100, help="Keep only the last N slow statements.")
+        parser.add_argument("--json", action="store_true", help="Print the entries as JSON.")
+
+    def handle(self, *args, **options):
+        for path in options["paths"]:
+            if not path.startswith("/"):
+                raise CommandError(f"'{path}' is not a path; use e.g. /api/jobs/?sort=name.")
+        threshold_ms = options["threshold_ms"]
+        if threshold_ms is None:
+            threshold_ms = settings.JOBS_SLOW_QUERY_THRESHOLD_MS
+        recorder = SlowQueryRecorder(
+            threshold_ms=threshold_ms,
+            explain_rate=options["explain_rate"],
+            log=SlowQueryLog(capacity=options["limit"]),
+        )
+
+        client = Client(SERVER_NAME=_host())
+        with ExitStack() as stack:
+            for alias in connections:
+                stack.enter_context(connections[alias].execute_wrapper(recorder))
+            for path in options["paths"]:
+                for _ in range(options["repeat"]):
+                    response = client.get(path, HTTP_ACCEPT="application/json")
+                    if response.streaming:
+                        # Streamed bodies run their queries as they are read.
+                        b"".join(response.streaming_content)
+                    response.close()
+                    if response.status_code >= 400:
+                        self.stderr.write(self.style.WARNING(f"GET {path} returned {response.status_code}"))
+
+        entries = list(reversed(recorder.log.entries()))
+        if options["json"]:
+            self.stdout.write(json.dumps(entries, indent=2))
+            return
+        for entry in entries:
+            self.stdout.write(
+                self.style.WARNING(f"{entry['duration_ms']:.1f} ms")
+                + f"  {entry['alias']}  {entry['caller'] or '-'}  [{entry['fingerprint']}]"
+            )
+            self.stdout.write(f"  {entry['sql']}")
+            self.stdout.write(f"  params: {json.dumps(entry['params'])}")
+            if entry["plan"]:
+                for line in entry["plan"].splitlines():
+                    self.stdout.write(f"    {line}")
+            elif entry.get("explain_error"):
+                self.stdout.write(f"  EXPLAIN failed: {entry['explain_error']}")
+            self.stdout.write("")
+        self.stdout.write(
+            self.style.SUCCESS(f"{len(entries)} statement(s) at or over {threshold_ms:g} ms.")
+        )
@@ -0,0 +1,167 @@
+"""
+Prometheus metrics at ``GET /metrics``, enabled with ``JOBS_METRICS_ENABLED=1``
+(needs the ``prometheus_client`` package).
+
+``RequestMetricsMiddleware`` measures every request while this is on and
+passes the result to ``observe_request``:
+
+- ``jobs_http_request_duration_seconds{view,action,method,status}``: total
+  time, by URL name (``job-list``, ``job-detail``, ...) and viewset action;
+- ``jobs_http_request_db_duration_seconds`` and
+  ``jobs_http_request_db_queries`` (``{view,action}``): time in, and number
+  of, database queries per request;
+- ``jobs_db_pool_*{alias}``: size, idle connections and waiting requests of
+  each psycopg pool, sampled after every request.
+
+``jobs_db_connections_created_total{alias}`` counts new database
+connections, so compared with the request rate it shows how well
+connections are reused. ``jobs_job_events_total{event,status}`` counts job
+change events once their transaction commits; ``rate()`` over it gives
+creation and status transition rates. ``jobs_by_status{status}`` is read
+from the status counters when scraped.
+
+gunicorn workers are separate processes, each with its own metrics. With
+``PROMETHEUS_MULTIPROC_DIR`` set (to an empty directory, cleared when the
+server starts; see ``gunicorn.conf.py``), every worker writes its values
+to files there and a scrape of any worker aggregates them: counters and
+histograms are summed, pool gauges summed over live workers. Without it,
+each worker reports only itself. ``jobs_by_status`` comes from the database
+and is the same whichever worker answers.
+"""
+
+import os
+from typing import Any, Optional
+
+from django.db import connections
+from django.http import HttpRequest, HttpResponse
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+from prometheus_client.core import GaugeMetricFamily
+
+from jobs.selectors import get_job_status_summary
+
+QUERY_BUCKETS = (0, 1, 2, 3, 4, 5, 10, 20, 50, 100)
+
+REQUEST_DURATION = Histogram(
+    "jobs_http_request_duration_seconds",
+    "Time to produce the response, by view, action, method and status code.",
+    ["view", "action", "method", "status"],
+)
+REQUEST_DB_DURATION = Histogram(
+    "jobs_http_request_db_duration_seconds",
+    "Time spent in database queries per request.",
+    ["view", "action"],
+)
+REQUEST_DB_QUERIES = Histogram(
+    "jobs_http_request_db_queries",
+    "Database queries per request.",
+    ["view", "action"],
+    buckets=QUERY_BUCKETS,
+)
+CONNECTIONS_CREATED = Counter(
+    "jobs_db_connections_created",
+    "Database connections opened.",
+    ["alias"],
+)
+POOL_SIZE = Gauge(
+    "jobs_db_pool_size",
+    "Connections held by the pool, in use or idle.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+POOL_AVAILABLE = Gauge(
+    "jobs_db_pool_available",
+    "Idle connections in the pool.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+POOL_WAITING = Gauge(
+    "jobs_db_pool_waiting",
+    "Requests waiting for a pool connection.",
+    ["alias"],
+    multiprocess_mode="livesum",
+)
+JOB_EVENTS = Counter(
+    "jobs_job_events",
+    "Committed job change events, by event type and status.",
+    ["event", "status"],
+)
+
+
+class JobStatusCollector:
+    """``jobs_by_status``, read from the status counters on each scrape."""
+
+    def _family(self) -> GaugeMetricFamily:
+        return GaugeMetricFamily("jobs_by_status", "Jobs by current status.", labels=["status"])
+
+    def collect(self):
+        family = self._family()
+        for status_type, count in get_job_status_summary().items():
+            family.add_metric([status_type], count)
+        yield family
+
+    def describe(self):
+        # Without describe(), registering would collect, and so query.
+        return [self._family()]
+
+
+# Collectors that query the database are kept out of the process registry,
+# which the multiprocess collector replaces.
+_database_registry = CollectorRegistry()
+_database_registry.register(JobStatusCollector())
+
+
+def observe_request(
+    *,
+    view: Optional[str],
+    action: Optional[str],
+    method: str,
+    status: int,
+    timings: dict[str, Optional[float]],
+    queries: int,
+) -> None:
+    """Record one request; ``timings`` are ``RequestMetrics.finish()``'s."""
+    view = view or ""
+    action = action or ""
+    REQUEST_DURATION.labels(view, action, method, str(status)).observe(timings["total"] / 1000)
+    REQUEST_DB_DURATION.labels(view, action).observe(timings["db"] / 1000)
+    REQUEST_DB_QUERIES.labels(view, action).observe(queries)
+    for alias in connections:
+        pool = getattr(connections[alias], "pool", None)
+        if pool is not None:
+            stats = pool.get_stats()
+            POOL_SIZE.labels(alias).set(stats["pool_size"])
+            POOL_AVAILABLE.labels(alias).set(stats["pool_available"])
+            POOL_WAITING.labels(alias).set(stats["requests_waiting"])
+
+
+def count_connection(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """``connection_created`` receiver."""
+    CONNECTIONS_CREATED.labels(connection.alias).inc()
+
+
+def count_job_events(sender: Any, event_type: str, status_types: list[str], **kwargs: Any) -> None:
+    """``jobs.signals.job_events_committed`` receiver."""
+    for status_type in status_types:
+        JOB_EVENTS.labels(event_type, status_type).inc()
+
+
+def _process_registry() -> CollectorRegistry:
+    if os.environ.get("PROMETHEUS_MULTIPROC_DIR"):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return registry
+    return REGISTRY
+
+
+def metrics_view(request: HttpRequest) -> HttpResponse:
+    output = generate_latest(_process_registry()) + generate_latest(_database_registry)
+    return HttpResponse(output, content_type=CONTENT_TYPE_LATEST)
@@ -0,0 +1,37 @@
+# Generated by Django 5.1.5 on 2026-10-18 05:25
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_status_counts(apps, schema_editor):
+    Job = apps.get_model('jobs', 'Job')
+    JobStatusCount = apps.get_model('jobs', 'JobStatusCount')
+    counts = dict(
+        Job.objects.order_by()
+        .values_list('current_status_type')
+        .annotate(total=Count('id'))
+    )
+    JobStatusCount.objects.bulk_create(
+        JobStatusCount(status_type=status_type, count=counts.get(status_type, 0))
+        for status_type in ['PENDING', 'RUNNING', 'COMPLETED', 'FAILED']
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0002_job_name_unique'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobStatusCount',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status_type', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], max_length=20, unique=True)),
+                ('count', models.BigIntegerField(default=0)),
+            ],
+        ),
+        migrations.RunPython(populate_status_counts, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.1.5 on 2026-10-18 05:28
+
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without blocking writes, which cannot run in a
+    # transaction.
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0003_job_status_count'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['-updated_at'], name='idx_job_updated_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', '-updated_at'], name='idx_job_status_updated_desc'),
+        ),
+    ]
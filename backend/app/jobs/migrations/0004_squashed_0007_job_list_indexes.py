@@ -0,0 +1,119 @@
+# Squashes 0004-0007 for databases that have not applied them yet. The
+# updated_at indexes that 0004 added and 0007 replaced are never built, and
+# idx_job_created_desc is dropped only once its replacement exists. The
+# trigger and trigram index helpers are copied from 0005 and 0006.
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+CREATE_NOTIFY_TRIGGER = """
+CREATE FUNCTION jobs_jobevent_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('jobs_events', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_jobevent_notify
+AFTER INSERT ON jobs_jobevent
+FOR EACH STATEMENT EXECUTE FUNCTION jobs_jobevent_notify();
+"""
+
+DROP_NOTIFY_TRIGGER = """
+DROP TRIGGER IF EXISTS jobs_jobevent_notify ON jobs_jobevent;
+DROP FUNCTION IF EXISTS jobs_jobevent_notify();
+"""
+
+TRIGRAM_INDEX = "idx_job_name_upper_trgm"
+
+
+def create_trigram_index(apps, schema_editor):
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRIGRAM_INDEX} ON jobs_job "
+        "USING gin (UPPER(name::text) gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {TRIGRAM_INDEX}")
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without blocking writes, which cannot run in a
+    # transaction.
+    atomic = False
+
+    replaces = [
+        ('jobs', '0004_job_updated_at_indexes'),
+        ('jobs', '0005_job_event'),
+        ('jobs', '0006_job_name_search'),
+        ('jobs', '0007_job_list_filter_indexes'),
+    ]
+
+    dependencies = [
+        ('jobs', '0003_job_status_count'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('created', 'Created'), ('status_changed', 'Status changed'), ('deleted', 'Deleted')], max_length=20)),
+                ('job_id', models.BigIntegerField()),
+                ('job_name', models.CharField(max_length=255)),
+                ('status_type', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], max_length=20)),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['job_id', 'id'], name='idx_event_job_id'), models.Index(fields=['timestamp'], name='idx_event_ts')],
+            },
+        ),
+        migrations.RunSQL(CREATE_NOTIFY_TRIGGER, DROP_NOTIFY_TRIGGER),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'), name='idx_job_name_upper_prefix'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['-created_at', '-id'], name='idx_job_created_id_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', '-created_at', '-id'], name='idx_job_status_created_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('current_status_type__in', ['PENDING', 'RUNNING'])), fields=['-created_at', '-id'], name='idx_job_active_created_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['-updated_at', '-id'], name='idx_job_updated_id_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', '-updated_at', '-id'], name='idx_job_status_updated_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', 'name'], name='idx_job_status_name'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='job',
+            name='idx_job_created_desc',
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='current_status_type',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20),
+        ),
+    ]
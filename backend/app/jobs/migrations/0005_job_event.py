@@ -0,0 +1,49 @@
+# Generated by Django 5.1.5 on 2026-10-18 05:29
+
+from django.db import migrations, models
+
+# Wake SSE listeners once per inserting statement. NOTIFY is transactional, so
+# listeners only hear about events after they are committed and visible.
+CREATE_NOTIFY_TRIGGER = """
+CREATE FUNCTION jobs_jobevent_notify() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('jobs_events', '');
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER jobs_jobevent_notify
+AFTER INSERT ON jobs_jobevent
+FOR EACH STATEMENT EXECUTE FUNCTION jobs_jobevent_notify();
+"""
+
+DROP_NOTIFY_TRIGGER = """
+DROP TRIGGER IF EXISTS jobs_jobevent_notify ON jobs_jobevent;
+DROP FUNCTION IF EXISTS jobs_jobevent_notify();
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0004_job_updated_at_indexes'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobEvent',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('event_type', models.CharField(choices=[('created', 'Created'), ('status_changed', 'Status changed'), ('deleted', 'Deleted')], max_length=20)),
+                ('job_id', models.BigIntegerField()),
+                ('job_name', models.CharField(max_length=255)),
+                ('status_type', models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], max_length=20)),
+                ('timestamp', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['id'],
+                'indexes': [models.Index(fields=['job_id', 'id'], name='idx_event_job_id'), models.Index(fields=['timestamp'], name='idx_event_ts')],
+            },
+        ),
+        migrations.RunSQL(CREATE_NOTIFY_TRIGGER, DROP_NOTIFY_TRIGGER),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.1.5 on 2026-10-18 05:50
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.contrib.postgres.operations import AddIndexConcurrently
+from django.db import migrations, models
+
+TRIGRAM_INDEX = "idx_job_name_upper_trgm"
+
+
+def create_trigram_index(apps, schema_editor):
+    # pg_trgm ships in Postgres contrib and is missing from some builds;
+    # without it substring search still works, just without an index.
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+        if cursor.fetchone() is None:
+            return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {TRIGRAM_INDEX} ON jobs_job "
+        "USING gin (UPPER(name::text) gin_trgm_ops)"
+    )
+
+
+def drop_trigram_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {TRIGRAM_INDEX}")
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without blocking writes, which cannot run in a
+    # transaction.
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0005_job_event'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'), name='idx_job_name_upper_prefix'),
+        ),
+        migrations.RunPython(create_trigram_index, drop_trigram_index),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.1.5 on 2026-10-18 05:53
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without blocking writes, which cannot run in a
+    # transaction.
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0006_job_name_search'),
+    ]
+
+    operations = [
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['-created_at', '-id'], name='idx_job_created_id_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', '-created_at', '-id'], name='idx_job_status_created_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(condition=models.Q(('current_status_type__in', ['PENDING', 'RUNNING'])), fields=['-created_at', '-id'], name='idx_job_active_created_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['-updated_at', '-id'], name='idx_job_updated_id_desc'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', '-updated_at', '-id'], name='idx_job_status_updated_id'),
+        ),
+        AddIndexConcurrently(
+            model_name='job',
+            index=models.Index(fields=['current_status_type', 'name'], name='idx_job_status_name'),
+        ),
+        # Dropped once their replacements exist.
+        RemoveIndexConcurrently(
+            model_name='job',
+            name='idx_job_created_desc',
+        ),
+        RemoveIndexConcurrently(
+            model_name='job',
+            name='idx_job_updated_desc',
+        ),
+        RemoveIndexConcurrently(
+            model_name='job',
+            name='idx_job_status_updated_desc',
+        ),
+        migrations.AlterField(
+            model_name='job',
+            name='current_status_type',
+            field=models.CharField(choices=[('PENDING', 'Pending'), ('RUNNING', 'Running'), ('COMPLETED', 'Completed'), ('FAILED', 'Failed')], default='PENDING', max_length=20),
+        ),
+    ]
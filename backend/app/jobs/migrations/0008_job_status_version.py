@@ -0,0 +1,18 @@
+# Generated by Django 5.1.5 on 2026-10-18 06:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0007_job_list_filter_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='status_version',
+            field=models.PositiveBigIntegerField(default=0),
+        ),
+    ]
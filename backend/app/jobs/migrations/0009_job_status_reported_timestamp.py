@@ -0,0 +1,19 @@
+# Generated by Django 5.1.5 on 2026-10-18 06:31
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_job_status_version'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='jobstatus',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now),
+        ),
+    ]
@@ -0,0 +1,27 @@
+# Generated by Django 5.1.5 on 2026-10-18 06:55
+
+from django.contrib.postgres.operations import AddIndexConcurrently, RemoveIndexConcurrently
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    # Indexes are built without blocking writes, which cannot run in a
+    # transaction.
+    atomic = False
+
+    dependencies = [
+        ('jobs', '0009_job_status_reported_timestamp'),
+    ]
+
+    operations = [
+        # The new index is built before the old one is dropped, so history
+        # reads are never left without one.
+        AddIndexConcurrently(
+            model_name='jobstatus',
+            index=models.Index(fields=['job', '-timestamp', '-id'], name='idx_status_job_ts_id_desc'),
+        ),
+        RemoveIndexConcurrently(
+            model_name='jobstatus',
+            name='idx_status_job_ts_desc',
+        ),
+    ]
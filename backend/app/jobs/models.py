@@ -1,5 +1,8 @@
+from django.contrib.postgres.indexes import OpClass
 from django.db import models
-from jobs.enums import JobStatusType
+from django.db.models.functions import Upper
+from django.utils import timezone
+from jobs.enums import JobEventType, JobStatusType
 
 
 class Job(models.Model):
@@ -13,14 +16,48 @@ class Job(models.Model):
         max_length=20,
         choices=JobStatusType.choices,
         default=JobStatusType.PENDING,
-        db_index=True,
     )
     current_status_timestamp = models.DateTimeField(null=True, blank=True)
+    # Bumped by every status appended to the job's history, current or late;
+    # status updates compare and swap on it instead of locking the row, and
+    # the statuses endpoint validates on it.
+    status_version = models.PositiveBigIntegerField(default=0)
 
     class Meta:
         ordering = ["-created_at"]
         indexes = [
-            models.Index(fields=["-created_at"], name="idx_job_created_desc"),
+            # List filters and sorts. Each index ends in the list's ORDER BY
+            # (see selectors.SORT_ORDERINGS), so filtered pages are read in
+            # index order with no sort step; status equality comes first.
+            models.Index(fields=["-created_at", "-id"], name="idx_job_created_id_desc"),
+            models.Index(
+                fields=["current_status_type", "-created_at", "-id"],
+                name="idx_job_status_created_desc",
+            ),
+            # Unfinished jobs are the dashboard's usual multi-status view
+            # (status=PENDING,RUNNING), which an IN list cannot read in
+            # created_at order from the composite index above.
+            models.Index(
+                fields=["-created_at", "-id"],
+                name="idx_job_active_created_desc",
+                condition=models.Q(
+                    current_status_type__in=[JobStatusType.PENDING, JobStatusType.RUNNING]
+                ),
+            ),
+            # updated_since and sort=updated_at.
+            models.Index(fields=["-updated_at", "-id"], name="idx_job_updated_id_desc"),
+            models.Index(
+                fields=["current_status_type", "-updated_at", "-id"],
+                name="idx_job_status_updated_id",
+            ),
+            models.Index(fields=["current_status_type", "name"], name="idx_job_status_name"),
+            # Case-insensitive prefix search (name__istartswith). Substring
+            # search uses a trigram GIN index created in migration 0006
+            # where pg_trgm is available.
+            models.Index(
+                OpClass(Upper("name"), name="text_pattern_ops"),
+                name="idx_job_name_upper_prefix",
+            ),
         ]
 
     def __str__(self) -> str:
@@ -38,16 +75,55 @@ class JobStatus(models.Model):
         max_length=20,
         choices=JobStatusType.choices,
     )
-    timestamp = models.DateTimeField(auto_now_add=True)
+    # When the status was reached: now by default, or the time a worker
+    # reported for it.
+    timestamp = models.DateTimeField(default=timezone.now)
 
     class Meta:
         ordering = ["-timestamp"]
         indexes = [
             models.Index(
-                fields=["job", "-timestamp"],
-                name="idx_status_job_ts_desc",
+                # Matches the history order, (timestamp, id) newest first.
+                fields=["job", "-timestamp", "-id"],
+                name="idx_status_job_ts_id_desc",
             ),
         ]
 
     def __str__(self) -> str:
         return f"{self.job.name} → {self.status_type} @ {self.timestamp}"
+
+
+class JobStatusCount(models.Model):
+
+    # One row per status, kept in step with Job.current_status_type by the
+    # write services so the dashboard summary never scans Job.
+    status_type = models.CharField(
+        max_length=20,
+        choices=JobStatusType.choices,
+        unique=True,
+    )
+    count = models.BigIntegerField(default=0)
+
+    def __str__(self) -> str:
+        return f"{self.status_type}: {self.count}"
+
+
+class JobEvent(models.Model):
+
+    # Append-only change feed written by the services in the same transaction
+    # as the change. job_id is a plain column so deletion events outlive the job.
+    event_type = models.CharField(max_length=20, choices=JobEventType.choices)
+    job_id = models.BigIntegerField()
+    job_name = models.CharField(max_length=255)
+    status_type = models.CharField(max_length=20, choices=JobStatusType.choices)
+    timestamp = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ["id"]
+        indexes = [
+            models.Index(fields=["job_id", "id"], name="idx_event_job_id"),
+            models.Index(fields=["timestamp"], name="idx_event_ts"),
+        ]
+
+    def __str__(self) -> str:
+        return f"#{self.pk} {self.event_type} job={self.job_id} ({self.status_type})"
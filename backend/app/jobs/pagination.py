@@ -0,0 +1,265 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any, Optional, Union
+
+from django.core.exceptions import ValidationError
+from django.db.models import Model, Q, QuerySet
+from rest_framework.pagination import BasePagination, LimitOffsetPagination
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from jobs.selectors import aestimate_count, estimate_count
+
+COUNT_MODES = ["exact", "estimated", "none"]
+
+
+class JobsLimitOffsetPagination(LimitOffsetPagination):
+    """
+    Limit/offset pagination with a selectable total count.
+
+    ``?count=exact`` (the default) runs ``COUNT(*)`` as before,
+    ``?count=estimated`` uses planner statistics and ``?count=none`` skips the
+    total entirely. In the non-exact modes one extra row is fetched to decide
+    whether a next page exists, and ``count_is_estimate`` in the response
+    tells clients whether ``count`` is approximate.
+    """
+
+    default_limit = 20
+    max_limit = 100
+    count_query_param = "count"
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: Any = None,
+    ) -> Optional[list[Model]]:
+        if not self._start(request):
+            return None
+        if self.count_mode == "exact":
+            return super().paginate_queryset(queryset, request, view)
+
+        rows = list(queryset[self.offset : self.offset + self.limit + 1])
+        estimate = estimate_count(queryset) if self.count_mode == "estimated" else None
+        return self._finish(rows, estimate)
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> Optional[list[Model]]:
+        """``paginate_queryset`` for async views, on Django's async ORM."""
+        if not self._start(request):
+            return None
+        if self.count_mode == "exact":
+            self.count = await queryset.acount()
+            if self.count == 0 or self.offset > self.count:
+                return []
+            return [row async for row in queryset[self.offset : self.offset + self.limit]]
+
+        rows = [row async for row in queryset[self.offset : self.offset + self.limit + 1]]
+        estimate = await aestimate_count(queryset) if self.count_mode == "estimated" else None
+        return self._finish(rows, estimate)
+
+    def _start(self, request: Request) -> bool:
+        self.count_mode = request.query_params.get(self.count_query_param, "exact")
+        if self.count_mode not in COUNT_MODES:
+            raise ValueError(f"Invalid count parameter. Allowed: {COUNT_MODES}")
+        self.count_is_estimate = False
+        self.request = request
+        self.limit = self.get_limit(request)
+        if self.limit is None:
+            return False
+        self.offset = self.get_offset(request)
+        return True
+
+    def _finish(self, rows: list[Model], estimate: Optional[tuple[int, bool]]) -> list[Model]:
+        self.has_next = len(rows) > self.limit
+        rows = rows[: self.limit]
+
+        if estimate is None:
+            self.count = None
+        else:
+            estimate, self.count_is_estimate = estimate
+            # Never report fewer rows than the page itself proves exist.
+            self.count = max(estimate, self.offset + len(rows) + int(self.has_next))
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response(
+            {
+                "count": self.count,
+                "count_is_estimate": self.count_is_estimate,
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_next_link(self) -> Optional[str]:
+        if self.count_mode == "exact":
+            return super().get_next_link()
+        if not self.has_next:
+            return None
+
+        url = self.request.build_absolute_uri()
+        url = replace_query_param(url, self.limit_query_param, self.limit)
+        return replace_query_param(url, self.offset_query_param, self.offset + self.limit)
+
+
+class JobsKeysetPagination(BasePagination):
+    """
+    Keyset (cursor) pagination on ``(<sort column>, id)``.
+
+    The sort column is taken from the queryset ordering (or the model's
+    ``Meta.ordering``) and ``id`` is appended as a tie-breaker in the same
+    direction. Each page is fetched with a range condition on the last row
+    seen instead of an ``OFFSET``, so page cost does not grow with depth and
+    no ``COUNT(*)`` is issued.
+    """
+
+    default_limit = 20
+    max_limit = 100
+    limit_query_param = "limit"
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+
+    def paginate_queryset(
+        self,
+        queryset: QuerySet,
+        request: Request,
+        view: Any = None,
+    ) -> list[Model]:
+        queryset = self._start(queryset, request)
+        return self._finish(list(queryset[: self.limit + 1]))
+
+    async def apaginate_queryset(self, queryset: QuerySet, request: Request) -> list[Model]:
+        """``paginate_queryset`` for async views, on Django's async ORM."""
+        queryset = self._start(queryset, request)
+        return self._finish([row async for row in queryset[: self.limit + 1]])
+
+    def _start(self, queryset: QuerySet, request: Request) -> QuerySet:
+        self.request = request
+        self.limit = self.get_limit(request)
+        self.field, descending = self._get_sort_key(queryset)
+
+        self.position, self.reverse = self.decode_cursor(request)
+        forward_descending = descending != self.reverse
+        prefix = "-" if forward_descending else ""
+        queryset = queryset.order_by(f"{prefix}{self.field}", f"{prefix}id")
+        if self.position is not None:
+            queryset = self._filter_after(queryset, self.position, forward_descending)
+        return queryset
+
+    def _finish(self, rows: list[Model]) -> list[Model]:
+        has_more = len(rows) > self.limit
+        rows = rows[: self.limit]
+
+        if self.reverse:
+            rows.reverse()
+            self.has_next = self.position is not None
+            self.has_previous = has_more
+        else:
+            self.has_next = has_more
+            self.has_previous = self.position is not None
+
+        self.page = rows
+        return rows
+
+    def get_paginated_response(self, data: Any) -> Response:
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": self.get_previous_link(),
+                "results": data,
+            }
+        )
+
+    def get_limit(self, request: Request) -> int:
+        try:
+            limit = int(request.query_params[self.limit_query_param])
+        except (KeyError, ValueError):
+            return self.default_limit
+        if limit <= 0:
+            return self.default_limit
+        return min(limit, self.max_limit)
+
+    def get_next_link(self) -> Optional[str]:
+        if not self.has_next or not self.page:
+            return None
+        return self._build_link(self._position_of(self.page[-1]), reverse=False)
+
+    def get_previous_link(self) -> Optional[str]:
+        if not self.has_previous or not self.page:
+            return None
+        return self._build_link(self._position_of(self.page[0]), reverse=True)
+
+    def decode_cursor(self, request: Request) -> tuple[Optional[list[Any]], bool]:
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            field = payload["f"]
+            position = payload["p"]
+            reverse = payload["r"]
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError):
+            raise ValueError(self.invalid_cursor_message)
+
+        if (
+            field != self.field
+            or not isinstance(position, list)
+            or len(position) != 2
+            or not isinstance(position[1], int)
+            or not isinstance(reverse, bool)
+        ):
+            raise ValueError(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, position: list[Any], reverse: bool) -> str:
+        payload = {"f": self.field, "p": position, "r": reverse}
+        raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(raw).decode("ascii")
+
+    @staticmethod
+    def _get_sort_key(queryset: QuerySet) -> tuple[str, bool]:
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        first = ordering[0]
+        return first.lstrip("-"), first.startswith("-")
+
+    def _filter_after(
+        self,
+        queryset: QuerySet,
+        position: list[Any],
+        descending: bool,
+    ) -> QuerySet:
+        value, pk = position
+        op = "lt" if descending else "gt"
+        # The redundant inclusive bound lets Postgres walk the sort-column
+        # index as a range scan instead of evaluating the OR row by row.
+        try:
+            return queryset.filter(**{f"{self.field}__{op}e": value}).filter(
+                Q(**{f"{self.field}__{op}": value}) | Q(**{self.field: value, f"id__{op}": pk})
+            )
+        except ValidationError:
+            raise ValueError(self.invalid_cursor_message)
+
+    def _position_of(self, row: Union[Model, dict[str, Any]]) -> list[Any]:
+        # Pages may hold model instances or .values() dicts.
+        if isinstance(row, dict):
+            value, pk = row[self.field], row["id"]
+        else:
+            value, pk = getattr(row, self.field), row.pk
+        if isinstance(value, datetime):
+            # isoformat() keeps microseconds; DjangoJSONEncoder would truncate them.
+            value = value.isoformat()
+        return [value, pk]
+
+    def _build_link(self, position: list[Any], reverse: bool) -> str:
+        url = self.request.build_absolute_uri()
+        url = remove_query_param(url, "offset")
+        return replace_query_param(
+            url,
+            self.cursor_query_param,
+            self.encode_cursor(position, reverse),
+        )
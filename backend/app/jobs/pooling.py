@@ -0,0 +1,25 @@
+"""
+Connection reuse statistics for ``GET /api/jobs/db-stats/``.
+
+Connections, and psycopg pools, belong to a single worker process, so the
+figures describe whichever gunicorn worker served the request.
+"""
+
+from typing import Any
+
+from django.db import connections
+
+
+def get_stats() -> dict[str, Any]:
+    stats = {}
+    for alias in connections:
+        connection = connections[alias]
+        pool = getattr(connection, "pool", None)
+        stats[alias] = {
+            "pooled": pool is not None,
+            "conn_max_age": connection.settings_dict["CONN_MAX_AGE"],
+            "health_checks": connection.settings_dict["CONN_HEALTH_CHECKS"],
+            "connected": connection.connection is not None,
+            "pool": pool.get_stats() if pool is not None else None,
+        }
+    return stats
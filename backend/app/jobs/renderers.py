@@ -0,0 +1,38 @@
+import json
+
+from rest_framework.renderers import BaseRenderer
+
+
+class ServerSentEventRenderer(BaseRenderer):
+    """
+    Lets DRF negotiate ``text/event-stream`` for streaming endpoints.
+
+    Streams are returned as ``StreamingHttpResponse`` and bypass rendering;
+    only error payloads reach ``render``, as a single ``error`` event.
+    """
+
+    media_type = "text/event-stream"
+    format = "sse"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return f"event: error\ndata: {json.dumps(data)}\n\n".encode(self.charset)
+
+
+class _ExportRenderer(BaseRenderer):
+    # Exports stream a StreamingHttpResponse; only error payloads are
+    # rendered here, as JSON.
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode(self.charset)
+
+
+class NDJSONRenderer(_ExportRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+
+
+class CSVRenderer(_ExportRenderer):
+    media_type = "text/csv"
+    format = "csv"
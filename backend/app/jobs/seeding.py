@@ -0,0 +1,248 @@
+"""
+Bulk generation of synthetic jobs and status histories for load testing.
+
+Rows are streamed to Postgres with ``COPY ... FROM STDIN`` in chunks of
+``chunk_size`` jobs, one transaction per chunk, so memory stays flat and an
+interrupted load leaves only whole jobs behind. Job ids are reserved from
+the table's sequence up front, which lets each chunk copy its jobs and then
+their statuses without reading anything back.
+
+Each job starts ``PENDING``, alternates ``RUNNING``/``PENDING`` (retries)
+and ends in a status drawn from the status mix. History depth follows a
+geometric distribution with the given mean, capped at ``history_max``.
+Creation times are spread uniformly over the last ``days`` days and
+statuses follow at exponentially distributed gaps, never later than now.
+The denormalized ``current_status_*`` columns are written from the last
+generated status, so they match the history without a fix-up pass. The
+status counters are rebuilt and both tables analyzed at the end.
+"""
+
+import math
+import random
+from datetime import datetime, timedelta
+from typing import Callable, Mapping, Optional
+
+from django.db import connections, router, transaction
+from django.utils import timezone
+
+from jobs.caching import invalidate_job_lists
+from jobs.enums import JobStatusType
+from jobs.models import Job, JobStatus
+from jobs.services import rebuild_job_status_counts
+
+DEFAULT_STATUS_MIX = {
+    JobStatusType.COMPLETED: 60,
+    JobStatusType.FAILED: 10,
+    JobStatusType.RUNNING: 20,
+    JobStatusType.PENDING: 10,
+}
+DEFAULT_CHUNK_SIZE = 10_000
+
+JOB_COPY_COLUMNS = [
+    "id",
+    "name",
+    "created_at",
+    "updated_at",
+    "current_status_type",
+    "current_status_timestamp",
+    "status_version",
+]
+STATUS_COPY_COLUMNS = ["job_id", "status_type", "timestamp"]
+
+
+def parse_status_mix(value: str) -> dict[str, float]:
+    """Parse ``"COMPLETED=60,FAILED=10,..."`` into positive weights."""
+    mix: dict[str, float] = {}
+    for part in value.split(","):
+        status_type, sep, weight = part.strip().partition("=")
+        status_type = status_type.strip().upper()
+        if not sep or status_type not in JobStatusType.values:
+            raise ValueError(
+                f"Invalid status mix entry '{part.strip()}'. "
+                f"Use STATUS=WEIGHT with STATUS one of: {', '.join(JobStatusType.values)}."
+            )
+        try:
+            mix[status_type] = float(weight)
+        except ValueError:
+            raise ValueError(f"Invalid weight '{weight}' for {status_type}.") from None
+        if mix[status_type] < 0:
+            raise ValueError(f"Weight for {status_type} must not be negative.")
+    if not any(mix.values()):
+        raise ValueError("At least one status needs a positive weight.")
+    return mix
+
+
+def _copy_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\t", "\\t").replace("\n", "\\n").replace("\r", "\\r")
+
+
+def _secondary_indexes(cursor, tables: list[str]) -> list[tuple[str, str]]:
+    """``(name, definition)`` of the tables' indexes that back no constraint."""
+    cursor.execute(
+        """
+        SELECT i.indexrelid::regclass::text, pg_get_indexdef(i.indexrelid)
+        FROM pg_index i
+        WHERE i.indrelid = ANY(%s::regclass[])
+          AND NOT EXISTS (SELECT 1 FROM pg_constraint c WHERE c.conindid = i.indexrelid)
+        """,
+        [tables],
+    )
+    return cursor.fetchall()
+
+
+def _copy_sql(model, columns: list[str]) -> str:
+    return f"COPY {model._meta.db_table} ({', '.join(columns)}) FROM STDIN"
+
+
+class _HistoryGenerator:
+    def __init__(
+        self,
+        *,
+        rng: random.Random,
+        status_mix: Mapping[str, float],
+        history_mean: float,
+        history_max: int,
+        days: float,
+        step_seconds: float,
+        now: datetime,
+    ) -> None:
+        self.rng = rng
+        self.final_statuses = [str(status_type) for status_type in status_mix]
+        self.final_weights = list(status_mix.values())
+        # Geometric depth >= 1 with the requested mean.
+        self.log_continue = math.log(1 - 1 / history_mean) if history_mean > 1 else None
+        self.history_max = history_max
+        self.span_seconds = days * 86400
+        self.step_seconds = step_seconds
+        self.now = now
+
+    def depth(self) -> int:
+        if self.log_continue is None:
+            return 1
+        extra = int(math.log(1 - self.rng.random()) / self.log_continue)
+        return min(1 + extra, self.history_max)
+
+    def history(self) -> list[tuple[str, datetime]]:
+        rng = self.rng
+        depth = self.depth()
+        final = rng.choices(self.final_statuses, self.final_weights)[0]
+        timestamp = self.now - timedelta(seconds=rng.random() * self.span_seconds)
+        history = [(JobStatusType.PENDING.value if depth > 1 else final, timestamp)]
+        for step in range(1, depth):
+            if step == depth - 1:
+                status_type = final
+            else:
+                status_type = JobStatusType.RUNNING.value if step % 2 else JobStatusType.PENDING.value
+            timestamp = min(timestamp + timedelta(seconds=rng.expovariate(1 / self.step_seconds)), self.now)
+            history.append((status_type, timestamp))
+        return history
+
+
+def _copy_chunk(
+    cursor,
+    job_ids: list[int],
+    histories: list[list[tuple[str, datetime]]],
+    name_prefix: str,
+) -> None:
+    # Rows are formatted as COPY text directly, which is several times
+    # faster than write_row(); only the name prefix needs escaping.
+    with cursor.copy(_copy_sql(Job, JOB_COPY_COLUMNS)) as copy:
+        copy.write(
+            "".join(
+                # updated_at is the time of the last status.
+                f"{job_id}\t{name_prefix}-{job_id}\t{history[0][1]}\t{history[-1][1]}"
+                f"\t{history[-1][0]}\t{history[-1][1]}\t0\n"
+                for job_id, history in zip(job_ids, histories)
+            )
+        )
+    with cursor.copy(_copy_sql(JobStatus, STATUS_COPY_COLUMNS)) as copy:
+        copy.write(
+            "".join(
+                f"{job_id}\t{status_type}\t{timestamp}\n"
+                for job_id, history in zip(job_ids, histories)
+                for status_type, timestamp in history
+            )
+        )
+
+
+def seed_jobs(
+    *,
+    count: int,
+    status_mix: Optional[Mapping[str, float]] = None,
+    history_mean: float = 4.0,
+    history_max: int = 50,
+    days: float = 30.0,
+    step_seconds: float = 300.0,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    prefix: str = "seed",
+    random_seed: Optional[int] = None,
+    defer_indexes: bool = False,
+    progress: Optional[Callable[[int, int], None]] = None,
+) -> tuple[int, int]:
+    """
+    Insert ``count`` jobs named ``<prefix>-<id>`` with generated histories.
+
+    With ``defer_indexes`` the tables' secondary indexes are dropped for the
+    load and rebuilt afterwards, which is much faster for loads that are
+    large relative to the existing data. Other writers see the tables
+    without those indexes in the meantime, so use it on a dedicated
+    database. ``progress(jobs_done, statuses_done)`` is called after each
+    chunk. Returns ``(jobs_created, statuses_created)``.
+    """
+    if history_mean < 1:
+        raise ValueError("history_mean must be at least 1.")
+    if history_max < 1:
+        raise ValueError("history_max must be at least 1.")
+
+    generator = _HistoryGenerator(
+        rng=random.Random(random_seed),
+        status_mix=status_mix or DEFAULT_STATUS_MIX,
+        history_mean=history_mean,
+        history_max=history_max,
+        days=days,
+        step_seconds=step_seconds,
+        now=timezone.now(),
+    )
+    alias = router.db_for_write(Job)
+    connection = connections[alias]
+    job_table = Job._meta.db_table
+    name_prefix = _copy_escape(prefix)
+    tables = [job_table, JobStatus._meta.db_table]
+    jobs_done = statuses_done = 0
+
+    deferred: list[tuple[str, str]] = []
+    if defer_indexes:
+        with transaction.atomic(using=alias), connection.cursor() as cursor:
+            deferred = _secondary_indexes(cursor, tables)
+            for index_name, _ in deferred:
+                cursor.execute(f"DROP INDEX {index_name}")
+    try:
+        while jobs_done < count:
+            size = min(chunk_size, count - jobs_done)
+            with transaction.atomic(using=alias), connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT nextval(pg_get_serial_sequence(%s, 'id')) FROM generate_series(1, %s)",
+                    [job_table, size],
+                )
+                job_ids = [row[0] for row in cursor.fetchall()]
+                histories = [generator.history() for _ in job_ids]
+                _copy_chunk(cursor, job_ids, histories, name_prefix)
+            jobs_done += size
+            statuses_done += sum(len(history) for history in histories)
+            if progress is not None:
+                progress(jobs_done, statuses_done)
+    finally:
+        # Restored even if the load fails part-way.
+        if deferred and connection.in_atomic_block:
+            # Inside a caller's transaction the deferred FK checks are still
+            # pending, and CREATE INDEX refuses to run until they have fired.
+            connection.check_constraints()
+        with connection.cursor() as cursor:
+            for _, definition in deferred:
+                cursor.execute(definition)
+
+    with connection.cursor() as cursor:
+        cursor.execute(f"ANALYZE {job_table}, {JobStatus._meta.db_table}")
+    rebuild_job_status_counts()
+    invalidate_job_lists()
+    return jobs_done, statuses_done
@@ -1,31 +1,151 @@
-from typing import Optional
+import json
+from datetime import datetime, time
+from typing import Any, Optional
 
-from django.db.models import QuerySet
+from django.db import connections, router
+from django.db.models import Max, Q, QuerySet
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
 
 from jobs.enums import JobStatusType
-from jobs.models import Job, JobStatus
+from jobs.models import Job, JobEvent, JobStatus, JobStatusCount
 
-ALLOWED_SORTS = ["name", "-name", "created_at", "-created_at"]
+# Sort parameter -> ORDER BY. created_at and updated_at ties are broken by id
+# so offset pages are stable; each ordering matches the column order of the
+# Job indexes, which is what lets filtered pages skip the sort step.
+SORT_ORDERINGS = {
+    "name": ["name"],
+    "-name": ["-name"],
+    "created_at": ["created_at", "id"],
+    "-created_at": ["-created_at", "-id"],
+    "updated_at": ["updated_at", "id"],
+    "-updated_at": ["-updated_at", "-id"],
+}
+ALLOWED_SORTS = list(SORT_ORDERINGS)
+# Both are case-insensitive. "prefix" uses the UPPER(name) text_pattern_ops
+# btree; "contains" uses the trigram GIN index where pg_trgm is installed.
+SEARCH_MODES = ["contains", "prefix"]
+
+# Below this many planner-estimated rows an exact COUNT(*) is cheap, so
+# estimate_count() returns the exact figure instead.
+EXACT_COUNT_THRESHOLD = 1000
+
+# ?include=statuses embeds each job's newest statuses, this many by default.
+DEFAULT_EMBEDDED_STATUSES = 10
+MAX_EMBEDDED_STATUSES = 100
+
+# The newest statuses of each job, in one statement for a whole page: a
+# LATERAL subquery per id reads that job's statuses by index and keeps the
+# newest, so the cost follows the page, not the table. Rows come back
+# grouped by job, newest first.
+LATEST_STATUSES_SQL = f"""
+SELECT s.id, s.job_id, s.status_type, s.timestamp
+FROM unnest(%(job_ids)s::bigint[]) AS j(id)
+CROSS JOIN LATERAL (
+    SELECT id, job_id, status_type, timestamp
+    FROM {JobStatus._meta.db_table}
+    WHERE job_id = j.id
+    ORDER BY timestamp DESC, id DESC
+    LIMIT %(limit)s
+) AS s
+"""
+
+
+def validate_status_filter(status: str) -> str:
+    allowed_statuses = {choice[0] for choice in JobStatusType.choices}
+    if status not in allowed_statuses:
+        raise ValueError(
+            f"Invalid status filter. Allowed: {sorted(allowed_statuses)}"
+        )
+    return status
+
+
+def parse_status_filter(value: str) -> list[str]:
+    """Validate a comma-separated status filter, e.g. ``RUNNING,FAILED``."""
+    return sorted({validate_status_filter(part.strip()) for part in value.split(",")})
+
+
+def parse_datetime_filter(name: str, value: str) -> datetime:
+    """
+    Parse an ISO 8601 datetime or date query parameter. Naive values and
+    dates (taken as midnight) are in the current time zone.
+    """
+    parsed = parse_datetime(value)
+    if parsed is None:
+        date = parse_date(value)
+        if date is None:
+            raise ValueError(f"Invalid {name} parameter. Expected an ISO 8601 date or datetime.")
+        parsed = datetime.combine(date, time.min)
+    if timezone.is_naive(parsed):
+        parsed = timezone.make_aware(parsed)
+    return parsed
+
+
+def parse_embedded_statuses(include: Optional[str], statuses_limit: Optional[str]) -> Optional[int]:
+    """
+    Validate ``include`` and ``statuses_limit`` query parameters. Return how
+    many of each job's newest statuses to embed, or ``None`` for none.
+    """
+    if include is None:
+        if statuses_limit is not None:
+            raise ValueError("The statuses_limit parameter requires include=statuses.")
+        return None
+    if include != "statuses":
+        raise ValueError("Invalid include parameter. Allowed: ['statuses']")
+    if statuses_limit is None:
+        return DEFAULT_EMBEDDED_STATUSES
+    try:
+        limit = int(statuses_limit)
+    except ValueError:
+        limit = 0
+    if not 1 <= limit <= MAX_EMBEDDED_STATUSES:
+        raise ValueError(
+            f"Invalid statuses_limit parameter. It must be an integer from 1 to {MAX_EMBEDDED_STATUSES}."
+        )
+    return limit
 
 
 def get_jobs_list(
     *,
     status: Optional[str] = None,
     sort: str = "-created_at",
+    q: Optional[str] = None,
+    match: str = "contains",
+    created_after: Optional[datetime] = None,
+    created_before: Optional[datetime] = None,
+    updated_since: Optional[datetime] = None,
 ) -> QuerySet[Job]:
+    """
+    ``status`` may list several statuses separated by commas. The creation
+    window is half-open (``created_after <= created_at < created_before``)
+    and ``updated_since`` is inclusive.
+    """
+    # Builds the queryset without evaluating it, so async views use it as is.
     qs = Job.objects.all()
 
     if status is not None:
-        allowed_statuses = {choice[0] for choice in JobStatusType.choices}
-        if status not in allowed_statuses:
-            raise ValueError(
-                f"Invalid status filter. Allowed: {sorted(allowed_statuses)}"
-            )
-        qs = qs.filter(current_status_type=status)
+        statuses = parse_status_filter(status)
+        if len(statuses) == 1:
+            qs = qs.filter(current_status_type=statuses[0])
+        else:
+            qs = qs.filter(current_status_type__in=statuses)
+
+    if created_after is not None:
+        qs = qs.filter(created_at__gte=created_after)
+    if created_before is not None:
+        qs = qs.filter(created_at__lt=created_before)
+    if updated_since is not None:
+        qs = qs.filter(updated_at__gte=updated_since)
 
-    if sort not in ALLOWED_SORTS:
+    if match not in SEARCH_MODES:
+        raise ValueError(f"Invalid match parameter. Allowed: {SEARCH_MODES}")
+    if q:
+        lookup = "name__istartswith" if match == "prefix" else "name__icontains"
+        qs = qs.filter(**{lookup: q})
+
+    if sort not in SORT_ORDERINGS:
         raise ValueError(f"Invalid sort parameter. Allowed: {ALLOWED_SORTS}")
-    qs = qs.order_by(sort)
+    qs = qs.order_by(*SORT_ORDERINGS[sort])
 
     return qs
 
@@ -34,5 +154,95 @@ def get_job_by_id(*, job_id: int) -> Job:
     return Job.objects.get(pk=job_id)
 
 
+async def aget_job_by_id(*, job_id: int) -> Job:
+    return await Job.objects.aget(pk=job_id)
+
+
 def get_job_status_history(*, job_id: int) -> QuerySet[JobStatus]:
     return JobStatus.objects.filter(job_id=job_id)
+
+
+def get_status_history_for_jobs(jobs: QuerySet[Job]) -> QuerySet[JobStatus]:
+    """Statuses of ``jobs`` grouped by job, newest first within each job."""
+    return JobStatus.objects.filter(job__in=jobs.order_by().values("id")).order_by(
+        "job_id", "-timestamp", "-id"
+    )
+
+
+def get_latest_statuses_by_job(*, job_ids: list[int], limit: int) -> dict[int, list[dict[str, Any]]]:
+    """
+    Up to ``limit`` newest statuses (``id``, ``status_type``, ``timestamp``)
+    of each job, newest first. Jobs without statuses are left out.
+    """
+    statuses: dict[int, list[dict[str, Any]]] = {}
+    if not job_ids:
+        return statuses
+    with connections[router.db_for_read(JobStatus)].cursor() as cursor:
+        cursor.execute(LATEST_STATUSES_SQL, {"job_ids": job_ids, "limit": limit})
+        for status_id, job_id, status_type, timestamp in cursor.fetchall():
+            statuses.setdefault(job_id, []).append(
+                {"id": status_id, "status_type": status_type, "timestamp": timestamp}
+            )
+    return statuses
+
+
+def get_latest_job_event_id() -> int:
+    return JobEvent.objects.aggregate(latest=Max("id"))["latest"] or 0
+
+
+def get_job_event_ids(*, after_id: int, include_ids: list[int], limit: int) -> list[int]:
+    # Unfiltered on purpose: the event stream needs the full id sequence to
+    # spot ids that are still in flight.
+    return list(
+        JobEvent.objects.filter(Q(id__gt=after_id) | Q(id__in=include_ids))
+        .order_by("id")
+        .values_list("id", flat=True)[:limit]
+    )
+
+
+def get_job_events(
+    *,
+    ids: list[int],
+    job_id: Optional[int] = None,
+    status: Optional[str] = None,
+) -> QuerySet[JobEvent]:
+    qs = JobEvent.objects.filter(id__in=ids)
+    if job_id is not None:
+        qs = qs.filter(job_id=job_id)
+    if status is not None:
+        qs = qs.filter(status_type=validate_status_filter(status))
+    return qs.order_by("id")
+
+
+def get_job_status_summary() -> dict[str, int]:
+    counts = dict.fromkeys(JobStatusType.values, 0)
+    counts.update(JobStatusCount.objects.values_list("status_type", "count"))
+    return counts
+
+
+def estimate_count(queryset: QuerySet) -> tuple[int, bool]:
+    """
+    Return ``(count, is_estimate)`` for ``queryset``.
+
+    The row estimate comes from the Postgres planner (``EXPLAIN``), which
+    costs about as much as planning the query. Small results fall back to an
+    exact ``COUNT(*)``.
+    """
+    estimate = _plan_rows(queryset.order_by().explain(format="json"))
+    if estimate < EXACT_COUNT_THRESHOLD:
+        return queryset.count(), False
+    return estimate, True
+
+
+async def aestimate_count(queryset: QuerySet) -> tuple[int, bool]:
+    estimate = _plan_rows(await queryset.order_by().aexplain(format="json"))
+    if estimate < EXACT_COUNT_THRESHOLD:
+        return await queryset.acount(), False
+    return estimate, True
+
+
+def _plan_rows(explain_output: str) -> int:
+    plan = json.loads(explain_output)
+    if isinstance(plan, list):
+        plan = plan[0]
+    return int(plan["Plan"]["Plan Rows"])
@@ -1,10 +1,30 @@
+from datetime import datetime, timedelta, tzinfo
+from typing import Any, Iterable, Optional
+
+from django.utils import timezone
 from rest_framework import serializers
 
 from jobs.enums import JobStatusType
+from jobs.instrumentation import InstrumentedSerializerMixin, timed_serialization
 from jobs.models import Job, JobStatus
 
 
-class JobStatusSerializer(serializers.ModelSerializer):
+def format_api_datetime(value: Optional[datetime], tz: Optional[tzinfo] = None) -> Optional[str]:
+    """
+    Format ``value`` exactly as DRF's ``DateTimeField`` does for this API.
+
+    Pass ``tz`` (the current time zone) when formatting many values: looking
+    it up per value dominates the cost of this function.
+    """
+    if value is None:
+        return None
+    text = value.astimezone(tz or timezone.get_current_timezone()).isoformat()
+    if text.endswith("+00:00"):
+        text = text[:-6] + "Z"
+    return text
+
+
+class JobStatusSerializer(InstrumentedSerializerMixin, serializers.ModelSerializer):
 
     class Meta:
         model = JobStatus
@@ -12,7 +32,7 @@ class JobStatusSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class JobListSerializer(serializers.ModelSerializer):
+class JobListSerializer(InstrumentedSerializerMixin, serializers.ModelSerializer):
 
     class Meta:
         model = Job
@@ -27,7 +47,50 @@ class JobListSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class JobDetailSerializer(serializers.ModelSerializer):
+JOB_LIST_FIELDS = JobListSerializer.Meta.fields
+
+
+def serialize_job_list_row(row: dict[str, Any], tz: Optional[tzinfo] = None) -> dict[str, Any]:
+    """
+    Fast equivalent of ``JobListSerializer(job).data`` for a row from
+    ``.values(*JOB_LIST_FIELDS)``.
+
+    Skips model instantiation and DRF's per-field ``to_representation``
+    while producing the same keys, order and formatting, so the rendered
+    JSON is byte-identical.
+    """
+    tz = tz or timezone.get_current_timezone()
+    return {
+        "id": row["id"],
+        "name": row["name"],
+        "current_status_type": row["current_status_type"],
+        "current_status_timestamp": format_api_datetime(row["current_status_timestamp"], tz),
+        "created_at": format_api_datetime(row["created_at"], tz),
+        "updated_at": format_api_datetime(row["updated_at"], tz),
+    }
+
+
+def serialize_job_list_rows(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    tz = timezone.get_current_timezone()
+    return timed_serialization(lambda: [serialize_job_list_row(row, tz) for row in rows])
+
+
+def serialize_job_status_rows(rows: Iterable[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Fast equivalent of ``JobStatusSerializer(statuses, many=True).data``."""
+    tz = timezone.get_current_timezone()
+    return timed_serialization(
+        lambda: [
+            {
+                "id": row["id"],
+                "status_type": row["status_type"],
+                "timestamp": format_api_datetime(row["timestamp"], tz),
+            }
+            for row in rows
+        ]
+    )
+
+
+class JobDetailSerializer(InstrumentedSerializerMixin, serializers.ModelSerializer):
 
     class Meta:
         model = Job
@@ -42,7 +105,7 @@ class JobDetailSerializer(serializers.ModelSerializer):
         read_only_fields = fields
 
 
-class JobCreateSerializer(serializers.Serializer):
+class JobCreateSerializer(InstrumentedSerializerMixin, serializers.Serializer):
 
     name = serializers.CharField(max_length=255, min_length=1)
 
@@ -50,10 +113,44 @@ class JobCreateSerializer(serializers.Serializer):
         cleaned = value.strip()
         if not cleaned:
             raise serializers.ValidationError("Job name cannot be empty or whitespace only.")
-        if Job.objects.filter(name=cleaned).exists():
-            raise serializers.ValidationError("A job with this name already exists.")
+        # Uniqueness is enforced by the INSERT (see services.create_job).
         return cleaned
 
 
-class JobUpdateStatusSerializer(serializers.Serializer):
+class JobBulkCreateSerializer(InstrumentedSerializerMixin, serializers.Serializer):
+
+    MAX_JOBS = 5000
+
+    names = serializers.ListField(
+        child=serializers.CharField(max_length=255, min_length=1),
+        allow_empty=False,
+        max_length=MAX_JOBS,
+    )
+    all_or_nothing = serializers.BooleanField(default=True)
+
+
+# How far ahead of the server clock a reported status timestamp may be. A
+# far-future timestamp would pin the job's current status until that time.
+MAX_CLOCK_SKEW = timedelta(minutes=5)
+
+
+def validate_reported_timestamp(value: datetime) -> datetime:
+    if value > timezone.now() + MAX_CLOCK_SKEW:
+        raise serializers.ValidationError("Timestamp cannot be in the future.")
+    return value
+
+
+class JobUpdateStatusSerializer(InstrumentedSerializerMixin, serializers.Serializer):
+    status_type = serializers.ChoiceField(choices=JobStatusType.choices)
+    # When the transition happened, as reported by the worker. If given,
+    # the status only becomes current if it is newer than the current one.
+    timestamp = serializers.DateTimeField(required=False, validators=[validate_reported_timestamp])
+
+
+class JobBulkStatusUpdateItemSerializer(InstrumentedSerializerMixin, serializers.Serializer):
+
+    MAX_JOBS = 5000
+
+    id = serializers.IntegerField(min_value=1)
     status_type = serializers.ChoiceField(choices=JobStatusType.choices)
+    timestamp = serializers.DateTimeField(required=False, validators=[validate_reported_timestamp])
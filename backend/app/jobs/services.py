@@ -1,36 +1,470 @@
-from django.db import transaction
+import random
+import time
+from collections import Counter
+from contextlib import nullcontext
+from datetime import datetime
+from typing import Any, Optional, Sequence
 
-from jobs.enums import JobStatusType
-from jobs.models import Job, JobStatus
+from django.db import connections, router, transaction
+from django.db.models import (
+    Case,
+    CharField,
+    Count,
+    DateTimeField,
+    F,
+    OuterRef,
+    Subquery,
+    Value,
+    When,
+)
+from django.utils import timezone
 
+from jobs.caching import invalidate_job_lists
+from jobs.enums import JobEventType, JobStatusType
+from jobs.models import Job, JobEvent, JobStatus, JobStatusCount
+from jobs.signals import job_events_committed
 
-@transaction.atomic
-def create_job(*, name: str) -> Job:
-    job = Job.objects.create(
-        name=name,
-        current_status_type=JobStatusType.PENDING,
-        current_status_timestamp=None,
+
+# Counter writes are upserts: a counter row missing after a flush, restore
+# or truncate is created by the first write instead of the increment
+# silently matching nothing. Rows are written in status_type order, so every
+# writer locks them in the same order and concurrent transactions cannot
+# deadlock on them.
+_STATUS_COUNT_UPSERT = f"""
+    ON CONFLICT (status_type) DO UPDATE
+    SET count = {JobStatusCount._meta.db_table}.count + EXCLUDED.count
+"""
+
+
+def _apply_status_count_deltas(deltas: Counter) -> None:
+    deltas = {status_type: delta for status_type, delta in deltas.items() if delta}
+    if not deltas:
+        return
+    rows = sorted(deltas.items())
+    with connections[router.db_for_write(JobStatusCount)].cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {JobStatusCount._meta.db_table} (status_type, count) "
+            f"VALUES {', '.join(['(%s, %s)'] * len(rows))}"
+            f"{_STATUS_COUNT_UPSERT}",
+            [value for row in rows for value in row],
+        )
+
+
+# create_job and update_job_status are each one statement: the job, its
+# status row, the counter delta and the change event are written by
+# data-modifying CTEs, and the job comes back through RETURNING. Duplicate
+# names are left to the unique constraint (IntegrityError).
+_JOB_COLUMNS = [field.column for field in Job._meta.concrete_fields]
+
+CREATE_JOB_SQL = f"""
+WITH job AS (
+    INSERT INTO {Job._meta.db_table}
+        (name, created_at, updated_at, current_status_type, current_status_timestamp, status_version)
+    VALUES (%(name)s, %(now)s, %(now)s, %(status)s, %(now)s, 0)
+    RETURNING {", ".join(_JOB_COLUMNS)}
+), status AS (
+    INSERT INTO {JobStatus._meta.db_table} (job_id, status_type, timestamp)
+    SELECT id, %(status)s, %(now)s FROM job
+), counts AS (
+    INSERT INTO {JobStatusCount._meta.db_table} (status_type, count)
+    VALUES (%(status)s, 1)
+    {_STATUS_COUNT_UPSERT}
+), event AS (
+    INSERT INTO {JobEvent._meta.db_table} (event_type, job_id, job_name, status_type, timestamp)
+    SELECT %(event)s, id, name, %(status)s, %(now)s FROM job
+)
+SELECT * FROM job
+"""
+
+# Attempts of the compare-and-swap below before giving up on a hot job, and
+# the cap in seconds on the jittered exponential backoff between them.
+STATUS_UPDATE_MAX_ATTEMPTS = 50
+STATUS_UPDATE_MAX_BACKOFF = 0.05
+
+# Lock-free compare-and-swap on Job.status_version. The job is read from the
+# statement's snapshot and only updated if its version is unchanged when the
+# UPDATE reaches the row, so "previous" is exactly the status replaced and
+# the counters move from it. A concurrent change makes the UPDATE match
+# nothing and the statement writes nothing, and the caller retries.
+#
+# With if_newer, the status becomes current only if its timestamp is not
+# older than the current one; an older report is appended to the history
+# only. Either way the newest row by (timestamp, id) stays the current one,
+# and the version is bumped, so it moves with every history append.
+UPDATE_JOB_STATUS_SQL = f"""
+WITH previous AS (
+    SELECT {", ".join(_JOB_COLUMNS)},
+        (
+            NOT %(if_newer)s
+            OR current_status_timestamp IS NULL
+            OR current_status_timestamp <= %(timestamp)s
+        ) AS advances
+    FROM {Job._meta.db_table}
+    WHERE id = %(job_id)s
+), job AS (
+    UPDATE {Job._meta.db_table} AS j
+    SET current_status_type = CASE WHEN previous.advances THEN %(status)s ELSE j.current_status_type END,
+        current_status_timestamp = CASE
+            WHEN previous.advances THEN %(timestamp)s ELSE j.current_status_timestamp
+        END,
+        updated_at = CASE WHEN previous.advances THEN %(now)s ELSE j.updated_at END,
+        status_version = j.status_version + 1
+    FROM previous
+    WHERE j.id = previous.id
+        AND j.status_version = previous.status_version
+    RETURNING {", ".join(f"j.{column}" for column in _JOB_COLUMNS)},
+        previous.current_status_type AS previous_status_type,
+        previous.advances AS advanced
+), status AS (
+    INSERT INTO {JobStatus._meta.db_table} (job_id, status_type, timestamp)
+    SELECT id, %(status)s, %(timestamp)s FROM job
+    RETURNING id
+), counts AS (
+    INSERT INTO {JobStatusCount._meta.db_table} (status_type, count)
+    SELECT delta.status_type, SUM(delta.count)
+    FROM job
+    CROSS JOIN LATERAL (
+        VALUES (%(status)s, 1), (job.previous_status_type, -1)
+    ) AS delta (status_type, count)
+    WHERE job.advanced
+    GROUP BY delta.status_type
+    ORDER BY delta.status_type
+    {_STATUS_COUNT_UPSERT}
+), event AS (
+    INSERT INTO {JobEvent._meta.db_table} (event_type, job_id, job_name, status_type, timestamp)
+    SELECT %(event)s, id, name, %(status)s, %(now)s FROM job
+    WHERE advanced
+)
+SELECT {", ".join(f"COALESCE(job.{column}, previous.{column})" for column in _JOB_COLUMNS)},
+    job.advanced,
+    status.id
+FROM previous
+LEFT JOIN job ON TRUE
+LEFT JOIN status ON TRUE
+"""
+
+
+def _execute_returning(sql: str, params: dict[str, Any]) -> tuple[str, Optional[tuple]]:
+    """Run one write statement on the primary; return ``(alias, first row)``."""
+    alias = router.db_for_write(Job)
+    connection = connections[alias]
+    # A single statement is atomic by itself, so no transaction is opened
+    # for it. Inside a caller's transaction, a savepoint keeps that
+    # transaction usable if the statement fails.
+    with transaction.atomic(using=alias) if connection.in_atomic_block else nullcontext():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+            return alias, cursor.fetchone()
+
+
+def _job_from_row(alias: str, row: tuple) -> Job:
+    return Job.from_db(alias, [field.attname for field in Job._meta.concrete_fields], row)
+
+
+def _notify_job_events(event_type: str, status_types: list[str]) -> None:
+    if status_types and job_events_committed.has_listeners(Job):
+        transaction.on_commit(
+            lambda: job_events_committed.send(sender=Job, event_type=event_type, status_types=status_types),
+            using=router.db_for_write(Job),
+        )
+
+
+def _record_job_events(event_type: str, changes: list[tuple[Job, str]]) -> None:
+    _notify_job_events(event_type, [status_type for _, status_type in changes])
+    JobEvent.objects.bulk_create(
+        [
+            JobEvent(
+                event_type=event_type,
+                job_id=job.pk,
+                job_name=job.name,
+                status_type=status_type,
+            )
+            for job, status_type in changes
+        ]
     )
-    status = JobStatus.objects.create(
-        job=job,
-        status_type=JobStatusType.PENDING,
+
+
+def create_job(*, name: str) -> Job:
+    alias, row = _execute_returning(
+        CREATE_JOB_SQL,
+        {
+            "name": name,
+            "now": timezone.now(),
+            "status": JobStatusType.PENDING,
+            "event": JobEventType.CREATED,
+        },
     )
-    job.current_status_timestamp = status.timestamp
-    job.save(update_fields=["current_status_timestamp", "updated_at"])
-    return job
+    _notify_job_events(JobEventType.CREATED, [JobStatusType.PENDING])
+    invalidate_job_lists()
+    return _job_from_row(alias, row)
 
 
 @transaction.atomic
-def update_job_status(*, job: Job, new_status: str) -> JobStatus:
-    status = JobStatus.objects.create(
-        job=job,
-        status_type=new_status,
+def bulk_create_jobs(
+    *,
+    names: list[str],
+    all_or_nothing: bool = True,
+) -> tuple[list[Job], list[str]]:
+    """
+    Create many jobs, each with its initial ``PENDING`` status, using
+    set-based statements: one existence check, one INSERT per table and one
+    UPDATE for the denormalized status timestamp.
+
+    Returns ``(created_jobs, conflicting_names)``. Names that already exist,
+    or repeat an earlier name in ``names``, are conflicts. With
+    ``all_or_nothing`` any conflict means nothing is written.
+    """
+    seen = set(Job.objects.filter(name__in=names).values_list("name", flat=True))
+    new_names: list[str] = []
+    conflicts: list[str] = []
+    for name in names:
+        if name in seen:
+            conflicts.append(name)
+        else:
+            seen.add(name)
+            new_names.append(name)
+
+    if not new_names or (conflicts and all_or_nothing):
+        return [], conflicts
+
+    jobs = Job.objects.bulk_create(
+        [Job(name=name, current_status_type=JobStatusType.PENDING) for name in new_names]
+    )
+    statuses = JobStatus.objects.bulk_create(
+        [JobStatus(job=job, status_type=JobStatusType.PENDING) for job in jobs]
+    )
+    Job.objects.filter(pk__in=[job.pk for job in jobs]).update(
+        current_status_timestamp=Subquery(
+            JobStatus.objects.filter(job=OuterRef("pk")).values("timestamp")[:1]
+        )
+    )
+    for job, status in zip(jobs, statuses):
+        job.current_status_timestamp = status.timestamp
+    _apply_status_count_deltas(Counter({JobStatusType.PENDING: len(jobs)}))
+    _record_job_events(JobEventType.CREATED, [(job, JobStatusType.PENDING) for job in jobs])
+    invalidate_job_lists()
+    return jobs, conflicts
+
+
+class StatusUpdateConflict(Exception):
+    pass
+
+
+def update_job_status_by_id(
+    *,
+    job_id: int,
+    new_status: str,
+    timestamp: Optional[datetime] = None,
+    if_newer: bool = False,
+    max_attempts: int = STATUS_UPDATE_MAX_ATTEMPTS,
+) -> tuple[Job, JobStatus]:
+    """
+    Append ``new_status`` (at ``timestamp``, default now) to the job's
+    history and make it current. With ``if_newer`` it only becomes current
+    if no newer status has been applied; the returned job shows which won.
+    Raises ``Job.DoesNotExist`` if there is no such job.
+
+    No row lock is taken. Each attempt is one statement, retried after a
+    short jittered backoff when a concurrent update of the same job wins the
+    compare-and-swap. Raises ``StatusUpdateConflict`` once ``max_attempts``
+    attempts have all lost.
+    """
+    now = timezone.now()
+    timestamp = timestamp or now
+    for attempt in range(max_attempts):
+        if attempt:
+            time.sleep(random.uniform(0, min(STATUS_UPDATE_MAX_BACKOFF, 0.001 * 2**attempt)))
+        alias, row = _execute_returning(
+            UPDATE_JOB_STATUS_SQL,
+            {
+                "job_id": job_id,
+                "now": now,
+                "timestamp": timestamp,
+                "status": new_status,
+                "if_newer": if_newer,
+                "event": JobEventType.STATUS_CHANGED,
+            },
+        )
+        if row is None:
+            raise Job.DoesNotExist("Job matching query does not exist.")
+        if row[-1] is not None:
+            break
+    else:
+        raise StatusUpdateConflict(
+            f"Job {job_id} was updated concurrently {max_attempts} times in a row; retry later."
+        )
+    *job_row, advanced, status_id = row
+    job = _job_from_row(alias, job_row)
+    status = JobStatus.from_db(
+        alias, ["id", "job_id", "status_type", "timestamp"], (status_id, job.pk, new_status, timestamp)
     )
-    job.current_status_type = new_status
-    job.current_status_timestamp = status.timestamp
-    job.save(update_fields=["current_status_type", "current_status_timestamp", "updated_at"])
+    status.job = job
+    if advanced:
+        # The status became current, so the statement recorded an event.
+        _notify_job_events(JobEventType.STATUS_CHANGED, [new_status])
+    invalidate_job_lists()
+    return job, status
+
+
+def update_job_status(*, job: Job, new_status: str) -> JobStatus:
+    updated, status = update_job_status_by_id(job_id=job.pk, new_status=new_status)
+    job.current_status_type = updated.current_status_type
+    job.current_status_timestamp = updated.current_status_timestamp
+    job.updated_at = updated.updated_at
+    job.status_version = updated.status_version
     return status
 
 
+@transaction.atomic
+def bulk_update_job_status(
+    *,
+    updates: Sequence[tuple[int, str] | tuple[int, str, datetime]],
+) -> tuple[list[Job], list[int]]:
+    """
+    Append a status for each ``(job_id, new_status[, timestamp])`` and
+    refresh the denormalized ``current_status_*`` columns, using one SELECT,
+    one INSERT and one UPDATE regardless of batch size.
+
+    Statuses without a timestamp are recorded now. As with the single
+    conditional update, a status becomes current unless it is older than the
+    job's current one, so a late report is appended to the history only and
+    emits no event. Entries for the same job with equal timestamps are
+    ordered as given, so the last one wins.
+
+    The batch's jobs are locked in id order for the transaction, which keeps
+    the counter deltas exact alongside the lock-free single updates.
+
+    Returns ``(updated_jobs, missing_job_ids)``.
+    """
+    job_ids = [update[0] for update in updates]
+    jobs = {
+        job.pk: job
+        for job in Job.objects.select_for_update().filter(pk__in=job_ids).order_by("pk")
+    }
+    previous_statuses = {pk: job.current_status_type for pk, job in jobs.items()}
+    missing = list(dict.fromkeys(job_id for job_id in job_ids if job_id not in jobs))
+
+    now = timezone.now()
+    statuses = JobStatus.objects.bulk_create(
+        [
+            JobStatus(job=jobs[job_id], status_type=new_status, timestamp=timestamp[0] if timestamp else now)
+            for job_id, new_status, *timestamp in updates
+            if job_id in jobs
+        ]
+    )
+    if not statuses:
+        return [], missing
+
+    # Statuses that become current at some point in the batch, in the order
+    # they take over; the last one per job ends up current.
+    advancing = []
+    for status in sorted(statuses, key=lambda status: (status.timestamp, status.pk)):
+        job = status.job
+        if job.current_status_timestamp is None or status.timestamp >= job.current_status_timestamp:
+            job.current_status_type = status.status_type
+            job.current_status_timestamp = status.timestamp
+            advancing.append(status)
+
+    touched = {status.job_id: status.job for status in statuses}
+    advanced = {status.job_id: status.job for status in advancing}
+    # The winners chosen above are written as they are; the counter deltas
+    # below are computed from them. Re-reading the newest history row instead
+    # would disagree after a future-dated report followed by a plain update.
+    # Every touched job's version is bumped, including jobs that only got a
+    # late history row.
+    Job.objects.filter(pk__in=touched).update(
+        current_status_type=Case(
+            *[When(pk=pk, then=Value(job.current_status_type)) for pk, job in advanced.items()],
+            default=F("current_status_type"),
+            output_field=CharField(),
+        ),
+        current_status_timestamp=Case(
+            *[When(pk=pk, then=Value(job.current_status_timestamp)) for pk, job in advanced.items()],
+            default=F("current_status_timestamp"),
+            output_field=DateTimeField(),
+        ),
+        updated_at=Case(
+            *[When(pk=pk, then=Value(now)) for pk in advanced],
+            default=F("updated_at"),
+            output_field=DateTimeField(),
+        ),
+        status_version=F("status_version") + 1,
+    )
+    for job in touched.values():
+        job.status_version += 1
+    for job in advanced.values():
+        job.updated_at = now
+
+    deltas: Counter = Counter()
+    for job in advanced.values():
+        deltas[previous_statuses[job.pk]] -= 1
+        deltas[job.current_status_type] += 1
+    _apply_status_count_deltas(deltas)
+    _record_job_events(
+        JobEventType.STATUS_CHANGED,
+        [(status.job, status.status_type) for status in advancing],
+    )
+    invalidate_job_lists()
+    return list(touched.values()), missing
+
+
+@transaction.atomic
 def delete_job(*, job: Job) -> None:
+    """
+    Delete ``job`` and its history. Raises ``Job.DoesNotExist`` if it is
+    already gone.
+
+    The row is locked and its status re-read on the primary first, so the
+    counter moves from the stored status even when ``job`` is stale, and a
+    concurrent delete of the same job is only counted once.
+    """
+    current_status_type = (
+        Job.objects.select_for_update()
+        .filter(pk=job.pk)
+        .values_list("current_status_type", flat=True)
+        .first()
+    )
+    if current_status_type is None:
+        raise Job.DoesNotExist("Job matching query does not exist.")
+    job.current_status_type = current_status_type
+    _record_job_events(JobEventType.DELETED, [(job, current_status_type)])
     job.delete()
+    _apply_status_count_deltas(Counter({current_status_type: -1}))
+    invalidate_job_lists()
+
+
+@transaction.atomic
+def rebuild_job_status_counts(*, dry_run: bool = False) -> dict[str, tuple[int, int]]:
+    """
+    Recompute the per-status counters from ``Job`` and return
+    ``{status_type: (stored, actual)}`` for every status.
+
+    The counter rows are locked before counting, so writers that are mid
+    transaction either commit before the recount (and are included in it) or
+    apply their deltas on top of the rebuilt values afterwards.
+    """
+    stored = dict(
+        JobStatusCount.objects.select_for_update().values_list("status_type", "count")
+    )
+    actual = dict(
+        Job.objects.order_by()
+        .values_list("current_status_type")
+        .annotate(total=Count("id"))
+    )
+    report = {
+        status_type: (stored.get(status_type, 0), actual.get(status_type, 0))
+        for status_type in JobStatusType.values
+    }
+    if not dry_run:
+        JobStatusCount.objects.bulk_create(
+            [JobStatusCount(status_type=s, count=counts[1]) for s, counts in report.items()],
+            update_conflicts=True,
+            unique_fields=["status_type"],
+            update_fields=["count"],
+        )
+    return report
+
+
+def prune_job_events(*, before: datetime) -> int:
+    deleted, _ = JobEvent.objects.filter(timestamp__lt=before).delete()
+    return deleted
@@ -0,0 +1,8 @@
+"""Signals sent by the write services in ``jobs.services``."""
+
+from django.dispatch import Signal
+
+# Sent with ``sender=Job`` once the transaction that recorded job change
+# events has committed, with ``event_type`` and ``status_types`` (the status
+# of each recorded event). Only scheduled when something is listening.
+job_events_committed = Signal()
@@ -0,0 +1,209 @@
+"""
+Slow-query capture, enabled with ``JOBS_SLOW_QUERY_ENABLED=1``.
+
+``SlowQueryRecorder`` is an ``execute_wrapper`` installed on every new
+connection. A statement that takes at least ``JOBS_SLOW_QUERY_THRESHOLD_MS``
+is recorded with:
+
+- its normalized SQL (literals, placeholders and ``IN`` lists collapsed),
+  and a fingerprint of it, so repeats of one filter/sort shape group
+  together;
+- the shape of its parameters (types and list lengths, never values);
+- the ``jobs`` functions on the stack, innermost first as ``caller``.
+  QuerySets are lazy, so that is where the query ran (often a view or the
+  paginator); the selector that built it is usually further up ``stack``;
+- for a ``JOBS_SLOW_QUERY_EXPLAIN_SAMPLE_RATE`` share of read-only
+  statements, ``EXPLAIN (ANALYZE, BUFFERS)`` output. ``ANALYZE`` runs the
+  statement a second time, which the sampled request waits for. It runs on
+  the raw connection, in a savepoint inside a transaction, so it is neither
+  recorded nor counted as a request query.
+
+Entries go to a ring buffer of the last ``JOBS_SLOW_QUERY_BUFFER_SIZE``
+slow statements. The buffer belongs to the process, so
+``GET /api/jobs/slow-queries/`` (staff only) shows what the worker that
+answers has seen. ``manage.py slow_queries`` replays API paths in its own
+process and prints what they captured.
+"""
+
+import hashlib
+import random
+import re
+import sys
+import threading
+from collections import deque
+from datetime import datetime
+from time import perf_counter
+from typing import Any, Callable, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+MAX_STACK_FRAMES = 8
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%\([^)]*\)s|%s")
+_VALUE_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+_WRITE = re.compile(r"\b(?:INSERT|UPDATE|DELETE|MERGE)\b", re.IGNORECASE)
+
+# Frames of these modules are part of the capture, not the caller.
+_SKIPPED_MODULES = {__name__, "jobs.instrumentation"}
+
+
+def normalize_sql(sql: str) -> str:
+    """``sql`` with values replaced by ``?`` and lists of them by ``...``."""
+    sql = _STRING_LITERAL.sub("?", sql)
+    sql = _PLACEHOLDER.sub("?", sql)
+    # Digits within identifiers (U0, T3) are not word-bounded, so this only
+    # replaces bare numbers: LIMIT/OFFSET and other inlined values.
+    sql = _NUMBER.sub("?", sql)
+    sql = _VALUE_LIST.sub("...", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def params_shape(params: Any, many: bool) -> Any:
+    """Types of ``params`` (or of the first set, for ``executemany``)."""
+    if many:
+        # An iterator of sets has been consumed by the time this runs.
+        sets = params if isinstance(params, (list, tuple)) else []
+        return {"sets": len(sets) or None, "first": params_shape(sets[0], False) if sets else None}
+    if params is None:
+        return None
+    if isinstance(params, dict):
+        return {name: _value_shape(value) for name, value in params.items()}
+    return [_value_shape(value) for value in params]
+
+
+def _stack() -> list[str]:
+    """The ``jobs`` frames calling into the database, innermost first."""
+    frames = []
+    frame = sys._getframe(1)
+    while frame is not None and len(frames) < MAX_STACK_FRAMES:
+        module = frame.f_globals.get("__name__", "")
+        if module.startswith("jobs.") and module not in _SKIPPED_MODULES:
+            frames.append(f"{module}.{frame.f_code.co_qualname}:{frame.f_lineno}")
+        frame = frame.f_back
+    return frames
+
+
+def _explainable(sql: str, many: bool) -> bool:
+    # ANALYZE executes the statement, so writes are never explained.
+    statement = sql.lstrip().upper()
+    return not many and statement.startswith(("SELECT", "WITH")) and not _WRITE.search(sql)
+
+
+def _explain(connection: Any, sql: str, params: Any) -> str:
+    raw = connection.connection
+    # A savepoint inside the caller's transaction, so a failed EXPLAIN does
+    # not abort it.
+    with raw.transaction(), raw.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS) {sql}", params)
+        return "\n".join(row[0] for row in cursor.fetchall())
+
+
+class SlowQueryLog:
+    """Bounded, thread-safe buffer of the most recent slow statements."""
+
+    def __init__(self, *, capacity: int) -> None:
+        self.capacity = capacity
+        self._entries: deque[dict[str, Any]] = deque(maxlen=capacity)
+        self._lock = threading.Lock()
+        self.captured = 0
+
+    def append(self, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self._entries.append(entry)
+            self.captured += 1
+
+    def entries(self) -> list[dict[str, Any]]:
+        """Newest first."""
+        with self._lock:
+            return list(reversed(self._entries))
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class SlowQueryRecorder:
+    """``execute_wrapper`` that records statements over the threshold in ``log``."""
+
+    def __init__(self, *, threshold_ms: float, explain_rate: float, log: SlowQueryLog) -> None:
+        self.threshold_ms = threshold_ms
+        self.explain_rate = explain_rate
+        self.log = log
+
+    def __call__(self, execute: Callable, sql: str, params: Any, many: bool, context: dict) -> Any:
+        started = perf_counter()
+        result = execute(sql, params, many, context)
+        duration_ms = (perf_counter() - started) * 1000
+        if duration_ms >= self.threshold_ms:
+            self.record(context["connection"], sql, params, many, duration_ms, timezone.now())
+        return result
+
+    def record(
+        self, connection: Any, sql: str, params: Any, many: bool, duration_ms: float, when: datetime
+    ) -> None:
+        normalized = normalize_sql(sql)
+        stack = _stack()
+        entry: dict[str, Any] = {
+            "timestamp": when.isoformat(),
+            "alias": connection.alias,
+            "duration_ms": round(duration_ms, 3),
+            "fingerprint": hashlib.sha1(normalized.encode()).hexdigest()[:12],
+            "sql": normalized,
+            "params": params_shape(params, many),
+            "caller": stack[0].rpartition(":")[0] if stack else None,
+            "stack": stack,
+            "plan": None,
+        }
+        if _explainable(sql, many) and random.random() < self.explain_rate:
+            try:
+                entry["plan"] = _explain(connection, sql, params)
+            except Exception as exc:
+                entry["explain_error"] = str(exc)
+        self.log.append(entry)
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "threshold_ms": self.threshold_ms,
+            "explain_sample_rate": self.explain_rate,
+            "capacity": self.log.capacity,
+            "captured": self.log.captured,
+        }
+
+
+_recorder: Optional[SlowQueryRecorder] = None
+_recorder_lock = threading.Lock()
+
+
+def is_enabled() -> bool:
+    return settings.JOBS_SLOW_QUERY_ENABLED
+
+
+def get_recorder() -> SlowQueryRecorder:
+    """This process's recorder, configured from settings on first use."""
+    global _recorder
+    with _recorder_lock:
+        if _recorder is None:
+            _recorder = SlowQueryRecorder(
+                threshold_ms=settings.JOBS_SLOW_QUERY_THRESHOLD_MS,
+                explain_rate=settings.JOBS_SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+                log=SlowQueryLog(capacity=settings.JOBS_SLOW_QUERY_BUFFER_SIZE),
+            )
+        return _recorder
+
+
+def install_slow_query_recorder(sender: Any, connection: Any, **kwargs: Any) -> None:
+    """``connection_created`` receiver that adds the recorder once."""
+    recorder = get_recorder()
+    if recorder not in connection.execute_wrappers:
+        # First, so execute_wrapper() blocks around it still pop their own.
+        connection.execute_wrappers.insert(0, recorder)
@@ -0,0 +1,7 @@
+"""``config.urls`` as mounted under ASGI (``JOBS_ASGI=1``)."""
+
+from django.urls import include, path
+
+from jobs.urls import async_read_urlpatterns, router
+
+urlpatterns = [path("api/", include(async_read_urlpatterns + router.urls))]
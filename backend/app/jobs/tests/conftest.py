@@ -1,9 +1,30 @@
 import pytest
+from django.db import connection
 
 from jobs.enums import JobStatusType
+from jobs.instrumentation import install_query_recorder, record_query
 from jobs.services import create_job
 
+METRICS_MIDDLEWARE = "jobs.instrumentation.RequestMetricsMiddleware"
+
 
 @pytest.fixture
 def sample_job(db):
     return create_job(name="Sample Job")
+
+
+@pytest.fixture
+def query_recorder():
+    # The test connection already exists, so connection_created has fired.
+    installed = record_query in connection.execute_wrappers
+    install_query_recorder(sender=None, connection=connection)
+    yield
+    if not installed:
+        connection.execute_wrappers.remove(record_query)
+
+
+@pytest.fixture
+def metrics_middleware(settings):
+    if METRICS_MIDDLEWARE not in settings.MIDDLEWARE:
+        settings.MIDDLEWARE = [METRICS_MIDDLEWARE, *settings.MIDDLEWARE]
+    return settings
@@ -1,9 +1,33 @@
+import asyncio
+import csv
+import io
+import json
+from datetime import timedelta
+from types import SimpleNamespace
+
 import pytest
-from django.db import IntegrityError
+from asgiref.sync import async_to_sync, sync_to_async
+from django.core.cache import caches
+from django.db import IntegrityError, connection
+from django.test import AsyncClient, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import resolve
+from django.utils.http import http_date
 from rest_framework.test import APIClient
 
+from jobs import ingest, slow_queries
 from jobs.enums import JobStatusType
-from jobs.services import create_job, update_job_status
+from jobs.events import CHANNEL, stream_job_events
+from jobs.exports import iter_export_rows
+from jobs.models import Job
+from jobs.services import (
+    StatusUpdateConflict,
+    create_job,
+    delete_job,
+    update_job_status,
+    update_job_status_by_id,
+)
+from jobs.views import JobViewSet
 
 
 @pytest.fixture
@@ -11,6 +35,13 @@ def api_client() -> APIClient:
     return APIClient()
 
 
+@pytest.fixture
+def staff_client(django_user_model) -> APIClient:
+    client = APIClient()
+    client.force_authenticate(django_user_model.objects.create_user("ops", is_staff=True))
+    return client
+
+
 @pytest.mark.django_db
 class TestListJobs:
     def test_returns_empty_list(self, api_client: APIClient):
@@ -45,6 +76,49 @@ class TestListJobs:
         resp = api_client.get("/api/jobs/", {"status": "INVALID"})
         assert resp.status_code == 400
 
+    def test_filters_by_several_statuses(self, api_client: APIClient):
+        create_job(name="Pending Job")
+        update_job_status(job=create_job(name="Running Job"), new_status=JobStatusType.RUNNING)
+        update_job_status(job=create_job(name="Failed Job"), new_status=JobStatusType.FAILED)
+
+        resp = api_client.get("/api/jobs/", {"status": "RUNNING,FAILED", "sort": "name"})
+
+        assert resp.status_code == 200
+        names = [j["name"] for j in resp.json()["results"]]
+        assert names == ["Failed Job", "Running Job"]
+
+    def test_filters_by_creation_window(self, api_client: APIClient):
+        for name, created_at in [
+            ("Old", "2026-01-01T00:00:00Z"),
+            ("Edge", "2026-02-01T00:00:00Z"),
+            ("New", "2026-03-01T00:00:00Z"),
+        ]:
+            Job.objects.filter(pk=create_job(name=name).pk).update(created_at=created_at)
+
+        resp = api_client.get(
+            "/api/jobs/",
+            {"created_after": "2026-02-01", "created_before": "2026-03-01T00:00:00Z"},
+        )
+
+        assert [j["name"] for j in resp.json()["results"]] == ["Edge"]
+
+    def test_filters_by_updated_since(self, api_client: APIClient):
+        stale = create_job(name="Stale")
+        Job.objects.filter(pk=stale.pk).update(updated_at="2026-01-01T00:00:00Z")
+        create_job(name="Fresh")
+
+        resp = api_client.get(
+            "/api/jobs/", {"updated_since": "2026-02-01T00:00:00Z", "sort": "-updated_at"}
+        )
+
+        assert [j["name"] for j in resp.json()["results"]] == ["Fresh"]
+
+    def test_rejects_invalid_date_filter(self, api_client: APIClient):
+        resp = api_client.get("/api/jobs/", {"created_after": "last week"})
+
+        assert resp.status_code == 400
+        assert "created_after" in resp.json()["detail"]
+
     def test_sorts_by_name(self, api_client: APIClient):
         create_job(name="Bravo")
         create_job(name="Alpha")
@@ -54,6 +128,57 @@ class TestListJobs:
         names = [j["name"] for j in resp.json()["results"]]
         assert names == ["Alpha", "Bravo"]
 
+    def test_searches_names_case_insensitively(self, api_client: APIClient):
+        create_job(name="Nightly Backup")
+        create_job(name="backup-verify")
+        create_job(name="Report")
+
+        resp = api_client.get("/api/jobs/", {"q": "BACKUP", "sort": "name"})
+
+        assert resp.status_code == 200
+        names = [j["name"] for j in resp.json()["results"]]
+        assert names == ["Nightly Backup", "backup-verify"]
+
+    def test_prefix_search_matches_start_of_name(self, api_client: APIClient):
+        create_job(name="Nightly Backup")
+        create_job(name="backup-verify")
+
+        resp = api_client.get("/api/jobs/", {"q": "Backup", "match": "prefix"})
+
+        names = [j["name"] for j in resp.json()["results"]]
+        assert names == ["backup-verify"]
+
+    def test_search_treats_wildcards_literally(self, api_client: APIClient):
+        create_job(name="Backup 100%")
+        create_job(name="Backup 1000")
+
+        resp = api_client.get("/api/jobs/", {"q": "0%"})
+
+        names = [j["name"] for j in resp.json()["results"]]
+        assert names == ["Backup 100%"]
+
+    def test_search_composes_with_status_filter(self, api_client: APIClient):
+        create_job(name="ETL pending")
+        update_job_status(job=create_job(name="ETL failed"), new_status=JobStatusType.FAILED)
+        update_job_status(job=create_job(name="Train failed"), new_status=JobStatusType.FAILED)
+
+        resp = api_client.get("/api/jobs/", {"q": "etl", "status": "FAILED"})
+
+        data = resp.json()
+        assert data["count"] == 1
+        assert data["results"][0]["name"] == "ETL failed"
+
+    def test_blank_search_is_ignored(self, api_client: APIClient):
+        create_job(name="Alpha")
+
+        resp = api_client.get("/api/jobs/", {"q": "  "})
+
+        assert resp.json()["count"] == 1
+
+    def test_rejects_invalid_match_mode(self, api_client: APIClient):
+        resp = api_client.get("/api/jobs/", {"q": "a", "match": "regex"})
+        assert resp.status_code == 400
+
     def test_pagination_limits_results(self, api_client: APIClient):
         for i in range(5):
             create_job(name=f"Job {i}")
@@ -64,12 +189,150 @@ class TestListJobs:
         assert data["count"] == 5
         assert len(data["results"]) == 2
         assert data["next"] is not None
+        assert data["count_is_estimate"] is False
+
+    def test_count_none_skips_total(self, api_client: APIClient):
+        for i in range(3):
+            create_job(name=f"Job {i}")
+
+        first = api_client.get("/api/jobs/", {"limit": 2, "count": "none"}).json()
+        last = api_client.get(first["next"]).json()
+
+        assert first["count"] is None
+        assert len(first["results"]) == 2
+        assert len(last["results"]) == 1
+        assert last["next"] is None
+
+    def test_count_estimated_is_exact_for_small_results(self, api_client: APIClient):
+        for i in range(3):
+            create_job(name=f"Job {i}")
+
+        data = api_client.get("/api/jobs/", {"limit": 2, "count": "estimated"}).json()
+
+        assert data["count"] == 3
+        assert data["count_is_estimate"] is False
+        assert data["next"] is not None
+
+    def test_count_estimated_uses_planner_above_threshold(
+        self,
+        api_client: APIClient,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        monkeypatch.setattr("jobs.selectors.EXACT_COUNT_THRESHOLD", 0)
+        for i in range(3):
+            create_job(name=f"Job {i}")
+
+        data = api_client.get("/api/jobs/", {"limit": 2, "count": "estimated"}).json()
+
+        assert data["count_is_estimate"] is True
+        assert data["count"] >= 3
+
+    def test_rejects_invalid_count_mode(self, api_client: APIClient):
+        resp = api_client.get("/api/jobs/", {"count": "sometimes"})
+        assert resp.status_code == 400
+
+
+@pytest.mark.django_db
+class TestListCache:
+    @pytest.fixture(autouse=True)
+    def enable_cache(self, settings):
+        settings.JOBS_LIST_CACHE_ENABLED = True
+        caches[settings.JOBS_LIST_CACHE_ALIAS].clear()
+        yield
+        caches[settings.JOBS_LIST_CACHE_ALIAS].clear()
+
+    def test_serves_repeat_requests_from_cache(
+        self,
+        api_client: APIClient,
+        staff_client: APIClient,
+        django_assert_num_queries,
+    ):
+        create_job(name="Cached")
+        first = api_client.get("/api/jobs/", {"status": "PENDING"})
+
+        with django_assert_num_queries(0):
+            second = api_client.get("/api/jobs/", {"status": "PENDING"})
+
+        assert second.json() == first.json()
+        stats = staff_client.get("/api/jobs/cache-stats/").json()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+
+    def test_writes_invalidate_cached_pages(self, api_client: APIClient):
+        job = create_job(name="Before")
+        assert api_client.get("/api/jobs/").json()["count"] == 1
+
+        create_job(name="After")
+        assert api_client.get("/api/jobs/").json()["count"] == 2
+
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        data = api_client.get("/api/jobs/", {"status": "RUNNING"}).json()
+        assert [j["name"] for j in data["results"]] == ["Before"]
+
+    def test_error_responses_are_not_cached(self, api_client: APIClient, staff_client: APIClient):
+        api_client.get("/api/jobs/", {"status": "INVALID"})
+        resp = api_client.get("/api/jobs/", {"status": "INVALID"})
+
+        assert resp.status_code == 400
+        assert staff_client.get("/api/jobs/cache-stats/").json()["hits"] == 0
+
+    def test_stats_are_staff_only(self, api_client: APIClient):
+        assert api_client.get("/api/jobs/cache-stats/").status_code == 403
+
+
+@pytest.mark.django_db
+class TestJobSummary:
+    def test_returns_counts_per_status(self, api_client: APIClient):
+        create_job(name="Pending Job")
+        update_job_status(job=create_job(name="Running Job"), new_status=JobStatusType.RUNNING)
+
+        resp = api_client.get("/api/jobs/summary/")
+
+        assert resp.status_code == 200
+        assert resp.json() == {
+            "total": 2,
+            "by_status": {"PENDING": 1, "RUNNING": 1, "COMPLETED": 0, "FAILED": 0},
+        }
+
+
+@pytest.mark.django_db
+class TestDbStats:
+    def test_reports_persistent_connection(self, staff_client: APIClient):
+        stats = staff_client.get("/api/jobs/db-stats/").json()["default"]
+
+        assert stats["pooled"] is False
+        assert stats["connected"] is True
+        assert stats["pool"] is None
+
+    def test_reports_pool_stats(self, staff_client: APIClient, monkeypatch):
+        settings_dict = connection.settings_dict
+        monkeypatch.setitem(settings_dict, "CONN_MAX_AGE", 0)
+        monkeypatch.setitem(
+            settings_dict, "OPTIONS", {**settings_dict["OPTIONS"], "pool": {"min_size": 1, "max_size": 2}}
+        )
+        try:
+            stats = staff_client.get("/api/jobs/db-stats/").json()["default"]
+        finally:
+            connection.close_pool()
+
+        assert stats["pooled"] is True
+        assert stats["pool"]["pool_max"] == 2
+
+    def test_staff_only(self, api_client: APIClient):
+        assert api_client.get("/api/jobs/db-stats/").status_code == 403
 
 
 @pytest.mark.django_db
 class TestCreateJob:
-    def test_creates_job_with_pending_status(self, api_client: APIClient):
-        resp = api_client.post("/api/jobs/", {"name": "New Job"}, format="json")
+    def test_creates_job_with_pending_status(
+        self,
+        api_client: APIClient,
+        django_assert_num_queries,
+    ):
+        # One INSERT ... RETURNING statement, plus the savepoint the test
+        # transaction adds around it.
+        with django_assert_num_queries(3):
+            resp = api_client.post("/api/jobs/", {"name": "New Job"}, format="json")
 
         assert resp.status_code == 201
         data = resp.json()
@@ -89,10 +352,13 @@ class TestCreateJob:
         resp = api_client.post("/api/jobs/", {}, format="json")
         assert resp.status_code == 400
 
-    def test_rejects_duplicate_name(self, api_client: APIClient):
+    def test_rejects_duplicate_name(self, api_client: APIClient, django_assert_num_queries):
         api_client.post("/api/jobs/", {"name": "Duplicate API Name"}, format="json")
 
-        resp = api_client.post("/api/jobs/", {"name": "Duplicate API Name"}, format="json")
+        # No existence check: the INSERT hits the unique constraint and its
+        # savepoint is rolled back.
+        with django_assert_num_queries(4):
+            resp = api_client.post("/api/jobs/", {"name": "Duplicate API Name"}, format="json")
 
         assert resp.status_code == 400
         assert "already exists" in " ".join(resp.json()["name"]).lower()
@@ -114,17 +380,78 @@ class TestCreateJob:
 
 
 @pytest.mark.django_db
-class TestUpdateJobStatus:
-    def test_updates_status(self, api_client: APIClient):
-        job = create_job(name="Update Test")
-        resp = api_client.patch(
-            f"/api/jobs/{job.pk}/",
-            {"status_type": "RUNNING"},
+class TestBulkCreateJobs:
+    def test_creates_all_jobs(self, api_client: APIClient):
+        resp = api_client.post("/api/jobs/bulk/", {"names": ["Bulk A", "Bulk B"]}, format="json")
+
+        assert resp.status_code == 201
+        data = resp.json()
+        assert data["created"] == 2
+        assert [r["status"] for r in data["results"]] == ["created", "created"]
+        assert data["results"][0]["job"]["current_status_type"] == "PENDING"
+        assert data["results"][0]["job"]["current_status_timestamp"] is not None
+
+    def test_all_or_nothing_rejects_batch_with_conflict(self, api_client: APIClient):
+        create_job(name="Existing")
+
+        resp = api_client.post("/api/jobs/bulk/", {"names": ["New", "Existing"]}, format="json")
+
+        assert resp.status_code == 400
+        assert [r["status"] for r in resp.json()["results"]] == ["skipped", "conflict"]
+        assert not Job.objects.filter(name="New").exists()
+
+    def test_partial_mode_reports_per_item(self, api_client: APIClient):
+        create_job(name="Existing")
+
+        resp = api_client.post(
+            "/api/jobs/bulk/",
+            {"names": ["New", "Existing", "New"], "all_or_nothing": False},
             format="json",
         )
 
+        assert resp.status_code == 207
+        data = resp.json()
+        assert data["created"] == 1
+        assert data["conflicts"] == 2
+        assert [r["status"] for r in data["results"]] == ["created", "conflict", "conflict"]
+
+    def test_rejects_blank_and_empty_payloads(self, api_client: APIClient):
+        assert api_client.post("/api/jobs/bulk/", {"names": []}, format="json").status_code == 400
+        assert api_client.post("/api/jobs/bulk/", {"names": ["  "]}, format="json").status_code == 400
+
+
+@pytest.mark.django_db
+class TestUpdateJobStatus:
+    def test_updates_status(self, api_client: APIClient, django_assert_num_queries):
+        job = create_job(name="Update Test")
+        # One UPDATE ... RETURNING statement (plus savepoint), with no
+        # SELECT before it or refresh after it.
+        with django_assert_num_queries(3):
+            resp = api_client.patch(
+                f"/api/jobs/{job.pk}/",
+                {"status_type": "RUNNING"},
+                format="json",
+            )
+
         assert resp.status_code == 200
-        assert resp.json()["current_status_type"] == "RUNNING"
+        data = resp.json()
+        assert data["current_status_type"] == "RUNNING"
+        job.refresh_from_db()
+        assert data["updated_at"] == job.updated_at.isoformat().replace("+00:00", "Z")
+        assert data["current_status_timestamp"] == data["updated_at"]
+
+    def test_hot_job_returns_503(self, api_client: APIClient, monkeypatch):
+        job = create_job(name="Hot Status")
+
+        def conflict(**kwargs):
+            raise StatusUpdateConflict(f"Job {job.pk} was updated concurrently 50 times in a row; retry later.")
+
+        monkeypatch.setattr("jobs.views.update_job_status_by_id", conflict)
+        resp = api_client.patch(f"/api/jobs/{job.pk}/", {"status_type": "RUNNING"}, format="json")
+
+        assert resp.status_code == 503
+        assert resp["Retry-After"] == "1"
+        assert "retry later" in resp.json()["detail"]
 
     def test_rejects_invalid_status(self, api_client: APIClient):
         job = create_job(name="Invalid Status")
@@ -135,13 +462,223 @@ class TestUpdateJobStatus:
         )
         assert resp.status_code == 400
 
-    def test_returns_404_for_nonexistent_job(self, api_client: APIClient):
+    def test_reported_timestamp_older_than_current_does_not_regress(self, api_client: APIClient):
+        job = create_job(name="Late Report")
+        completed_at = job.current_status_timestamp + timedelta(seconds=5)
+        api_client.patch(
+            f"/api/jobs/{job.pk}/",
+            {"status_type": "COMPLETED", "timestamp": completed_at.isoformat()},
+            format="json",
+        )
+
+        resp = api_client.patch(
+            f"/api/jobs/{job.pk}/",
+            {
+                "status_type": "RUNNING",
+                "timestamp": (completed_at - timedelta(seconds=4)).isoformat(),
+            },
+            format="json",
+        )
+
+        assert resp.status_code == 200
+        assert resp.json()["current_status_type"] == "COMPLETED"
+        history = api_client.get(f"/api/jobs/{job.pk}/statuses/").json()["results"]
+        assert [s["status_type"] for s in history] == ["COMPLETED", "RUNNING", "PENDING"]
+
+    def test_rejects_future_timestamp(self, api_client: APIClient):
+        job = create_job(name="Clock Skew")
         resp = api_client.patch(
-            "/api/jobs/99999/",
-            {"status_type": "RUNNING"},
+            f"/api/jobs/{job.pk}/",
+            {"status_type": "RUNNING", "timestamp": "2999-01-01T00:00:00Z"},
             format="json",
         )
+        assert resp.status_code == 400
+        assert "timestamp" in resp.json()
+
+    def test_returns_404_for_nonexistent_job(self, api_client: APIClient, django_assert_num_queries):
+        with django_assert_num_queries(3):
+            resp = api_client.patch(
+                "/api/jobs/99999/",
+                {"status_type": "RUNNING"},
+                format="json",
+            )
         assert resp.status_code == 404
+        assert resp.json() == {"detail": "Job not found."}
+
+
+@pytest.mark.django_db
+class TestBulkUpdateJobStatus:
+    def test_updates_many_jobs(self, api_client: APIClient):
+        first = create_job(name="Worker A")
+        second = create_job(name="Worker B")
+
+        resp = api_client.post(
+            "/api/jobs/statuses/bulk/",
+            [
+                {"id": first.pk, "status_type": "COMPLETED"},
+                {"id": second.pk, "status_type": "FAILED"},
+            ],
+            format="json",
+        )
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["updated"] == 2
+        assert {r["id"]: r["job"]["current_status_type"] for r in data["results"]} == {
+            first.pk: "COMPLETED",
+            second.pk: "FAILED",
+        }
+
+    def test_reports_missing_jobs(self, api_client: APIClient):
+        job = create_job(name="Worker")
+
+        resp = api_client.post(
+            "/api/jobs/statuses/bulk/",
+            [{"id": job.pk, "status_type": "RUNNING"}, {"id": 99999, "status_type": "RUNNING"}],
+            format="json",
+        )
+
+        assert resp.status_code == 207
+        assert resp.json()["not_found"] == 1
+        assert {r["id"]: r["status"] for r in resp.json()["results"]} == {
+            job.pk: "updated",
+            99999: "not_found",
+        }
+
+    def test_rejects_invalid_status(self, api_client: APIClient):
+        job = create_job(name="Worker")
+
+        resp = api_client.post(
+            "/api/jobs/statuses/bulk/",
+            [{"id": job.pk, "status_type": "EXPLODED"}],
+            format="json",
+        )
+
+        assert resp.status_code == 400
+
+    def test_rejects_empty_batch(self, api_client: APIClient):
+        resp = api_client.post("/api/jobs/statuses/bulk/", [], format="json")
+        assert resp.status_code == 400
+
+
+    def test_newest_reported_timestamp_wins(self, api_client: APIClient):
+        job = create_job(name="Worker")
+        base = job.current_status_timestamp
+
+        resp = api_client.post(
+            "/api/jobs/statuses/bulk/",
+            [
+                {"id": job.pk, "status_type": "COMPLETED", "timestamp": (base + timedelta(seconds=2)).isoformat()},
+                {"id": job.pk, "status_type": "RUNNING", "timestamp": (base + timedelta(seconds=1)).isoformat()},
+            ],
+            format="json",
+        )
+
+        assert resp.status_code == 200
+        job.refresh_from_db()
+        assert job.current_status_type == JobStatusType.COMPLETED
+
+
+@pytest.mark.django_db
+class TestSlowQueryLog:
+    @pytest.fixture
+    def recorder(self, settings, monkeypatch):
+        settings.JOBS_SLOW_QUERY_ENABLED = True
+        recorder = slow_queries.SlowQueryRecorder(
+            threshold_ms=0, explain_rate=0.0, log=slow_queries.SlowQueryLog(capacity=50)
+        )
+        monkeypatch.setattr(slow_queries, "get_recorder", lambda: recorder)
+        with connection.execute_wrapper(recorder):
+            yield recorder
+
+    def test_staff_only(self, api_client: APIClient, recorder):
+        assert api_client.get("/api/jobs/slow-queries/").status_code == 403
+
+    def test_not_found_when_disabled(self, settings, staff_client: APIClient):
+        settings.JOBS_SLOW_QUERY_ENABLED = False
+        assert staff_client.get("/api/jobs/slow-queries/").status_code == 404
+
+    def test_lists_and_clears_captured_queries(
+        self, api_client: APIClient, staff_client: APIClient, recorder
+    ):
+        api_client.get("/api/jobs/?status=FAILED")
+
+        resp = staff_client.get("/api/jobs/slow-queries/")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["threshold_ms"] == 0
+        assert any('"current_status_type" = ?' in entry["sql"] for entry in data["entries"])
+        assert staff_client.delete("/api/jobs/slow-queries/").status_code == 204
+        assert recorder.log.entries() == []
+
+
+@pytest.mark.django_db
+class TestIngestStatuses:
+    @pytest.fixture
+    def buffer(self, settings, monkeypatch):
+        settings.JOBS_INGEST_ENABLED = True
+        # Not started: tests drain it on their own thread, inside the test
+        # transaction.
+        buffer = ingest.StatusIngestBuffer(capacity=4, batch_size=2, flush_interval=60.0)
+        monkeypatch.setattr(ingest, "get_buffer", lambda: buffer)
+        return buffer
+
+    def test_disabled_by_default(self, api_client: APIClient):
+        assert api_client.get("/api/jobs/statuses/ingest/").status_code == 404
+        assert api_client.post("/api/jobs/statuses/ingest/", [], format="json").status_code == 404
+
+    def test_accepts_and_writes_reports(self, api_client: APIClient, buffer):
+        first = create_job(name="Ingest A")
+        second = create_job(name="Ingest B")
+        reported_at = first.current_status_timestamp + timedelta(seconds=1)
+
+        resp = api_client.post(
+            "/api/jobs/statuses/ingest/",
+            [
+                {"id": first.pk, "status_type": "RUNNING", "timestamp": reported_at.isoformat()},
+                {"id": second.pk, "status_type": "FAILED"},
+                {"id": 99999, "status_type": "FAILED"},
+            ],
+            format="json",
+        )
+
+        assert resp.status_code == 202
+        assert resp.json() == {"accepted": 3}
+        assert Job.objects.get(pk=first.pk).current_status_type == JobStatusType.PENDING
+
+        buffer.drain()
+
+        first.refresh_from_db()
+        assert first.current_status_type == JobStatusType.RUNNING
+        assert first.current_status_timestamp == reported_at
+        assert Job.objects.get(pk=second.pk).current_status_type == JobStatusType.FAILED
+        stats = api_client.get("/api/jobs/statuses/ingest/").json()
+        assert stats["written"] == 2
+        assert stats["dropped_missing"] == 1
+        assert stats["pending"] == 0
+
+    def test_full_buffer_returns_503(self, api_client: APIClient, buffer, settings):
+        settings.JOBS_INGEST_ENQUEUE_TIMEOUT_SECONDS = 0
+        job = create_job(name="Ingest")
+        reports = [{"id": job.pk, "status_type": "RUNNING"}] * 3
+
+        assert api_client.post("/api/jobs/statuses/ingest/", reports, format="json").status_code == 202
+        resp = api_client.post("/api/jobs/statuses/ingest/", reports, format="json")
+
+        assert resp.status_code == 503
+        assert resp["Retry-After"] == "1"
+        assert buffer.pending == 3
+
+    def test_rejects_invalid_reports(self, api_client: APIClient, buffer):
+        resp = api_client.post(
+            "/api/jobs/statuses/ingest/",
+            [{"id": 1, "status_type": "EXPLODED"}],
+            format="json",
+        )
+
+        assert resp.status_code == 400
+        assert buffer.pending == 0
 
 
 @pytest.mark.django_db
@@ -194,3 +731,604 @@ class TestJobStatusHistory:
     def test_returns_404_for_nonexistent_job(self, api_client: APIClient):
         resp = api_client.get("/api/jobs/99999/statuses/")
         assert resp.status_code == 404
+
+
+@pytest.mark.django_db
+class TestEmbeddedStatuses:
+    @staticmethod
+    def _job_with_history(name: str, transitions: int = 3) -> Job:
+        job = create_job(name=name)
+        for i in range(transitions):
+            update_job_status(job=job, new_status=JobStatusType.RUNNING if i % 2 else JobStatusType.FAILED)
+        return job
+
+    def test_retrieve_embeds_newest_statuses(self, api_client: APIClient):
+        job = self._job_with_history("Embedded")
+
+        resp = api_client.get(f"/api/jobs/{job.pk}/?include=statuses&statuses_limit=2")
+
+        assert resp.status_code == 200
+        data = resp.json()
+        assert data["name"] == "Embedded"
+        history = api_client.get(f"/api/jobs/{job.pk}/statuses/").json()["results"]
+        assert data["statuses"] == history[:2]
+
+    def test_retrieve_defaults_to_ten_statuses(self, api_client: APIClient):
+        job = self._job_with_history("Long history", transitions=12)
+
+        resp = api_client.get(f"/api/jobs/{job.pk}/?include=statuses")
+
+        assert len(resp.json()["statuses"]) == 10
+
+    @pytest.mark.parametrize(
+        "query",
+        [
+            "include=history",
+            "include=statuses&statuses_limit=0",
+            "include=statuses&statuses_limit=101",
+            "include=statuses&statuses_limit=two",
+            "statuses_limit=5",
+        ],
+    )
+    def test_rejects_invalid_params(self, api_client: APIClient, query: str):
+        job = create_job(name="Validated")
+
+        assert api_client.get(f"/api/jobs/{job.pk}/?{query}").status_code == 400
+        assert api_client.get(f"/api/jobs/?{query}").status_code == 400
+
+    def test_list_embeds_statuses_in_one_query(self, api_client: APIClient):
+        jobs = [self._job_with_history(f"Listed {i}", transitions=i) for i in range(5)]
+
+        query_counts = []
+        for limit in (2, 5):
+            with CaptureQueriesContext(connection) as queries:
+                resp = api_client.get(f"/api/jobs/?include=statuses&statuses_limit=3&limit={limit}")
+            query_counts.append(len(queries))
+
+        assert query_counts[0] == query_counts[1]
+        assert sum("LATERAL" in query["sql"] for query in queries.captured_queries) == 1
+        results = resp.json()["results"]
+        assert [len(job["statuses"]) for job in results] == [3, 3, 3, 2, 1]
+        newest = jobs[-1]
+        newest.refresh_from_db()
+        assert results[0]["statuses"][0]["status_type"] == newest.current_status_type
+
+    def test_list_304_skips_the_history_query(self, api_client: APIClient):
+        self._job_with_history("Revalidated")
+        url = "/api/jobs/?include=statuses"
+        etag = api_client.get(url)["ETag"]
+
+        with CaptureQueriesContext(connection) as queries:
+            resp = api_client.get(url, HTTP_IF_NONE_MATCH=etag)
+
+        assert resp.status_code == 304
+        assert not any("LATERAL" in query["sql"] or "SUM(" in query["sql"] for query in queries.captured_queries)
+
+    def test_late_status_changes_etags(self, api_client: APIClient):
+        job = self._job_with_history("Late")
+        detail_url = f"/api/jobs/{job.pk}/?include=statuses"
+        list_url = "/api/jobs/?include=statuses"
+        history_url = f"/api/jobs/{job.pk}/statuses/"
+        detail_etag = api_client.get(detail_url)["ETag"]
+        list_etag = api_client.get(list_url)["ETag"]
+        history_etag = api_client.get(history_url)["ETag"]
+
+        # Older than the current status: appended to the history only.
+        update_job_status_by_id(
+            job_id=job.pk,
+            new_status=JobStatusType.PENDING,
+            timestamp=job.current_status_timestamp - timedelta(microseconds=1),
+            if_newer=True,
+        )
+
+        assert api_client.get(detail_url, HTTP_IF_NONE_MATCH=detail_etag).status_code == 200
+        assert api_client.get(list_url, HTTP_IF_NONE_MATCH=list_etag).status_code == 200
+        assert api_client.get(history_url, HTTP_IF_NONE_MATCH=history_etag).status_code == 200
+        fresh_etag = api_client.get(list_url)["ETag"]
+        assert api_client.get(list_url, HTTP_IF_NONE_MATCH=fresh_etag).status_code == 304
+
+
+@pytest.mark.django_db
+class TestCursorPagination:
+    @staticmethod
+    def _walk(api_client: APIClient, params: dict, link_key: str = "next") -> list[str]:
+        resp = api_client.get("/api/jobs/", {**params, "pagination": "cursor"})
+        names = []
+        while True:
+            assert resp.status_code == 200
+            data = resp.json()
+            assert "count" not in data
+            names.extend(j["name"] for j in data["results"])
+            if data[link_key] is None:
+                return names
+            resp = api_client.get(data[link_key])
+
+    @pytest.mark.parametrize("sort", ["name", "-name", "created_at", "-created_at"])
+    def test_walks_every_sort_in_offset_order(self, api_client: APIClient, sort: str):
+        for i in range(7):
+            create_job(name=f"Job {i}")
+        # Force ties on created_at so the id tie-breaker is exercised.
+        Job.objects.filter(name__in=["Job 2", "Job 3", "Job 4"]).update(
+            created_at=Job.objects.get(name="Job 2").created_at
+        )
+
+        expected = [
+            j["name"]
+            for j in api_client.get("/api/jobs/", {"sort": sort, "limit": 100}).json()["results"]
+        ]
+        walked = self._walk(api_client, {"sort": sort, "limit": 2})
+
+        assert sorted(walked) == sorted(expected)
+        assert len(walked) == len(set(walked)) == 7
+        if not sort.endswith("created_at"):
+            assert walked == expected
+
+    def test_previous_link_walks_back(self, api_client: APIClient):
+        for i in range(5):
+            create_job(name=f"Job {i}")
+
+        first = api_client.get(
+            "/api/jobs/", {"pagination": "cursor", "sort": "name", "limit": 2}
+        ).json()
+        assert first["previous"] is None
+        second = api_client.get(first["next"]).json()
+        back = api_client.get(second["previous"]).json()
+
+        assert [j["name"] for j in second["results"]] == ["Job 2", "Job 3"]
+        assert [j["name"] for j in back["results"]] == ["Job 0", "Job 1"]
+        assert back["previous"] is None
+
+    def test_composes_with_status_filter(self, api_client: APIClient):
+        create_job(name="Pending Job")
+        for i in range(3):
+            update_job_status(job=create_job(name=f"Running {i}"), new_status=JobStatusType.RUNNING)
+
+        walked = self._walk(api_client, {"status": "RUNNING", "sort": "name", "limit": 2})
+
+        assert walked == ["Running 0", "Running 1", "Running 2"]
+
+    def test_rejects_malformed_cursor(self, api_client: APIClient):
+        resp = api_client.get("/api/jobs/", {"cursor": "not-a-cursor"})
+        assert resp.status_code == 400
+
+    def test_rejects_cursor_from_another_sort(self, api_client: APIClient):
+        for i in range(3):
+            create_job(name=f"Job {i}")
+        next_link = api_client.get(
+            "/api/jobs/", {"pagination": "cursor", "sort": "name", "limit": 1}
+        ).json()["next"]
+        cursor = next_link.split("cursor=")[1].split("&")[0]
+
+        resp = api_client.get("/api/jobs/", {"cursor": cursor, "sort": "-created_at"})
+
+        assert resp.status_code == 400
+
+    def test_status_history_cursor(self, api_client: APIClient):
+        job = create_job(name="History Cursor")
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        update_job_status(job=job, new_status=JobStatusType.COMPLETED)
+
+        first = api_client.get(
+            f"/api/jobs/{job.pk}/statuses/", {"pagination": "cursor", "limit": 2}
+        ).json()
+        second = api_client.get(first["next"]).json()
+
+        statuses = [s["status_type"] for s in first["results"] + second["results"]]
+        assert statuses == ["COMPLETED", "RUNNING", "PENDING"]
+        assert second["next"] is None
+
+
+@pytest.mark.django_db
+class TestConditionalGet:
+    def test_retrieve_returns_304_for_matching_etag(
+        self,
+        api_client: APIClient,
+        django_assert_num_queries,
+    ):
+        job = create_job(name="Conditional")
+        resp = api_client.get(f"/api/jobs/{job.pk}/")
+
+        with django_assert_num_queries(1):
+            not_modified = api_client.get(
+                f"/api/jobs/{job.pk}/", HTTP_IF_NONE_MATCH=resp.headers["ETag"]
+            )
+
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == resp.headers["ETag"]
+
+    def test_retrieve_etag_changes_after_status_update(self, api_client: APIClient):
+        job = create_job(name="Conditional")
+        etag = api_client.get(f"/api/jobs/{job.pk}/").headers["ETag"]
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+
+        resp = api_client.get(f"/api/jobs/{job.pk}/", HTTP_IF_NONE_MATCH=etag)
+
+        assert resp.status_code == 200
+        assert resp.json()["current_status_type"] == "RUNNING"
+
+    def test_if_modified_since_alone_never_returns_304(self, api_client: APIClient):
+        # Last-Modified has whole-second resolution, so an update later in
+        # the same second would go unnoticed; only the ETag validates.
+        job = create_job(name="Conditional")
+        first = api_client.get(f"/api/jobs/{job.pk}/")
+        assert "Last-Modified" not in first
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        since = http_date(job.updated_at.timestamp() + 1)
+
+        resp = api_client.get(f"/api/jobs/{job.pk}/", HTTP_IF_MODIFIED_SINCE=since)
+
+        assert resp.status_code == 200
+        assert resp.json()["current_status_type"] == "RUNNING"
+
+    def test_status_history_revalidates_until_new_status(self, api_client: APIClient):
+        job = create_job(name="Conditional History")
+        url = f"/api/jobs/{job.pk}/statuses/"
+        etag = api_client.get(url).headers["ETag"]
+
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 304
+        assert api_client.get(url, {"limit": 1}, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+        update_job_status(job=job, new_status=JobStatusType.COMPLETED)
+        assert api_client.get(url, HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    def test_list_validators_add_no_queries(self, api_client: APIClient, django_assert_num_queries):
+        create_job(name="Listed")
+
+        # The ETag comes from the page query itself.
+        with django_assert_num_queries(1):
+            resp = api_client.get("/api/jobs/", {"count": "none"})
+        etag = resp.headers["ETag"]
+
+        with django_assert_num_queries(1):
+            resp = api_client.get("/api/jobs/", {"count": "none"}, HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 304
+
+    def test_list_etag_changes_when_a_job_off_the_page_is_added(self, api_client: APIClient):
+        create_job(name="First")
+        etag = api_client.get("/api/jobs/", {"limit": 1, "sort": "created_at"}).headers["ETag"]
+
+        create_job(name="Second")
+
+        resp = api_client.get("/api/jobs/", {"limit": 1, "sort": "created_at"}, HTTP_IF_NONE_MATCH=etag)
+        assert resp.status_code == 200
+        assert resp.json()["count"] == 2
+
+    def test_list_etag_changes_on_delete_and_transition(self, api_client: APIClient):
+        older = create_job(name="Older")
+        create_job(name="Newer")
+        etag = api_client.get("/api/jobs/").headers["ETag"]
+        pending_etag = api_client.get("/api/jobs/", {"status": "PENDING"}).headers["ETag"]
+
+        delete_job(job=older)
+        assert api_client.get("/api/jobs/", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+        update_job_status(job=Job.objects.get(name="Newer"), new_status=JobStatusType.RUNNING)
+        resp = api_client.get("/api/jobs/", {"status": "PENDING"}, HTTP_IF_NONE_MATCH=pending_etag)
+        assert resp.status_code == 200
+        assert resp.json()["results"] == []
+
+
+# Streams read on executor threads with their own connections, so the rows
+# they replay have to be committed.
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.urls("jobs.tests.asgi_urls")
+class TestJobEventStream:
+    @pytest.fixture(autouse=True)
+    def short_streams(self, settings):
+        # Replay what is already committed and close instead of waiting on LISTEN.
+        settings.JOBS_EVENTS_STREAM_SECONDS = 0
+
+    @pytest.fixture
+    def async_client(self) -> SimpleNamespace:
+        return SimpleNamespace(get=async_to_sync(AsyncClient().get))
+
+    @staticmethod
+    async def _body(resp) -> bytes:
+        return b"".join([chunk async for chunk in resp.streaming_content])
+
+    def _read(self, resp) -> list[tuple[str, dict]]:
+        body = async_to_sync(self._body)(resp).decode()
+        events = []
+        for block in body.split("\n\n"):
+            fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+            if "event" in fields:
+                events.append((fields["event"], json.loads(fields["data"])))
+        return events
+
+    def test_replays_events_after_last_event_id(self, async_client):
+        job = create_job(name="Streamed")
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+
+        resp = async_client.get("/api/jobs/events/", headers={"Last-Event-ID": "0"})
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"].startswith("text/event-stream")
+        events = self._read(resp)
+        assert [(name, data["status_type"]) for name, data in events] == [
+            ("created", "PENDING"),
+            ("status_changed", "RUNNING"),
+        ]
+        assert all(data["job_id"] == job.pk for _, data in events)
+
+    def test_starts_from_now_without_last_event_id(self, async_client):
+        create_job(name="Before Connect")
+
+        assert self._read(async_client.get("/api/jobs/events/")) == []
+
+    def test_filters_by_job_and_status(self, async_client):
+        watched = create_job(name="Watched")
+        create_job(name="Ignored")
+        update_job_status(job=watched, new_status=JobStatusType.FAILED)
+
+        by_job = self._read(
+            async_client.get("/api/jobs/events/", {"job_id": watched.pk, "last_event_id": 0})
+        )
+        by_status = self._read(
+            async_client.get("/api/jobs/events/", {"status": "FAILED", "last_event_id": 0})
+        )
+
+        assert {data["job_name"] for _, data in by_job} == {"Watched"}
+        assert [name for name, _ in by_status] == ["status_changed"]
+
+    def test_rejects_invalid_parameters(self, async_client):
+        assert async_client.get("/api/jobs/events/", {"status": "INVALID"}).status_code == 400
+        assert async_client.get("/api/jobs/events/", headers={"Last-Event-ID": "abc"}).status_code == 400
+
+    def test_streams_share_one_listen_connection(self, settings):
+        settings.JOBS_EVENTS_STREAM_SECONDS = 30
+        settings.JOBS_EVENTS_HEARTBEAT_SECONDS = 30
+
+        @sync_to_async
+        def listen_connections() -> int:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT count(*) FROM pg_stat_activity WHERE state = 'idle' AND query = %s",
+                    [f"LISTEN {CHANNEL}"],
+                )
+                return cursor.fetchone()[0]
+
+        async def wait_for_listen_connections(expected: int) -> bool:
+            for _ in range(50):
+                if await listen_connections() == expected:
+                    return True
+                await asyncio.sleep(0.1)
+            return False
+
+        async def fan_out() -> list[str]:
+            streams = [stream_job_events(last_event_id=0) for _ in range(3)]
+            for stream in streams:
+                assert await anext(stream) == "retry: 1000\n\n"
+            waiting = [asyncio.ensure_future(anext(stream)) for stream in streams]
+            assert await wait_for_listen_connections(1)
+            assert not any(task.done() for task in waiting)
+
+            await sync_to_async(create_job)(name="Fanned Out")
+            chunks = await asyncio.wait_for(asyncio.gather(*waiting), timeout=5)
+
+            for stream in streams:
+                await stream.aclose()
+            # The last stream to leave closes the LISTEN connection.
+            assert await wait_for_listen_connections(0)
+            return chunks
+
+        chunks = async_to_sync(fan_out)()
+
+        assert all("event: created" in chunk and "Fanned Out" in chunk for chunk in chunks)
+
+    @pytest.mark.urls("config.urls")
+    def test_has_no_wsgi_route(self, api_client: APIClient):
+        # Under WSGI the path is read as a job id.
+        assert resolve("/api/jobs/events/").url_name == "job-detail"
+        assert api_client.get("/api/jobs/events/").status_code == 400
+
+
+@pytest.mark.django_db
+class TestExportJobs:
+    def test_streams_ndjson_with_history(self, api_client: APIClient):
+        first = create_job(name="Export A")
+        update_job_status(job=first, new_status=JobStatusType.RUNNING)
+        create_job(name="Export B")
+
+        resp = api_client.get("/api/jobs/export/", {"include": "statuses"})
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"].startswith("application/x-ndjson")
+        lines = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+        assert [line["name"] for line in lines] == ["Export A", "Export B"]
+        assert [s["status_type"] for s in lines[0]["statuses"]] == ["RUNNING", "PENDING"]
+        assert [s["status_type"] for s in lines[1]["statuses"]] == ["PENDING"]
+        # Same field formatting as the REST detail endpoint
+        detail = api_client.get(f"/api/jobs/{first.pk}/").json()
+        assert {k: v for k, v in lines[0].items() if k != "statuses"} == detail
+
+    def test_streams_csv_one_row_per_status(self, api_client: APIClient):
+        job = create_job(name="Export CSV")
+        update_job_status(job=job, new_status=JobStatusType.COMPLETED)
+
+        resp = api_client.get("/api/jobs/export/", {"format": "csv", "include": "statuses"})
+
+        assert resp["Content-Type"].startswith("text/csv")
+        rows = list(csv.DictReader(io.StringIO(b"".join(resp.streaming_content).decode())))
+        assert [(r["name"], r["status_type"]) for r in rows] == [
+            ("Export CSV", "COMPLETED"),
+            ("Export CSV", "PENDING"),
+        ]
+
+    @pytest.mark.django_db(transaction=True)
+    def test_reads_in_one_repeatable_read_transaction(self):
+        create_job(name="Export Snapshot")
+        rows = iter_export_rows(include_statuses=True)
+
+        next(rows)
+        # Mid-stream: the cursors are inside the export's own transaction,
+        # so they are not WITH HOLD.
+        assert connection.in_atomic_block
+        with connection.cursor() as cursor:
+            cursor.execute("SHOW transaction_isolation")
+            assert cursor.fetchone() == ("repeatable read",)
+            cursor.execute("SELECT count(*) FROM pg_cursors WHERE is_holdable")
+            assert cursor.fetchone() == (0,)
+        assert list(rows) == []
+        assert not connection.in_atomic_block
+
+    def test_filters_by_status(self, api_client: APIClient):
+        create_job(name="Pending Export")
+        update_job_status(job=create_job(name="Failed Export"), new_status=JobStatusType.FAILED)
+
+        resp = api_client.get("/api/jobs/export/", {"status": "FAILED"})
+
+        lines = [json.loads(line) for line in b"".join(resp.streaming_content).splitlines()]
+        assert [line["name"] for line in lines] == ["Failed Export"]
+        assert "statuses" not in lines[0]
+
+    def test_rejects_invalid_status(self, api_client: APIClient):
+        assert api_client.get("/api/jobs/export/", {"status": "INVALID"}).status_code == 400
+
+
+@pytest.mark.django_db
+class TestFastJSONApi:
+    @pytest.fixture
+    def fast_json(self, monkeypatch):
+        pytest.importorskip("orjson")
+        from jobs.fastjson import ORJSONParser, ORJSONRenderer
+
+        # Views read the renderer/parser settings at import time.
+        monkeypatch.setattr(JobViewSet, "renderer_classes", [ORJSONRenderer])
+        monkeypatch.setattr(JobViewSet, "parser_classes", [ORJSONParser])
+
+    def test_list_response_is_byte_identical(self, api_client: APIClient, request):
+        for i in range(3):
+            job = create_job(name=f"Fast {i}")
+            update_job_status(job=job, new_status=JobStatusType.RUNNING)
+
+        expected = api_client.get("/api/jobs/").content
+        request.getfixturevalue("fast_json")
+        actual = api_client.get("/api/jobs/").content
+
+        assert actual == expected
+
+    def test_create_accepts_json_body(self, api_client: APIClient, fast_json):
+        response = api_client.post("/api/jobs/", {"name": "Parsed"}, format="json")
+
+        assert response.status_code == 201
+        assert response["Content-Type"] == "application/json"
+        assert response.json()["name"] == "Parsed"
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("jobs.tests.asgi_urls")
+class TestAsyncReadViews:
+    @pytest.fixture
+    def async_api(self):
+        client = AsyncClient()
+        return SimpleNamespace(
+            get=async_to_sync(client.get),
+            post=async_to_sync(client.post),
+        )
+
+    @pytest.fixture
+    def sync_api(self, api_client: APIClient):
+        # This class routes through the ASGI urls; expected responses come
+        # from the JobViewSet routes.
+        def get(*args, **kwargs):
+            with override_settings(ROOT_URLCONF="config.urls"):
+                return api_client.get(*args, **kwargs)
+
+        return SimpleNamespace(get=get)
+
+    def test_list_matches_sync_view(self, sync_api, async_api):
+        for i in range(3):
+            update_job_status(job=create_job(name=f"Async {i}"), new_status=JobStatusType.RUNNING)
+
+        for query in ("?limit=2", "?pagination=cursor&limit=2&sort=name", "?count=none&status=RUNNING"):
+            expected = sync_api.get(f"/api/jobs/{query}")
+            actual = async_api.get(f"/api/jobs/{query}")
+
+            assert actual.status_code == 200
+            assert actual.content == expected.content
+            assert actual["ETag"] == expected["ETag"]
+            assert actual["Content-Type"] == "application/json"
+
+    def test_list_returns_not_modified(self, async_api):
+        create_job(name="Async Cached")
+        etag = async_api.get("/api/jobs/")["ETag"]
+
+        resp = async_api.get("/api/jobs/", headers={"If-None-Match": etag})
+
+        assert resp.status_code == 304
+
+    def test_list_rejects_invalid_params(self, async_api):
+        assert async_api.get("/api/jobs/?status=NOPE").status_code == 400
+        assert async_api.get("/api/jobs/?cursor=garbage").json() == {"detail": "Invalid cursor."}
+
+    def test_retrieve_and_statuses_match_sync_view(self, sync_api, async_api):
+        job = create_job(name="Async Detail")
+        update_job_status(job=job, new_status=JobStatusType.COMPLETED)
+
+        for url in (f"/api/jobs/{job.id}/", f"/api/jobs/{job.id}/statuses/?limit=1"):
+            expected = sync_api.get(url)
+            actual = async_api.get(url)
+
+            assert actual.content == expected.content
+            assert actual["ETag"] == expected["ETag"]
+            assert "Last-Modified" not in actual
+
+    def test_embedded_statuses_match_sync_view(self, sync_api, async_api):
+        job = create_job(name="Async Embedded")
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+
+        for url in (f"/api/jobs/{job.id}/?include=statuses", "/api/jobs/?include=statuses&statuses_limit=1"):
+            expected = sync_api.get(url)
+            actual = async_api.get(url)
+
+            assert actual.status_code == 200
+            assert actual.content == expected.content
+            assert actual["ETag"] == expected["ETag"]
+
+    def test_retrieve_missing_job(self, async_api):
+        assert async_api.get("/api/jobs/999999/").status_code == 404
+
+    def test_negotiates_content_like_sync_view(self, sync_api, async_api):
+        job = create_job(name="Async Negotiated")
+
+        for url, accept in (
+            (f"/api/jobs/{job.id}/?format=json", "*/*"),
+            ("/api/jobs/", "text/csv"),
+            ("/api/jobs/export/?format=xml", "*/*"),
+        ):
+            expected = sync_api.get(url, HTTP_ACCEPT=accept)
+            actual = async_api.get(url, headers={"Accept": accept})
+
+            assert actual.status_code == expected.status_code
+            assert actual["Content-Type"] == expected["Content-Type"]
+            assert actual.content == expected.content
+
+    def test_streams_export_from_async_iterator(self, sync_api, async_api):
+        update_job_status(job=create_job(name="Async Export"), new_status=JobStatusType.RUNNING)
+        url = "/api/jobs/export/?format=csv&include=statuses"
+
+        resp = async_api.get(url)
+
+        assert resp.is_async
+        assert resp["Content-Type"].startswith("text/csv")
+        assert async_to_sync(self._read)(resp) == b"".join(sync_api.get(url).streaming_content)
+
+    @pytest.mark.django_db(transaction=True)
+    def test_streams_events_from_async_iterator(self, settings, async_api):
+        settings.JOBS_EVENTS_STREAM_SECONDS = 0
+        create_job(name="Async Streamed")
+
+        resp = async_api.get("/api/jobs/events/", headers={"Last-Event-ID": "0"})
+
+        assert resp.is_async
+        assert b"event: created" in async_to_sync(self._read)(resp)
+
+    @staticmethod
+    async def _read(resp) -> bytes:
+        return b"".join([chunk async for chunk in resp.streaming_content])
+
+    def test_other_methods_fall_through_to_viewset(self, async_api):
+        resp = async_api.post("/api/jobs/", {"name": "Async Create"}, content_type="application/json")
+
+        assert resp.status_code == 201
+        assert Job.objects.filter(name="Async Create").exists()
@@ -0,0 +1,130 @@
+import json
+from io import StringIO
+
+import pytest
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import connection
+
+from jobs.enums import JobStatusType
+from jobs.models import Job, JobStatus, JobStatusCount
+from jobs.selectors import get_job_status_summary
+from jobs.services import create_job, update_job_status
+
+
+@pytest.mark.django_db
+class TestRebuildJobCounts:
+    def test_repairs_drifted_counters(self):
+        job = create_job(name="Counted")
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        JobStatusCount.objects.filter(status_type=JobStatusType.RUNNING).update(count=42)
+
+        out = StringIO()
+        call_command("rebuild_job_counts", stdout=out)
+
+        assert get_job_status_summary()[JobStatusType.RUNNING] == 1
+        assert "drift -41" in out.getvalue()
+
+    def test_check_does_not_write(self):
+        create_job(name="Counted")
+        JobStatusCount.objects.filter(status_type=JobStatusType.PENDING).update(count=0)
+
+        out = StringIO()
+        call_command("rebuild_job_counts", "--check", stdout=out)
+
+        assert get_job_status_summary()[JobStatusType.PENDING] == 0
+        assert "Counters have drifted." in out.getvalue()
+
+
+@pytest.mark.django_db
+class TestExportJobs:
+    def test_writes_ndjson_to_stdout(self):
+        create_job(name="Exported")
+
+        out = StringIO()
+        call_command("export_jobs", "--include-statuses", stdout=out)
+
+        lines = [json.loads(line) for line in out.getvalue().splitlines()]
+        assert lines[0]["name"] == "Exported"
+        assert lines[0]["statuses"][0]["status_type"] == "PENDING"
+
+    def test_writes_csv_to_file(self, tmp_path):
+        create_job(name="Exported")
+        target = tmp_path / "jobs.csv"
+
+        call_command("export_jobs", "--format", "csv", "--output", str(target))
+
+        header, row = target.read_text().splitlines()
+        assert header.startswith("id,name,current_status_type")
+        assert ",Exported,PENDING," in row
+
+
+# Seeding commits chunk by chunk and ANALYZEs, whose row estimates outlive a
+# rollback and would change the plans other tests check. Transactional tests
+# run after all others.
+@pytest.mark.django_db
+class TestSlowQueries:
+    def test_replays_paths_and_prints_plans(self):
+        create_job(name="Replayed")
+
+        out = StringIO()
+        call_command("slow_queries", "/api/jobs/?status=PENDING", "--threshold-ms", "0", stdout=out)
+
+        output = out.getvalue()
+        assert '"jobs_job"."current_status_type" = ?' in output
+        assert "actual time=" in output
+        assert "statement(s) at or over 0 ms." in output
+
+    def test_json_output(self):
+        out = StringIO()
+        call_command(
+            "slow_queries", "/api/jobs/", "--threshold-ms=0", "--explain-rate=0", "--json", stdout=out
+        )
+
+        entries = json.loads(out.getvalue())
+        assert entries and all(entry["plan"] is None for entry in entries)
+
+    def test_rejects_urls(self):
+        with pytest.raises(CommandError):
+            call_command("slow_queries", "http://localhost/api/jobs/")
+
+
+@pytest.mark.django_db(transaction=True)
+class TestSeedJobs:
+    def test_loads_consistent_jobs_and_histories(self):
+        out = StringIO()
+        call_command("seed_jobs", "--jobs", "25", "--chunk-size", "10", "--seed", "7", stdout=out)
+
+        jobs = list(Job.objects.all())
+        assert len(jobs) == 25
+        assert all(job.name == f"seed-{job.pk}" for job in jobs)
+        for job in jobs:
+            latest = JobStatus.objects.filter(job=job).order_by("-timestamp", "-id").first()
+            assert (job.current_status_type, job.current_status_timestamp) == (
+                latest.status_type,
+                latest.timestamp,
+            )
+            assert job.updated_at == latest.timestamp
+            assert job.created_at == JobStatus.objects.filter(job=job).order_by("timestamp", "id").first().timestamp
+        assert sum(get_job_status_summary().values()) == 25
+        assert f"Seeded 25 jobs and {JobStatus.objects.count()} statuses" in out.getvalue()
+
+    def test_status_mix_and_history_depth(self):
+        call_command(
+            "seed_jobs",
+            "--jobs", "10",
+            "--status-mix", "failed=1",
+            "--history-mean", "1",
+            "--defer-indexes",
+            stdout=StringIO(),
+        )
+
+        assert set(Job.objects.values_list("current_status_type", flat=True)) == {JobStatusType.FAILED}
+        assert JobStatus.objects.count() == 10
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT count(*) FROM pg_indexes WHERE indexname = 'idx_status_job_ts_id_desc'")
+            assert cursor.fetchone() == (1,)
+
+    def test_rejects_invalid_status_mix(self):
+        with pytest.raises(CommandError, match="Invalid status mix entry"):
+            call_command("seed_jobs", "--jobs", "1", "--status-mix", "EXPLODED=1")
@@ -0,0 +1,149 @@
+from types import SimpleNamespace
+
+import pytest
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connections
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+from jobs import db_routers
+from jobs.db_routers import PrimaryReplicaRouter, ReadYourWritesMiddleware
+from jobs.models import Job
+
+
+@pytest.fixture(autouse=True)
+def isolated_routing_state(monkeypatch):
+    token = db_routers._pinned.set(False)
+    monkeypatch.setattr(db_routers, "_replica_down_until", {})
+    yield
+    db_routers._pinned.reset(token)
+
+
+@pytest.fixture
+def router(monkeypatch) -> PrimaryReplicaRouter:
+    monkeypatch.setattr(db_routers, "_is_available", lambda alias: True)
+    router = PrimaryReplicaRouter()
+    router.replicas = ["replica1", "replica2"]
+    return router
+
+
+class TestPrimaryReplicaRouter:
+    def test_reads_go_to_replicas_and_writes_to_primary(self, router):
+        assert router.db_for_read(Job) in {"replica1", "replica2"}
+        assert router.db_for_write(Job) == DEFAULT_DB_ALIAS
+
+    def test_reads_after_a_write_stay_on_primary(self, router):
+        router.db_for_write(Job)
+
+        assert router.db_for_read(Job) == DEFAULT_DB_ALIAS
+
+    def test_reads_inside_a_transaction_stay_on_primary(self, router, monkeypatch):
+        monkeypatch.setattr(connections[DEFAULT_DB_ALIAS], "in_atomic_block", True)
+
+        assert router.db_for_read(Job) == DEFAULT_DB_ALIAS
+
+    def test_unavailable_replica_is_skipped_until_retry(self, router, monkeypatch):
+        attempts = []
+
+        def is_available(alias):
+            attempts.append(alias)
+            return alias == "replica2"
+
+        monkeypatch.setattr(db_routers, "_is_available", is_available)
+
+        assert {router.db_for_read(Job) for _ in range(10)} == {"replica2"}
+        assert attempts.count("replica1") == 1
+
+    def test_failed_replica_is_retried_after_the_cooldown(self, router, monkeypatch, settings):
+        settings.JOBS_REPLICA_RETRY_SECONDS = 30
+        clock = [1000.0]
+        attempts = []
+
+        def is_available(alias):
+            attempts.append(alias)
+            return False
+
+        monkeypatch.setattr(db_routers.time, "monotonic", lambda: clock[0])
+        monkeypatch.setattr(db_routers, "_is_available", is_available)
+
+        assert router.db_for_read(Job) == DEFAULT_DB_ALIAS
+        clock[0] += 29
+        assert router.db_for_read(Job) == DEFAULT_DB_ALIAS
+        assert len(attempts) == 2
+
+        clock[0] += 2
+        router.db_for_read(Job)
+        assert len(attempts) == 4
+
+    def test_pool_timeout_marks_the_replica_down(self, monkeypatch):
+        waits = []
+
+        def ensure_connection():
+            # What a psycopg_pool PoolTimeout surfaces as.
+            waits.append(1)
+            raise OperationalError("couldn't get a connection after 1.00 sec")
+
+        replica = SimpleNamespace(connection=None, ensure_connection=ensure_connection)
+        monkeypatch.setattr(
+            db_routers, "connections", {DEFAULT_DB_ALIAS: connections[DEFAULT_DB_ALIAS], "replica1": replica}
+        )
+        router = PrimaryReplicaRouter()
+        router.replicas = ["replica1"]
+
+        assert {router.db_for_read(Job) for _ in range(5)} == {DEFAULT_DB_ALIAS}
+        assert len(waits) == 1
+
+    def test_falls_back_to_primary_when_no_replica_is_available(self, router, monkeypatch):
+        monkeypatch.setattr(db_routers, "_is_available", lambda alias: False)
+
+        assert router.db_for_read(Job) == DEFAULT_DB_ALIAS
+
+    def test_migrations_only_run_on_primary(self, router):
+        assert router.allow_migrate(DEFAULT_DB_ALIAS, "jobs") is True
+        assert router.allow_migrate("replica1", "jobs") is False
+
+
+class TestReadYourWritesMiddleware:
+    def run(self, request, status=200, cookies=None):
+        seen = {}
+
+        def get_response(request):
+            seen["pinned"] = db_routers._pinned.get()
+            return HttpResponse(status=status)
+
+        request.COOKIES.update({name: morsel.value for name, morsel in (cookies or {}).items()})
+        response = ReadYourWritesMiddleware(get_response)(request)
+        return seen["pinned"], response.cookies
+
+    def test_pins_client_after_successful_write(self):
+        rf = RequestFactory()
+
+        assert self.run(rf.get("/api/jobs/"))[0] is False
+        _, cookies = self.run(rf.post("/api/jobs/"), status=201)
+
+        # The pin travels with the client, not with the worker or address.
+        assert self.run(rf.get("/api/jobs/"), cookies=cookies)[0] is True
+        assert self.run(rf.get("/api/jobs/"))[0] is False
+
+    def test_failed_write_does_not_pin(self):
+        _, cookies = self.run(RequestFactory().post("/api/jobs/"), status=400)
+
+        assert db_routers.PIN_COOKIE not in cookies
+
+    def test_forged_or_expired_pin_is_ignored(self, settings):
+        rf = RequestFactory()
+        _, cookies = self.run(rf.post("/api/jobs/"), status=201)
+        forged = rf.get("/api/jobs/")
+        forged.COOKIES[db_routers.PIN_COOKIE] = "1"
+
+        assert self.run(forged)[0] is False
+        settings.JOBS_READ_YOUR_WRITES_SECONDS = -1
+        assert self.run(rf.get("/api/jobs/"), cookies=cookies)[0] is False
+
+    def test_pin_does_not_leak_past_the_request(self):
+        def get_response(request):
+            db_routers.pin_to_primary()
+            return HttpResponse()
+
+        ReadYourWritesMiddleware(get_response)(RequestFactory().get("/api/jobs/"))
+
+        assert db_routers._pinned.get() is False
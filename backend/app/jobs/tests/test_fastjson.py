@@ -0,0 +1,55 @@
+import io
+import json
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+
+import pytest
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+pytest.importorskip("orjson")
+
+from jobs.fastjson import ORJSONParser, ORJSONRenderer  # noqa: E402
+
+
+class TestORJSONRenderer:
+    @pytest.mark.parametrize(
+        "data",
+        [
+            {"created_at": datetime(2026, 1, 1, 12, 0, 0, 123456, tzinfo=timezone.utc)},
+            {"created_at": datetime(2026, 1, 1, tzinfo=timezone(timedelta(hours=5, minutes=30)))},
+            {"name": "ünïcode \u2028 and \u2029 \"quoted\" </script>"},
+            {"amount": Decimal("1.50"), "elapsed": timedelta(seconds=90), "label": gettext_lazy("Jobs")},
+            {1: [None, True, 3], "nested": [{"a": []}]},
+            [],
+        ],
+    )
+    def test_matches_drf_json_renderer(self, data):
+        assert ORJSONRenderer().render(data) == JSONRenderer().render(data)
+
+    def test_indented_requests_use_stdlib_path(self):
+        data = {"a": [1, 2]}
+        media_type = "application/json; indent=4"
+
+        assert ORJSONRenderer().render(data, media_type) == JSONRenderer().render(data, media_type)
+
+    def test_none_renders_empty_body(self):
+        assert ORJSONRenderer().render(None) == b""
+
+
+class TestORJSONParser:
+    def test_parses_like_json_parser(self):
+        body = json.dumps({"names": ["a", "ü"], "all_or_nothing": False}).encode()
+
+        assert ORJSONParser().parse(io.BytesIO(body)) == JSONParser().parse(io.BytesIO(body))
+
+    def test_invalid_json_raises_parse_error(self):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"name": '))
+
+    def test_rejects_non_finite_constants(self):
+        with pytest.raises(ParseError):
+            ORJSONParser().parse(io.BytesIO(b'{"value": NaN}'))
+
@@ -0,0 +1,169 @@
+import threading
+from datetime import timedelta
+
+import pytest
+from django.utils import timezone
+
+from jobs.enums import JobStatusType
+from jobs.ingest import (
+    IngestBufferClosed,
+    IngestBufferFull,
+    StatusIngestBuffer,
+    StatusReport,
+    write_status_reports,
+)
+from jobs.models import Job, JobStatus
+from jobs.services import create_job
+
+
+class RecordingWriter:
+    def __init__(self, fail_times: int = 0) -> None:
+        self.batches: list[list[StatusReport]] = []
+        self.fail_times = fail_times
+        self.written = threading.Event()
+
+    def __call__(self, batch: list[StatusReport]) -> int:
+        if self.fail_times:
+            self.fail_times -= 1
+            raise RuntimeError("database unavailable")
+        self.batches.append(batch)
+        self.written.set()
+        return 0
+
+
+def _reports(count: int, start: int = 1) -> list[StatusReport]:
+    now = timezone.now()
+    return [StatusReport(job_id, JobStatusType.RUNNING, now) for job_id in range(start, start + count)]
+
+
+def _buffer(writer: RecordingWriter, **overrides) -> StatusIngestBuffer:
+    options = {"capacity": 10, "batch_size": 4, "flush_interval": 60.0, "write_batch": writer}
+    options.update(overrides)
+    return StatusIngestBuffer(**options)
+
+
+class TestStatusIngestBuffer:
+    def test_drain_writes_in_batches(self):
+        writer = RecordingWriter()
+        buffer = _buffer(writer)
+
+        buffer.submit(_reports(6), timeout=0)
+        buffer.drain()
+
+        assert [len(batch) for batch in writer.batches] == [4, 2]
+        assert buffer.get_stats()["written"] == 6
+        assert buffer.pending == 0
+
+    def test_flushes_when_batch_is_full(self):
+        writer = RecordingWriter()
+        buffer = _buffer(writer)
+        buffer.start()
+        try:
+            buffer.submit(_reports(4), timeout=0)
+            assert writer.written.wait(5)
+            assert [len(batch) for batch in writer.batches] == [4]
+        finally:
+            buffer.close(timeout=5)
+
+    def test_flushes_partial_batch_after_interval(self):
+        writer = RecordingWriter()
+        buffer = _buffer(writer, flush_interval=0.05)
+        buffer.start()
+        try:
+            buffer.submit(_reports(1), timeout=0)
+            assert writer.written.wait(5)
+            assert [len(batch) for batch in writer.batches] == [1]
+        finally:
+            buffer.close(timeout=5)
+
+    def test_rejects_when_full(self):
+        buffer = _buffer(RecordingWriter())
+        buffer.submit(_reports(8), timeout=0)
+
+        with pytest.raises(IngestBufferFull):
+            buffer.submit(_reports(3), timeout=0.01)
+
+        stats = buffer.get_stats()
+        assert stats["pending"] == 8
+        assert stats["accepted"] == 8
+        assert stats["rejected"] == 3
+
+    def test_submitter_waits_for_room(self):
+        writer = RecordingWriter()
+        buffer = _buffer(writer)
+        buffer.submit(_reports(8), timeout=0)
+
+        drainer = threading.Timer(0.05, buffer.drain)
+        drainer.start()
+        try:
+            buffer.submit(_reports(3), timeout=5)
+        finally:
+            drainer.join()
+
+        assert buffer.get_stats()["accepted"] == 11
+
+    def test_rejects_batches_larger_than_capacity(self):
+        buffer = _buffer(RecordingWriter())
+        with pytest.raises(ValueError):
+            buffer.submit(_reports(11), timeout=0)
+
+    def test_close_writes_pending_reports_and_refuses_new_ones(self):
+        writer = RecordingWriter()
+        buffer = _buffer(writer)
+        buffer.start()
+        buffer.submit(_reports(3), timeout=0)
+
+        buffer.close(timeout=5)
+
+        assert sum(len(batch) for batch in writer.batches) == 3
+        assert not buffer.get_stats()["running"]
+        with pytest.raises(IngestBufferClosed):
+            buffer.submit(_reports(1), timeout=0)
+
+    def test_failed_batch_is_retried(self):
+        writer = RecordingWriter(fail_times=1)
+        buffer = _buffer(writer, flush_interval=0.01)
+        buffer.submit(_reports(3), timeout=0)
+
+        buffer.drain()
+
+        assert [len(batch) for batch in writer.batches] == [3]
+        stats = buffer.get_stats()
+        assert stats["failed_batches"] == 1
+        assert stats["written"] == 3
+
+    def test_batch_that_keeps_failing_is_dropped(self):
+        writer = RecordingWriter(fail_times=2)
+        buffer = _buffer(writer, flush_interval=0.01, max_attempts=2)
+        buffer.submit(_reports(4), timeout=0)
+        buffer.submit(_reports(2, start=5), timeout=0)
+
+        buffer.drain()
+
+        # The failing batch is retried as it was, then dropped; later
+        # reports are still written.
+        assert [[report.job_id for report in batch] for batch in writer.batches] == [[5, 6]]
+        stats = buffer.get_stats()
+        assert (stats["failed_batches"], stats["dropped_failed"], stats["written"]) == (2, 4, 2)
+
+
+@pytest.mark.django_db
+class TestWriteStatusReports:
+    def test_writes_reports_and_counts_missing_jobs(self):
+        job = create_job(name="Ingested")
+        reported_at = job.current_status_timestamp + timedelta(seconds=1)
+
+        dropped = write_status_reports(
+            [
+                StatusReport(job.pk, JobStatusType.RUNNING, reported_at),
+                StatusReport(99999, JobStatusType.RUNNING, reported_at),
+                StatusReport(99999, JobStatusType.FAILED, reported_at),
+            ]
+        )
+
+        assert dropped == 2
+        job.refresh_from_db()
+        assert job.current_status_type == JobStatusType.RUNNING
+        assert job.current_status_timestamp == reported_at
+        assert JobStatus.objects.get(job=job, status_type=JobStatusType.RUNNING).timestamp == reported_at
+        assert Job.objects.count() == 1
@@ -0,0 +1,117 @@
+import json
+import logging
+
+import pytest
+from asgiref.sync import async_to_sync
+from django.test import AsyncClient
+from rest_framework.test import APIClient
+
+from jobs.instrumentation import RequestMetrics, _current
+from jobs.models import Job
+from jobs.services import create_job
+
+
+@pytest.fixture
+def metrics_enabled(metrics_middleware, query_recorder):
+    settings = metrics_middleware
+    settings.JOBS_REQUEST_METRICS_ENABLED = True
+    settings.JOBS_REQUEST_METRICS_SAMPLE_RATE = 1.0
+    settings.JOBS_REQUEST_METRICS_SERVER_TIMING = True
+    return settings
+
+
+@pytest.fixture
+def request_log(caplog):
+    logger = logging.getLogger("jobs.requests")
+    logger.addHandler(caplog.handler)
+    caplog.set_level(logging.INFO, logger="jobs.requests")
+    yield lambda: [json.loads(record.getMessage()) for record in caplog.records if record.name == "jobs.requests"]
+    logger.removeHandler(caplog.handler)
+
+
+def _server_timing(response) -> dict[str, str]:
+    entries = {}
+    for entry in response["Server-Timing"].split(", "):
+        name, _, rest = entry.partition(";")
+        entries[name] = rest
+    return entries
+
+
+@pytest.mark.django_db
+class TestRequestMetricsMiddleware:
+    def test_reports_phases_and_queries(self, metrics_enabled, request_log):
+        job = create_job(name="Timed")
+
+        resp = APIClient().get(f"/api/jobs/{job.pk}/")
+
+        assert resp.status_code == 200
+        timing = _server_timing(resp)
+        assert set(timing) == {"total", "db", "view", "serializer", "render"}
+        assert timing["db"].endswith('desc="1 queries"')
+        [record] = request_log()
+        assert record["view"] == "job-detail"
+        assert record["action"] == "retrieve"
+        assert record["status"] == 200
+        assert record["queries"] == 1
+        assert record["total_ms"] >= record["view_ms"] >= record["serializer_ms"] > 0
+
+    def test_counts_writes_and_list_fast_path(self, metrics_enabled, request_log):
+        client = APIClient()
+        client.post("/api/jobs/", {"name": "Timed"}, format="json")
+        client.get("/api/jobs/")
+
+        create, listing = request_log()
+        # The single INSERT statement runs in a savepoint inside the test
+        # transaction.
+        assert (create["action"], create["status"], create["queries"]) == ("create", 201, 3)
+        assert listing["action"] == "list"
+        assert listing["serializer_ms"] > 0
+
+    def test_unsampled_requests_are_not_measured(self, metrics_enabled, request_log):
+        metrics_enabled.JOBS_REQUEST_METRICS_SAMPLE_RATE = 0.0
+
+        resp = APIClient().get("/api/jobs/")
+
+        assert "Server-Timing" not in resp
+        assert request_log() == []
+
+    def test_server_timing_header_can_be_disabled(self, metrics_enabled, request_log):
+        metrics_enabled.JOBS_REQUEST_METRICS_SERVER_TIMING = False
+
+        resp = APIClient().get("/api/jobs/")
+
+        assert "Server-Timing" not in resp
+        assert len(request_log()) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("jobs.tests.asgi_urls")
+class TestAsyncRequestMetrics:
+    def test_counts_queries_run_through_sync_to_async(self, metrics_enabled, request_log):
+        # Async views query through sync_to_async, which carries the
+        # request's context (and so its metrics) to the query.
+        job = create_job(name="Async timed")
+
+        resp = async_to_sync(AsyncClient().get)(f"/api/jobs/{job.pk}/")
+
+        assert resp.status_code == 200
+        assert "db" in _server_timing(resp)
+        [record] = request_log()
+        assert record["queries"] >= 1
+
+
+@pytest.mark.django_db
+class TestRecordQuery:
+    def test_counts_only_while_a_request_is_measured(self, query_recorder):
+        Job.objects.count()
+
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        try:
+            Job.objects.count()
+            Job.objects.exists()
+        finally:
+            _current.reset(token)
+
+        assert metrics.queries == 2
+        assert metrics.db_ms > 0
@@ -0,0 +1,86 @@
+import pytest
+from django.test import RequestFactory
+from rest_framework.test import APIClient
+
+pytest.importorskip("prometheus_client")
+
+from prometheus_client import REGISTRY  # noqa: E402
+
+from jobs import metrics  # noqa: E402
+from jobs.enums import JobEventType, JobStatusType  # noqa: E402
+from jobs.models import Job  # noqa: E402
+from jobs.services import create_job, update_job_status  # noqa: E402
+from jobs.signals import job_events_committed  # noqa: E402
+
+
+@pytest.fixture
+def metrics_export(metrics_middleware, query_recorder):
+    settings = metrics_middleware
+    settings.JOBS_METRICS_ENABLED = True
+    settings.JOBS_REQUEST_METRICS_ENABLED = False
+    return settings
+
+
+def _sample(name: str, **labels: str) -> float:
+    return REGISTRY.get_sample_value(name, labels) or 0.0
+
+
+@pytest.mark.django_db
+class TestRequestMetrics:
+    def test_observes_every_request_by_view_and_action(self, metrics_export):
+        job = create_job(name="Measured")
+        labels = {"view": "job-detail", "action": "retrieve"}
+        requests_before = _sample(
+            "jobs_http_request_duration_seconds_count", **labels, method="GET", status="200"
+        )
+        queries_before = _sample("jobs_http_request_db_queries_sum", **labels)
+
+        client = APIClient()
+        for _ in range(2):
+            resp = client.get(f"/api/jobs/{job.pk}/")
+            # Request logging is off, so nothing is reported to the client.
+            assert "Server-Timing" not in resp
+
+        assert (
+            _sample("jobs_http_request_duration_seconds_count", **labels, method="GET", status="200")
+            == requests_before + 2
+        )
+        assert _sample("jobs_http_request_db_queries_sum", **labels) == queries_before + 2
+
+    def test_labels_errors_with_their_status(self, metrics_export):
+        labels = {"view": "job-detail", "action": "retrieve", "method": "GET", "status": "404"}
+        before = _sample("jobs_http_request_duration_seconds_count", **labels)
+
+        APIClient().get("/api/jobs/0/")
+
+        assert _sample("jobs_http_request_duration_seconds_count", **labels) == before + 1
+
+
+@pytest.mark.django_db
+class TestJobMetrics:
+    def test_counts_committed_events(self, django_capture_on_commit_callbacks):
+        # Same dispatch_uid as apps.ready(), so an enabled app does not count twice.
+        connected = job_events_committed.has_listeners(Job)
+        job_events_committed.connect(metrics.count_job_events, sender=Job, dispatch_uid="jobs_event_counter")
+        labels = {"event": JobEventType.STATUS_CHANGED, "status": JobStatusType.RUNNING}
+        before = _sample("jobs_job_events_total", **labels)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                job = create_job(name="Counted")
+                update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        finally:
+            if not connected:
+                job_events_committed.disconnect(sender=Job, dispatch_uid="jobs_event_counter")
+
+        assert _sample("jobs_job_events_total", **labels) == before + 1
+
+    def test_metrics_view_includes_jobs_by_status(self):
+        create_job(name="Scraped")
+
+        resp = metrics.metrics_view(RequestFactory().get("/metrics"))
+
+        assert resp.status_code == 200
+        assert resp["Content-Type"].startswith("text/plain")
+        body = resp.content.decode()
+        assert 'jobs_by_status{status="PENDING"} 1.0' in body
+        assert "# TYPE jobs_http_request_duration_seconds histogram" in body
@@ -0,0 +1,101 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+from django.db import connection
+
+from jobs.selectors import get_jobs_list, parse_datetime_filter, parse_status_filter
+from jobs.services import create_job
+
+SINCE = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _plan_nodes(queryset) -> list[dict]:
+    # The test tables are tiny, so the planner would rather scan and sort.
+    # With both disabled it still adds a Sort node, or picks a sequential
+    # scan, when no index can produce the requested order.
+    with connection.cursor() as cursor:
+        cursor.execute("SET LOCAL enable_seqscan = off")
+        cursor.execute("SET LOCAL enable_sort = off")
+    nodes = [json.loads(queryset.explain(format="json"))[0]["Plan"]]
+    for node in nodes:
+        nodes.extend(node.get("Plans", []))
+    return nodes
+
+
+@pytest.mark.django_db
+class TestGetJobsListPlans:
+    @pytest.mark.parametrize(
+        "filters,index",
+        [
+            ({}, "idx_job_created_id_desc"),
+            ({"sort": "created_at"}, "idx_job_created_id_desc"),
+            ({"created_after": SINCE, "created_before": SINCE}, "idx_job_created_id_desc"),
+            ({"status": "FAILED"}, "idx_job_status_created_desc"),
+            ({"status": "FAILED", "sort": "created_at", "created_after": SINCE}, "idx_job_status_created_desc"),
+            ({"status": "PENDING,RUNNING"}, "idx_job_active_created_desc"),
+            ({"status": "COMPLETED", "created_before": SINCE}, "idx_job_status_created_desc"),
+            ({"status": "RUNNING,FAILED"}, "idx_job_created_id_desc"),
+            ({"sort": "-updated_at", "updated_since": SINCE}, "idx_job_updated_id_desc"),
+            ({"status": "FAILED", "sort": "updated_at", "updated_since": SINCE}, "idx_job_status_updated_id"),
+            ({"sort": "name"}, None),
+            ({"status": "COMPLETED", "sort": "-name"}, "idx_job_status_name"),
+        ],
+    )
+    def test_filtered_page_is_read_in_index_order(self, filters: dict, index):
+        create_job(name="Planned")
+
+        nodes = _plan_nodes(get_jobs_list(**filters)[:20])
+
+        node_types = [node["Node Type"] for node in nodes]
+        assert "Sort" not in node_types and "Incremental Sort" not in node_types
+        scans = [node for node in nodes if node["Node Type"] in ("Index Scan", "Index Only Scan")]
+        assert scans, node_types
+        if index is not None:
+            assert scans[0]["Index Name"] == index
+
+    def test_prefix_search_uses_name_index(self):
+        create_job(name="Nightly Backup")
+
+        nodes = _plan_nodes(get_jobs_list(q="night", match="prefix").order_by())
+
+        assert "idx_job_name_upper_prefix" in [node.get("Index Name") for node in nodes]
+
+
+@pytest.mark.django_db
+class TestGetJobsListFilters:
+    def test_filters_by_several_statuses(self):
+        create_job(name="Pending")
+        running = create_job(name="Running")
+        running.current_status_type = "RUNNING"
+        running.save()
+
+        jobs = get_jobs_list(status="RUNNING, PENDING", sort="name")
+
+        assert [job.name for job in jobs] == ["Pending", "Running"]
+
+    def test_rejects_unknown_status_in_list(self):
+        with pytest.raises(ValueError):
+            get_jobs_list(status="RUNNING,NOPE")
+
+    def test_rejects_unknown_match_mode(self):
+        with pytest.raises(ValueError):
+            get_jobs_list(q="night", match="regex")
+
+
+class TestParseFilters:
+    def test_status_list_is_deduplicated(self):
+        assert parse_status_filter("FAILED,RUNNING,FAILED") == ["FAILED", "RUNNING"]
+
+    def test_date_is_midnight_in_current_timezone(self):
+        assert parse_datetime_filter("created_after", "2026-03-01") == datetime(
+            2026, 3, 1, tzinfo=timezone.utc
+        )
+
+    def test_datetime_keeps_offset(self):
+        parsed = parse_datetime_filter("updated_since", "2026-03-01T10:00:00+02:00")
+        assert parsed == datetime(2026, 3, 1, 8, tzinfo=timezone.utc)
+
+    def test_rejects_malformed_datetime(self):
+        with pytest.raises(ValueError, match="created_before"):
+            parse_datetime_filter("created_before", "yesterday")
@@ -0,0 +1,23 @@
+import pytest
+from rest_framework.renderers import JSONRenderer
+
+from jobs.enums import JobStatusType
+from jobs.models import Job
+from jobs.serializers import JOB_LIST_FIELDS, JobListSerializer, serialize_job_list_rows
+from jobs.services import create_job, update_job_status
+
+
+@pytest.mark.django_db
+class TestSerializeJobListRows:
+    def test_renders_byte_identical_json_to_job_list_serializer(self):
+        for i in range(5):
+            job = create_job(name=f"Serialize {i} – ünïcode")
+            if i % 2:
+                update_job_status(job=job, new_status=JobStatusType.FAILED)
+        Job.objects.create(name="No Status Timestamp")
+
+        queryset = Job.objects.order_by("id")
+        expected = JSONRenderer().render(JobListSerializer(queryset, many=True).data)
+        actual = JSONRenderer().render(serialize_job_list_rows(queryset.values(*JOB_LIST_FIELDS)))
+
+        assert actual == expected
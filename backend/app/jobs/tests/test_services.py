@@ -1,8 +1,25 @@
+import random
+import threading
+from datetime import timedelta
+
 import pytest
-from django.db import IntegrityError
-from jobs.enums import JobStatusType
-from jobs.models import Job, JobStatus
-from jobs.services import create_job, delete_job, update_job_status
+from django.db import IntegrityError, connection
+from django.utils import timezone
+from jobs.enums import JobEventType, JobStatusType
+from jobs.models import Job, JobEvent, JobStatus, JobStatusCount
+from jobs.selectors import get_job_status_summary
+from jobs import services
+from jobs.services import (
+    StatusUpdateConflict,
+    bulk_create_jobs,
+    bulk_update_job_status,
+    create_job,
+    delete_job,
+    rebuild_job_status_counts,
+    update_job_status,
+    update_job_status_by_id,
+)
+from jobs.signals import job_events_committed
 
 
 @pytest.mark.django_db
@@ -35,6 +52,47 @@ class TestCreateJob:
             create_job(name="Duplicate Name")
 
 
+@pytest.mark.django_db
+class TestBulkCreateJobs:
+    def test_creates_jobs_with_initial_status(self):
+        jobs, conflicts = bulk_create_jobs(names=["Bulk A", "Bulk B"])
+
+        assert conflicts == []
+        assert [job.name for job in jobs] == ["Bulk A", "Bulk B"]
+        for job in jobs:
+            job.refresh_from_db()
+            status = JobStatus.objects.get(job=job)
+            assert job.current_status_type == JobStatusType.PENDING
+            assert status.status_type == JobStatusType.PENDING
+            assert job.current_status_timestamp == status.timestamp
+
+    def test_uses_set_based_statements(self, django_assert_num_queries):
+        # existence check, INSERT jobs, INSERT statuses, UPDATE jobs,
+        # UPDATE counters, INSERT events (+ savepoint handling)
+        with django_assert_num_queries(8):
+            bulk_create_jobs(names=[f"Bulk {i}" for i in range(50)])
+
+    def test_all_or_nothing_writes_nothing_on_conflict(self):
+        create_job(name="Existing")
+
+        jobs, conflicts = bulk_create_jobs(names=["New", "Existing"])
+
+        assert jobs == []
+        assert conflicts == ["Existing"]
+        assert not Job.objects.filter(name="New").exists()
+
+    def test_partial_mode_creates_non_conflicting(self):
+        create_job(name="Existing")
+
+        jobs, conflicts = bulk_create_jobs(
+            names=["New", "Existing", "New"],
+            all_or_nothing=False,
+        )
+
+        assert [job.name for job in jobs] == ["New"]
+        assert conflicts == ["Existing", "New"]
+
+
 @pytest.mark.django_db
 class TestUpdateJobStatus:
     def test_appends_new_status_entry(self):
@@ -63,6 +121,247 @@ class TestUpdateJobStatus:
         assert JobStatus.objects.filter(job=job).count() == 3
 
 
+@pytest.mark.django_db
+class TestConditionalStatusUpdate:
+    def test_newer_status_becomes_current(self):
+        job = create_job(name="Conditional Newer")
+        reported_at = job.current_status_timestamp + timedelta(seconds=1)
+
+        updated, status = update_job_status_by_id(
+            job_id=job.pk, new_status=JobStatusType.RUNNING, timestamp=reported_at, if_newer=True
+        )
+
+        assert updated.current_status_type == JobStatusType.RUNNING
+        assert updated.current_status_timestamp == reported_at == status.timestamp
+        assert updated.status_version == 1
+
+    def test_older_status_is_only_appended_to_history(self):
+        job = create_job(name="Conditional Older")
+        update_job_status(job=job, new_status=JobStatusType.COMPLETED)
+
+        updated, status = update_job_status_by_id(
+            job_id=job.pk,
+            new_status=JobStatusType.RUNNING,
+            timestamp=job.current_status_timestamp - timedelta(seconds=1),
+            if_newer=True,
+        )
+
+        assert updated.current_status_type == JobStatusType.COMPLETED
+        assert updated.updated_at == job.updated_at
+        assert updated.status_version == job.status_version + 1
+        assert JobStatus.objects.filter(pk=status.pk, status_type=JobStatusType.RUNNING).exists()
+        summary = get_job_status_summary()
+        assert summary[JobStatusType.COMPLETED] == 1
+        assert summary[JobStatusType.RUNNING] == 0
+        assert JobEvent.objects.filter(job_id=job.pk, status_type=JobStatusType.RUNNING).count() == 0
+
+    def test_equal_timestamp_is_applied(self):
+        job = create_job(name="Conditional Tie")
+
+        updated, _ = update_job_status_by_id(
+            job_id=job.pk,
+            new_status=JobStatusType.FAILED,
+            timestamp=job.current_status_timestamp,
+            if_newer=True,
+        )
+
+        assert updated.current_status_type == JobStatusType.FAILED
+
+    def test_gives_up_after_max_attempts(self, monkeypatch):
+        job = create_job(name="Conditional Hot")
+        sleeps = []
+        monkeypatch.setattr(services.time, "sleep", sleeps.append)
+        # Every attempt loses the compare-and-swap: the job is there, but the
+        # statement wrote nothing.
+        monkeypatch.setattr(
+            services, "_execute_returning", lambda sql, params: ("default", (job.pk, None, None))
+        )
+
+        with pytest.raises(StatusUpdateConflict):
+            update_job_status_by_id(job_id=job.pk, new_status=JobStatusType.RUNNING, max_attempts=4)
+
+        assert len(sleeps) == 3
+        assert all(0 <= delay <= services.STATUS_UPDATE_MAX_BACKOFF for delay in sleeps)
+
+    def test_missing_job_raises(self):
+        with pytest.raises(Job.DoesNotExist):
+            update_job_status_by_id(job_id=999999, new_status=JobStatusType.RUNNING, if_newer=True)
+
+
+@pytest.mark.django_db(transaction=True)
+class TestConcurrentStatusUpdates:
+    THREADS = 8
+    UPDATES_PER_THREAD = 25
+
+    def _hammer(self, job: Job, **options) -> None:
+        # Every thread reports a burst of transitions for the same job with
+        # out-of-order timestamps; millisecond steps make ties common.
+        start = threading.Barrier(self.THREADS)
+        errors = []
+
+        def report(seed: int) -> None:
+            rng = random.Random(seed)
+            try:
+                start.wait()
+                for _ in range(self.UPDATES_PER_THREAD):
+                    timestamp = job.current_status_timestamp + timedelta(milliseconds=rng.randrange(1, 50))
+                    update_job_status_by_id(
+                        job_id=job.pk,
+                        new_status=rng.choice(JobStatusType.values),
+                        timestamp=timestamp if options.get("if_newer") else None,
+                        **options,
+                    )
+            except Exception as exc:
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        threads = [threading.Thread(target=report, args=(seed,)) for seed in range(self.THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert errors == []
+
+    def _assert_consistent(self, job: Job) -> None:
+        job.refresh_from_db()
+        updates = self.THREADS * self.UPDATES_PER_THREAD
+        assert JobStatus.objects.filter(job=job).count() == updates + 1
+        # Every appended status bumps the version, current or late.
+        assert job.status_version == updates
+        report = rebuild_job_status_counts(dry_run=True)
+        assert all(stored == actual for stored, actual in report.values()), report
+
+    def test_conditional_updates_keep_newest_status_current(self):
+        # Transactional tests start from a flushed database, with no counter
+        # rows; the writes create them.
+        job = create_job(name="Hot Job")
+
+        self._hammer(job, if_newer=True)
+
+        self._assert_consistent(job)
+        newest = JobStatus.objects.filter(job=job).order_by("-timestamp", "-id").first()
+        assert (job.current_status_type, job.current_status_timestamp) == (
+            newest.status_type,
+            newest.timestamp,
+        )
+
+    def test_unconditional_updates_keep_counters_exact(self):
+        job = create_job(name="Hot Job")
+
+        self._hammer(job)
+
+        self._assert_consistent(job)
+        assert job.status_version == self.THREADS * self.UPDATES_PER_THREAD
+
+
+@pytest.mark.django_db
+class TestBulkUpdateJobStatus:
+    def test_appends_statuses_and_updates_denormalized_fields(self):
+        first = create_job(name="Bulk Status A")
+        second = create_job(name="Bulk Status B")
+
+        jobs, missing = bulk_update_job_status(
+            updates=[(first.pk, JobStatusType.RUNNING), (second.pk, JobStatusType.FAILED)]
+        )
+
+        assert missing == []
+        assert {job.pk: job.current_status_type for job in jobs} == {
+            first.pk: JobStatusType.RUNNING,
+            second.pk: JobStatusType.FAILED,
+        }
+        for job in jobs:
+            in_memory = job.current_status_timestamp
+            job.refresh_from_db()
+            latest = JobStatus.objects.filter(job=job).order_by("-timestamp").first()
+            assert job.current_status_type == latest.status_type
+            assert job.current_status_timestamp == latest.timestamp == in_memory
+
+    def test_last_entry_for_a_job_wins(self):
+        job = create_job(name="Repeated")
+
+        bulk_update_job_status(
+            updates=[(job.pk, JobStatusType.RUNNING), (job.pk, JobStatusType.COMPLETED)]
+        )
+
+        job.refresh_from_db()
+        assert job.current_status_type == JobStatusType.COMPLETED
+        assert JobStatus.objects.filter(job=job).count() == 3
+
+    def test_reports_missing_jobs(self):
+        job = create_job(name="Present")
+
+        jobs, missing = bulk_update_job_status(
+            updates=[(job.pk, JobStatusType.RUNNING), (99999, JobStatusType.RUNNING)]
+        )
+
+        assert [j.pk for j in jobs] == [job.pk]
+        assert missing == [99999]
+
+    def test_newest_timestamp_wins_regardless_of_order(self):
+        job = create_job(name="Out of order")
+        base = job.current_status_timestamp
+
+        bulk_update_job_status(
+            updates=[
+                (job.pk, JobStatusType.COMPLETED, base + timedelta(seconds=2)),
+                (job.pk, JobStatusType.RUNNING, base + timedelta(seconds=1)),
+            ]
+        )
+
+        job.refresh_from_db()
+        assert job.current_status_type == JobStatusType.COMPLETED
+        assert job.current_status_timestamp == base + timedelta(seconds=2)
+        assert list(
+            JobEvent.objects.filter(job_id=job.pk, event_type=JobEventType.STATUS_CHANGED)
+            .order_by("id")
+            .values_list("status_type", flat=True)
+        ) == [JobStatusType.RUNNING, JobStatusType.COMPLETED]
+        assert get_job_status_summary()["COMPLETED"] == 1
+
+    def test_stale_report_is_recorded_without_becoming_current(self):
+        # The version still moves: it validates the job's status history.
+        job = create_job(name="Stale bulk")
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        version = Job.objects.get(pk=job.pk).status_version
+
+        bulk_update_job_status(
+            updates=[(job.pk, JobStatusType.FAILED, job.current_status_timestamp - timedelta(seconds=1))]
+        )
+
+        job.refresh_from_db()
+        assert job.current_status_type == JobStatusType.RUNNING
+        assert job.status_version == version + 1
+        assert JobStatus.objects.filter(job=job, status_type=JobStatusType.FAILED).exists()
+        assert not JobEvent.objects.filter(job_id=job.pk, status_type=JobStatusType.FAILED).exists()
+
+    def test_writes_the_status_it_counts_after_a_future_dated_report(self):
+        # A plain update can leave a newer (future-dated) row in the history
+        # than the current status; the batch must still store what it counts.
+        job = create_job(name="Future dated")
+        now = timezone.now()
+        bulk_update_job_status(updates=[(job.pk, JobStatusType.RUNNING, now + timedelta(minutes=2))])
+        update_job_status_by_id(job_id=job.pk, new_status=JobStatusType.FAILED)
+
+        [updated], _ = bulk_update_job_status(
+            updates=[(job.pk, JobStatusType.COMPLETED, now + timedelta(seconds=1))]
+        )
+
+        job.refresh_from_db()
+        assert job.current_status_type == updated.current_status_type == JobStatusType.COMPLETED
+        assert job.current_status_timestamp == updated.current_status_timestamp
+        report = rebuild_job_status_counts(dry_run=True)
+        assert all(stored == actual for stored, actual in report.values()), report
+
+    def test_query_count_is_independent_of_batch_size(self, django_assert_num_queries):
+        jobs, _ = bulk_create_jobs(names=[f"Fan-in {i}" for i in range(50)])
+
+        # SELECT jobs, INSERT statuses, UPDATE jobs, UPDATE counters,
+        # INSERT events (+ savepoint handling)
+        with django_assert_num_queries(7):
+            bulk_update_job_status(updates=[(job.pk, JobStatusType.COMPLETED) for job in jobs])
+
+
 @pytest.mark.django_db
 class TestDeleteJob:
     def test_deletes_job_and_cascades_statuses(self):
@@ -74,3 +373,134 @@ class TestDeleteJob:
 
         assert not Job.objects.filter(pk=job_id).exists()
         assert not JobStatus.objects.filter(job_id=job_id).exists()
+
+
+@pytest.mark.django_db
+class TestStatusCounters:
+    def test_track_create_update_and_delete(self):
+        job = create_job(name="Counter A")
+        create_job(name="Counter B")
+        assert get_job_status_summary()[JobStatusType.PENDING] == 2
+
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        summary = get_job_status_summary()
+        assert summary[JobStatusType.PENDING] == 1
+        assert summary[JobStatusType.RUNNING] == 1
+
+        delete_job(job=job)
+        summary = get_job_status_summary()
+        assert summary[JobStatusType.RUNNING] == 0
+        assert summary[JobStatusType.PENDING] == 1
+
+    def test_writes_recreate_missing_counter_rows(self):
+        # As after a flush, restore or truncate.
+        JobStatusCount.objects.all().delete()
+
+        job = create_job(name="Counter Flushed")
+        bulk_create_jobs(names=["Counter Flushed Bulk"])
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        bulk_update_job_status(updates=[(job.pk, JobStatusType.COMPLETED)])
+
+        report = rebuild_job_status_counts(dry_run=True)
+        assert all(stored == actual for stored, actual in report.values()), report
+        assert get_job_status_summary()[JobStatusType.COMPLETED] == 1
+
+    def test_delete_moves_the_stored_status_once(self):
+        job = create_job(name="Counter Delete")
+        stale = Job.objects.get(pk=job.pk)
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+
+        delete_job(job=stale)
+        with pytest.raises(Job.DoesNotExist):
+            delete_job(job=job)
+
+        assert get_job_status_summary()[JobStatusType.PENDING] == 0
+        assert get_job_status_summary()[JobStatusType.RUNNING] == 0
+        assert JobEvent.objects.filter(event_type=JobEventType.DELETED).count() == 1
+
+    def test_same_status_update_is_a_no_op(self):
+        job = create_job(name="Counter Same")
+        update_job_status(job=job, new_status=JobStatusType.PENDING)
+        assert get_job_status_summary()[JobStatusType.PENDING] == 1
+
+    def test_update_moves_the_stored_status_not_a_stale_one(self):
+        job = create_job(name="Counter Stale")
+        stale = Job.objects.get(pk=job.pk)
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+
+        update_job_status(job=stale, new_status=JobStatusType.FAILED)
+
+        summary = get_job_status_summary()
+        assert summary[JobStatusType.PENDING] == 0
+        assert summary[JobStatusType.RUNNING] == 0
+        assert summary[JobStatusType.FAILED] == 1
+        assert stale.current_status_type == JobStatusType.FAILED
+
+    def test_track_bulk_operations(self):
+        jobs, _ = bulk_create_jobs(names=["Bulk 1", "Bulk 2", "Bulk 3"])
+        bulk_update_job_status(
+            updates=[
+                (jobs[0].pk, JobStatusType.RUNNING),
+                (jobs[0].pk, JobStatusType.FAILED),
+                (jobs[1].pk, JobStatusType.COMPLETED),
+            ]
+        )
+
+        assert get_job_status_summary() == {
+            "PENDING": 1,
+            "RUNNING": 0,
+            "COMPLETED": 1,
+            "FAILED": 1,
+        }
+
+
+@pytest.mark.django_db
+class TestJobEvents:
+    def test_records_create_update_and_delete(self):
+        job = create_job(name="Evented")
+        job_id = job.pk
+        update_job_status(job=job, new_status=JobStatusType.RUNNING)
+        delete_job(job=job)
+
+        events = list(JobEvent.objects.filter(job_id=job_id).values_list("event_type", "status_type"))
+        assert events == [
+            (JobEventType.CREATED, JobStatusType.PENDING),
+            (JobEventType.STATUS_CHANGED, JobStatusType.RUNNING),
+            (JobEventType.DELETED, JobStatusType.RUNNING),
+        ]
+
+    def test_records_bulk_operations(self):
+        jobs, _ = bulk_create_jobs(names=["Bulk Event A", "Bulk Event B"])
+        bulk_update_job_status(updates=[(jobs[0].pk, JobStatusType.FAILED)])
+
+        assert JobEvent.objects.filter(event_type=JobEventType.CREATED).count() == 2
+        assert JobEvent.objects.get(event_type=JobEventType.STATUS_CHANGED).job_id == jobs[0].pk
+
+    def test_signals_committed_events(self, django_capture_on_commit_callbacks):
+        sent = []
+
+        def receiver(sender, event_type, status_types, **kwargs):
+            sent.append((event_type, status_types))
+
+        job_events_committed.connect(receiver, sender=Job)
+        try:
+            with django_capture_on_commit_callbacks(execute=True):
+                job = create_job(name="Signalled")
+                update_job_status(job=job, new_status=JobStatusType.RUNNING)
+                update_job_status_by_id(
+                    job_id=job.pk,
+                    new_status=JobStatusType.PENDING,
+                    timestamp=job.current_status_timestamp - timedelta(minutes=1),
+                    if_newer=True,
+                )
+                jobs, _ = bulk_create_jobs(names=["Signalled A", "Signalled B"])
+                delete_job(job=jobs[0])
+        finally:
+            job_events_committed.disconnect(receiver, sender=Job)
+
+        assert sent == [
+            (JobEventType.CREATED, [JobStatusType.PENDING]),
+            (JobEventType.STATUS_CHANGED, [JobStatusType.RUNNING]),
+            (JobEventType.CREATED, [JobStatusType.PENDING, JobStatusType.PENDING]),
+            (JobEventType.DELETED, [JobStatusType.PENDING]),
+        ]
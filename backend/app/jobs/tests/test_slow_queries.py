@@ -0,0 +1,92 @@
+import pytest
+from django.db import connection, transaction
+from django.utils import timezone
+
+from jobs.models import Job
+from jobs.selectors import get_job_by_id
+from jobs.services import create_job
+from jobs.slow_queries import SlowQueryLog, SlowQueryRecorder, normalize_sql, params_shape
+
+
+def _recorder(**overrides) -> SlowQueryRecorder:
+    options = {"threshold_ms": 0, "explain_rate": 1.0, "log": SlowQueryLog(capacity=10), **overrides}
+    return SlowQueryRecorder(**options)
+
+
+class TestNormalizeSql:
+    def test_collapses_values_and_lists(self):
+        sql = """SELECT "jobs_job"."id" FROM "jobs_job" U0
+            WHERE U0."name" LIKE '%%it''s%%' AND U0."current_status_type" IN (%s, %s, %s)
+            LIMIT 21 OFFSET 5000"""
+
+        assert normalize_sql(sql) == (
+            'SELECT "jobs_job"."id" FROM "jobs_job" U0 WHERE U0."name" LIKE ? '
+            'AND U0."current_status_type" IN (...) LIMIT ? OFFSET ?'
+        )
+
+    def test_same_shape_with_different_list_lengths(self):
+        assert normalize_sql("WHERE id IN (%s)") == "WHERE id IN (?)"
+        assert normalize_sql("WHERE id IN (%s, %s)") == normalize_sql("WHERE id IN (%s, %s, %s)")
+
+    def test_params_shape_hides_values(self):
+        assert params_shape(["secret", 3, [1, 2]], False) == ["str", "int", "list[2]"]
+        assert params_shape({"name": "secret"}, False) == {"name": "str"}
+        assert params_shape([("a", 1), ("b", 2)], True) == {"sets": 2, "first": ["str", "int"]}
+
+
+@pytest.mark.django_db
+class TestSlowQueryRecorder:
+    def test_records_caller_and_plan_of_slow_reads(self):
+        job = create_job(name="Slow")
+        recorder = _recorder()
+
+        with connection.execute_wrapper(recorder):
+            get_job_by_id(job_id=job.pk)
+
+        [entry] = recorder.log.entries()
+        assert entry["caller"] == "jobs.selectors.get_job_by_id"
+        assert entry["params"] == ["int"]
+        assert entry["sql"].endswith('WHERE "jobs_job"."id" = ? LIMIT ?')
+        assert "actual time=" in entry["plan"]
+
+    def test_skips_fast_queries(self):
+        recorder = _recorder(threshold_ms=60_000)
+
+        with connection.execute_wrapper(recorder):
+            Job.objects.count()
+
+        assert recorder.log.entries() == []
+
+    def test_never_explains_writes(self):
+        recorder = _recorder()
+
+        with connection.execute_wrapper(recorder):
+            create_job(name="Written once")
+
+        # The test transaction adds a savepoint around the statement.
+        [entry] = [entry for entry in recorder.log.entries() if "INSERT" in entry["sql"]]
+        assert entry["caller"] == "jobs.services._execute_returning"
+        assert entry["plan"] is None
+        assert Job.objects.filter(name="Written once").count() == 1
+
+    def test_failed_explain_leaves_the_transaction_usable(self):
+        recorder = _recorder()
+
+        with transaction.atomic():
+            recorder.record(connection, "SELECT * FROM missing_table", None, False, 1.0, timezone.now())
+            assert Job.objects.count() == 0
+
+        [entry] = recorder.log.entries()
+        assert "missing_table" in entry["explain_error"]
+
+    def test_buffer_keeps_the_newest_entries(self):
+        recorder = _recorder(explain_rate=0.0, log=SlowQueryLog(capacity=2))
+
+        with connection.execute_wrapper(recorder):
+            for field in ("id", "name", "status_version"):
+                Job.objects.filter(**{field: 1}).exists()
+
+        newest, older = recorder.log.entries()
+        assert '"status_version" = ?' in newest["sql"]
+        assert '"name" = ?' in older["sql"]
+        assert recorder.get_stats()["captured"] == 3
@@ -1,8 +1,29 @@
+from django.conf import settings
+from django.urls import re_path
 from rest_framework.routers import DefaultRouter
 
+from jobs.async_views import AsyncJobReadViews
 from jobs.views import JobViewSet
 
 router = DefaultRouter()
 router.register(r"jobs", JobViewSet, basename="job")
 
-urlpatterns = router.urls
+# Under ASGI the dashboard's read routes and the export are served by async
+# views; other methods on the same URLs, and non-numeric ids, still reach
+# JobViewSet. The event stream exists only here, so only under ASGI.
+_viewset_views = {pattern.name: pattern.callback for pattern in router.urls}
+async_read_urlpatterns = [
+    re_path(r"^jobs/$", AsyncJobReadViews.as_async_view("list", _viewset_views["job-list"])),
+    re_path(r"^jobs/events/$", AsyncJobReadViews.as_async_view("events")),
+    re_path(r"^jobs/export/$", AsyncJobReadViews.as_async_view("export", _viewset_views["job-export"])),
+    re_path(
+        r"^jobs/(?P<pk>[0-9]+)/$",
+        AsyncJobReadViews.as_async_view("retrieve", _viewset_views["job-detail"]),
+    ),
+    re_path(
+        r"^jobs/(?P<pk>[0-9]+)/statuses/$",
+        AsyncJobReadViews.as_async_view("statuses", _viewset_views["job-statuses"]),
+    ),
+]
+
+urlpatterns = (async_read_urlpatterns if settings.JOBS_ASGI else []) + router.urls
@@ -1,20 +1,53 @@
+import hashlib
+from collections import Counter
+from typing import Any, Iterator, Optional
+
+from django.conf import settings
 from django.db import IntegrityError
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
 from rest_framework import status, viewsets
 from rest_framework.decorators import action, api_view
-from rest_framework.pagination import LimitOffsetPagination
+from rest_framework.pagination import BasePagination
+from rest_framework.permissions import IsAdminUser
 from rest_framework.request import Request
 from rest_framework.response import Response
 
+from jobs import caching, ingest, pooling, slow_queries
+from jobs.exports import iter_export
 from jobs.models import Job
-from jobs.selectors import get_job_by_id, get_job_status_history, get_jobs_list
+from jobs.pagination import JobsKeysetPagination, JobsLimitOffsetPagination
+from jobs.renderers import CSVRenderer, NDJSONRenderer
+from jobs.selectors import (
+    get_job_by_id,
+    get_job_status_history,
+    get_job_status_summary,
+    get_jobs_list,
+    get_latest_statuses_by_job,
+    parse_datetime_filter,
+    parse_embedded_statuses,
+    parse_status_filter,
+)
 from jobs.serializers import (
+    JOB_LIST_FIELDS,
+    JobBulkCreateSerializer,
+    JobBulkStatusUpdateItemSerializer,
     JobCreateSerializer,
     JobDetailSerializer,
-    JobListSerializer,
     JobStatusSerializer,
     JobUpdateStatusSerializer,
+    serialize_job_list_rows,
+    serialize_job_status_rows,
+)
+from jobs.services import (
+    StatusUpdateConflict,
+    bulk_create_jobs,
+    bulk_update_job_status,
+    create_job,
+    delete_job,
+    update_job_status_by_id,
 )
-from jobs.services import create_job, delete_job, update_job_status
 
 
 @api_view(["GET"])
@@ -22,14 +55,20 @@ def health(request):
     return Response({"status": "ok"})
 
 
-class JobsLimitOffsetPagination(LimitOffsetPagination):
-    default_limit = 20
-    max_limit = 100
-
-
 class JobViewSet(viewsets.ViewSet):
 
     pagination_class = JobsLimitOffsetPagination
+    cursor_pagination_class = JobsKeysetPagination
+
+    def _get_paginator(self, request: Request) -> BasePagination:
+        # Offset paging stays the default for existing clients; cursor mode is
+        # opted into with ?pagination=cursor and kept by the next/prev links.
+        if (
+            request.query_params.get("pagination") == "cursor"
+            or self.cursor_pagination_class.cursor_query_param in request.query_params
+        ):
+            return self.cursor_pagination_class()
+        return self.pagination_class()
 
     @staticmethod
     def _parse_job_id(pk: str) -> int:
@@ -52,27 +91,203 @@ class JobViewSet(viewsets.ViewSet):
                 Response({"detail": "Job not found."}, status=status.HTTP_404_NOT_FOUND),
             )
 
+    @staticmethod
+    def _list_filters(request: Request) -> dict[str, Any]:
+        params = request.query_params
+        filters = {
+            "status": params.get("status"),
+            "sort": params.get("sort", "-created_at"),
+            "q": params.get("q", "").strip() or None,
+            "match": params.get("match", "contains"),
+        }
+        for name in ("created_after", "created_before", "updated_since"):
+            if params.get(name):
+                filters[name] = parse_datetime_filter(name, params[name])
+        return filters
+
+    @staticmethod
+    def _embedded_statuses(request: Request) -> Optional[int]:
+        params = request.query_params
+        return parse_embedded_statuses(params.get("include"), params.get("statuses_limit"))
+
+    @staticmethod
+    def _embed_statuses(items: list[dict[str, Any]], statuses: dict[int, list[dict[str, Any]]]) -> None:
+        for item in items:
+            item["statuses"] = serialize_job_status_rows(statuses.get(item["id"], []))
+
+    def _detail_with_statuses(
+        self, request: Request, job: Job, statuses: list[dict[str, Any]]
+    ) -> HttpResponse:
+        # A late status joins the history without moving updated_at, so the
+        # ETag covers the embedded rows.
+        etag = self._make_etag(job.pk, job.updated_at.isoformat(), [status["id"] for status in statuses])
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        data = {**JobDetailSerializer(job).data, "statuses": serialize_job_status_rows(statuses)}
+        return self._with_validators(Response(data), etag)
+
+    def _list_etag(
+        self,
+        request: Request,
+        paginator: BasePagination,
+        page: Optional[list[dict[str, Any]]],
+        rows: list[dict[str, Any]],
+    ) -> str:
+        """
+        ETag for a list response from what the page query returned.
+
+        The pagination envelope (count and links) covers jobs off the page,
+        and each row's ``updated_at`` and ``status_version`` cover the page
+        itself; a late status bumps only the version, and it matters for
+        embedded histories. No query runs beyond the page.
+        """
+        envelope = {}
+        if page is not None:
+            envelope = paginator.get_paginated_response([]).data
+            del envelope["results"]
+        versions = [(row["id"], row["updated_at"].isoformat(), row["status_version"]) for row in rows]
+        return self._make_etag(self._query_signature(request), envelope, versions)
+
+    def _streaming_response(self, content: Iterator[str], **kwargs: Any) -> StreamingHttpResponse:
+        return StreamingHttpResponse(content, **kwargs)
+
+    @staticmethod
+    def _make_etag(*parts: object) -> str:
+        digest = hashlib.sha1("|".join(str(part) for part in parts).encode("utf-8"))
+        return f'"{digest.hexdigest()}"'
+
+    @staticmethod
+    def _query_signature(request: Request) -> str:
+        return str(sorted(request.query_params.lists()))
+
+    @staticmethod
+    def _with_validators(response: HttpResponse, etag: str) -> HttpResponse:
+        # No Last-Modified: its whole-second resolution would let a client
+        # that sends only If-Modified-Since keep a copy from before an update
+        # made later in the same second.
+        response.headers["ETag"] = etag
+        return response
+
+    def _not_modified(self, request: Request, etag: str) -> Optional[HttpResponse]:
+        """Return a 304 (or 412) when the request's preconditions allow it."""
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            return None
+        return self._with_validators(response, etag)
+
     def list(self, request: Request) -> Response:
+        cache_key = None
+        if caching.is_enabled():
+            # Read the generation before querying so a write that lands
+            # mid-request leaves this page under the superseded generation.
+            cache_key = caching.page_key(request, caching.get_generation())
+            cached = caching.get_page(cache_key)
+            if cached is not None:
+                etag, data = cached
+                return self._not_modified(request, etag) or self._with_validators(
+                    Response(data), etag
+                )
+
         try:
-            queryset = get_jobs_list(
-                status=request.query_params.get("status"),
-                sort=request.query_params.get("sort", "-created_at"),
+            queryset = get_jobs_list(**self._list_filters(request))
+            statuses_limit = self._embedded_statuses(request)
+        except ValueError as exc:
+            return Response(
+                {"detail": str(exc)},
+                status=status.HTTP_400_BAD_REQUEST,
             )
+
+        # Only the listed columns are fetched, as dicts, and encoded directly
+        # by serialize_job_list_rows instead of through JobListSerializer.
+        queryset = queryset.values(*JOB_LIST_FIELDS, "status_version")
+        try:
+            paginator = self._get_paginator(request)
+            page = paginator.paginate_queryset(queryset, request)
         except ValueError as exc:
             return Response(
                 {"detail": str(exc)},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request)
-        
+        rows = page if page is not None else list(queryset)
+        etag = self._list_etag(request, paginator, page, rows)
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+        data = serialize_job_list_rows(rows)
+        if statuses_limit:
+            # One query for the whole page, not one per job.
+            job_ids = [row["id"] for row in rows]
+            self._embed_statuses(data, get_latest_statuses_by_job(job_ids=job_ids, limit=statuses_limit))
         if page is not None:
-            serializer = JobListSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-        
-        serializer = JobListSerializer(queryset, many=True)
-        return Response(serializer.data)
+            response = paginator.get_paginated_response(data)
+        else:
+            response = Response(data)
+
+        if cache_key is not None:
+            caching.set_page(cache_key, (etag, response.data))
+        return self._with_validators(response, etag)
+
+    @action(
+        detail=False,
+        methods=["get"],
+        url_path="export",
+        renderer_classes=[NDJSONRenderer, CSVRenderer],
+    )
+    def export(self, request: Request) -> HttpResponse:
+        # The format comes from content negotiation: ?format=ndjson|csv or Accept.
+        export_format = request.accepted_renderer.format
+        params = request.query_params
+        status_filter = params.get("status")
+        try:
+            if status_filter is not None:
+                parse_status_filter(status_filter)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
+        response = self._streaming_response(
+            iter_export(
+                export_format=export_format,
+                status=status_filter,
+                include_statuses=params.get("include") == "statuses",
+            ),
+            content_type=request.accepted_renderer.media_type,
+        )
+        response["Content-Disposition"] = f'attachment; filename="jobs.{export_format}"'
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+    @action(detail=False, methods=["get"], url_path="cache-stats", permission_classes=[IsAdminUser])
+    def cache_stats(self, request: Request) -> Response:
+        return Response(caching.get_stats())
+
+    @action(detail=False, methods=["get"], url_path="db-stats", permission_classes=[IsAdminUser])
+    def db_stats(self, request: Request) -> Response:
+        return Response(pooling.get_stats())
+
+    @action(
+        detail=False,
+        methods=["get", "delete"],
+        url_path="slow-queries",
+        permission_classes=[IsAdminUser],
+    )
+    def slow_query_log(self, request: Request) -> Response:
+        if not slow_queries.is_enabled():
+            return Response(
+                {"detail": "Slow-query capture is disabled (JOBS_SLOW_QUERY_ENABLED)."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        recorder = slow_queries.get_recorder()
+        if request.method == "DELETE":
+            recorder.log.clear()
+            return Response(status=status.HTTP_204_NO_CONTENT)
+        return Response({**recorder.get_stats(), "entries": recorder.log.entries()})
+
+    @action(detail=False, methods=["get"], url_path="summary")
+    def summary(self, request: Request) -> Response:
+        counts = get_job_status_summary()
+        return Response({"total": sum(counts.values()), "by_status": counts})
 
     def create(self, request: Request) -> Response:
         serializer = JobCreateSerializer(data=request.data)
@@ -89,26 +304,165 @@ class JobViewSet(viewsets.ViewSet):
         response_serializer = JobDetailSerializer(job)
         return Response(response_serializer.data, status=status.HTTP_201_CREATED)
 
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk_create(self, request: Request) -> Response:
+        serializer = JobBulkCreateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        names = serializer.validated_data["names"]
+        all_or_nothing = serializer.validated_data["all_or_nothing"]
+
+        try:
+            jobs, conflicts = bulk_create_jobs(names=names, all_or_nothing=all_or_nothing)
+        except IntegrityError:
+            # A concurrent writer claimed one of the names after the existence check.
+            return Response(
+                {"detail": "A job with one of these names already exists. Retry the request."},
+                status=status.HTTP_409_CONFLICT,
+            )
+
+        created = {job.name: job for job in jobs}
+        # Repeats within the request conflict on their later occurrences, so
+        # match conflicts from the end of the list.
+        unmatched_conflicts = Counter(conflicts)
+        results = []
+        for name in reversed(names):
+            if unmatched_conflicts[name]:
+                unmatched_conflicts[name] -= 1
+                results.append(
+                    {"name": name, "status": "conflict", "detail": "A job with this name already exists."}
+                )
+            elif name in created:
+                results.append(
+                    {"name": name, "status": "created", "job": JobDetailSerializer(created[name]).data}
+                )
+            else:
+                results.append({"name": name, "status": "skipped"})
+        results.reverse()
+
+        if not conflicts:
+            response_status = status.HTTP_201_CREATED
+        elif all_or_nothing:
+            response_status = status.HTTP_400_BAD_REQUEST
+        else:
+            response_status = status.HTTP_207_MULTI_STATUS
+        return Response(
+            {"created": len(jobs), "conflicts": len(conflicts), "results": results},
+            status=response_status,
+        )
+
+    @action(detail=False, methods=["post"], url_path="statuses/bulk")
+    def bulk_update_statuses(self, request: Request) -> Response:
+        serializer = JobBulkStatusUpdateItemSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=JobBulkStatusUpdateItemSerializer.MAX_JOBS,
+        )
+        serializer.is_valid(raise_exception=True)
+        now = timezone.now()
+        updates = [
+            (item["id"], item["status_type"], item.get("timestamp") or now)
+            for item in serializer.validated_data
+        ]
+
+        jobs, missing = bulk_update_job_status(updates=updates)
+
+        results = [
+            {"id": job.pk, "status": "updated", "job": JobDetailSerializer(job).data}
+            for job in jobs
+        ]
+        results.extend(
+            {"id": job_id, "status": "not_found", "detail": "Job not found."}
+            for job_id in missing
+        )
+        return Response(
+            {"updated": len(jobs), "not_found": len(missing), "results": results},
+            status=status.HTTP_207_MULTI_STATUS if missing else status.HTTP_200_OK,
+        )
+
+    @action(detail=False, methods=["get", "post"], url_path="statuses/ingest")
+    def ingest_statuses(self, request: Request) -> Response:
+        if not ingest.is_enabled():
+            return Response(
+                {"detail": "Buffered ingestion is disabled (JOBS_INGEST_ENABLED)."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+        buffer = ingest.get_buffer()
+        if request.method == "GET":
+            return Response(buffer.get_stats())
+
+        serializer = JobBulkStatusUpdateItemSerializer(
+            data=request.data,
+            many=True,
+            allow_empty=False,
+            max_length=JobBulkStatusUpdateItemSerializer.MAX_JOBS,
+        )
+        serializer.is_valid(raise_exception=True)
+        # Stamped now, so a report keeps its place however late it is written.
+        now = timezone.now()
+        reports = [
+            ingest.StatusReport(item["id"], item["status_type"], item.get("timestamp") or now)
+            for item in serializer.validated_data
+        ]
+        try:
+            buffer.submit(reports, timeout=settings.JOBS_INGEST_ENQUEUE_TIMEOUT_SECONDS)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        except (ingest.IngestBufferFull, ingest.IngestBufferClosed) as exc:
+            # Backpressure: the worker should retry shortly.
+            response = Response({"detail": str(exc)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response["Retry-After"] = "1"
+            return response
+        return Response({"accepted": len(reports)}, status=status.HTTP_202_ACCEPTED)
+
     def retrieve(self, request: Request, pk: str = None) -> Response:
+        try:
+            statuses_limit = self._embedded_statuses(request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
         job, error_response = self._get_job_or_error_response(pk)
         if error_response:
             return error_response
-        
+
+        if statuses_limit:
+            statuses = get_latest_statuses_by_job(job_ids=[job.pk], limit=statuses_limit)
+            return self._detail_with_statuses(request, job, statuses.get(job.pk, []))
+
+        etag = self._make_etag(job.pk, job.updated_at.isoformat())
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
         serializer = JobDetailSerializer(job)
-        return Response(serializer.data)
+        return self._with_validators(Response(serializer.data), etag)
 
     def partial_update(self, request: Request, pk: str = None) -> Response:
-        job, error_response = self._get_job_or_error_response(pk)
-        if error_response:
-            return error_response
-        
+        try:
+            job_id = self._parse_job_id(pk)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+
         serializer = JobUpdateStatusSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
-        
-        update_job_status(job=job, new_status=serializer.validated_data["status_type"])
-        
-        # Refresh and return updated job
-        job.refresh_from_db()
+
+        # One statement: a missing job is reported by the update itself.
+        timestamp = serializer.validated_data.get("timestamp")
+        try:
+            job, _ = update_job_status_by_id(
+                job_id=job_id,
+                new_status=serializer.validated_data["status_type"],
+                timestamp=timestamp,
+                if_newer=timestamp is not None,
+            )
+        except Job.DoesNotExist:
+            return Response({"detail": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
+        except StatusUpdateConflict as exc:
+            # The job is too hot right now; the client should retry shortly.
+            response = Response({"detail": str(exc)}, status=status.HTTP_503_SERVICE_UNAVAILABLE)
+            response["Retry-After"] = "1"
+            return response
+
         response_serializer = JobDetailSerializer(job)
         return Response(response_serializer.data)
 
@@ -116,8 +470,12 @@ class JobViewSet(viewsets.ViewSet):
         job, error_response = self._get_job_or_error_response(pk)
         if error_response:
             return error_response
-        
-        delete_job(job=job)
+
+        try:
+            delete_job(job=job)
+        except Job.DoesNotExist:
+            # Deleted by a concurrent request since it was read.
+            return Response({"detail": "Job not found."}, status=status.HTTP_404_NOT_FOUND)
         return Response(status=status.HTTP_204_NO_CONTENT)
 
     @action(detail=True, methods=["get"], url_path="statuses")
@@ -126,13 +484,23 @@ class JobViewSet(viewsets.ViewSet):
         if error_response:
             return error_response
         
+        # Every appended status bumps status_version, so it validates every page.
+        etag = self._make_etag(job.id, job.status_version, self._query_signature(request))
+        not_modified = self._not_modified(request, etag)
+        if not_modified is not None:
+            return not_modified
+
         queryset = get_job_status_history(job_id=job.id)
-        paginator = self.pagination_class()
-        page = paginator.paginate_queryset(queryset, request)
+        paginator = self._get_paginator(request)
+        try:
+            page = paginator.paginate_queryset(queryset, request)
+        except ValueError as exc:
+            return Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
 
         if page is not None:
             serializer = JobStatusSerializer(page, many=True)
-            return paginator.get_paginated_response(serializer.data)
-
-        serializer = JobStatusSerializer(queryset, many=True)
-        return Response(serializer.data)
+            response = paginator.get_paginated_response(serializer.data)
+        else:
+            serializer = JobStatusSerializer(queryset, many=True)
+            response = Response(serializer.data)
+        return self._with_validators(response, etag)
@@ -13,6 +13,11 @@ export default defineConfig({
       clientPort: 5173,
     },
     proxy: {
+      // Listed first: the event stream is served by the ASGI process.
+      "/api/jobs/events": {
+        target: "http://events:8001",
+        changeOrigin: true,
+      },
       "/api": {
         target: "http://backend:8000",
         changeOrigin: true,